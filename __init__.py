@@ -8,12 +8,15 @@ importarse desde fuera si quieres reutilizar lógica sin abrir la UI.
 """
 
 from .config import (
-    WIDTH, HEIGHT, FPS,
+    WIDTH, HEIGHT, FPS, RESIZABLE, IDLE_WAIT_MS, MAX_FRAME_MS, PROFILE_FRAMES, PROFILE_CSV,
     TABLE_COLOR, CARD_W, CARD_H, FOOTER_H, PLAYER_Y, BOT_MAX_Y,
     STARTING_STACK, SMALL_BLIND, BIG_BLIND, MAX_BOTS,
     ARCADE_REBUY, AUTO_REBUY_BOTS,
-    BOT_THINK_MS, BOT_POST_ACT_PAUSE, BANNER_MS,
-    EASY, MED, HARD,
+    BOT_THINK_MS, BOT_POST_ACT_PAUSE, BANNER_MS, LOG_MAX_ENTRIES, KEYFRAME_EVERY,
+    HAND_RECORD_PATH,
+    EASY, MED, HARD, MCTS, MCTS_TIME_MS, MCTS_MAX_NODES,
+    SERVER_HOST, SERVER_PORT, SERVER_SEATS, ACTION_TIMEOUT_S,
+    BLIND_LEVELS, HANDS_PER_LEVEL, TOURNAMENT_SEATS,
 )
 
 from .utils import clamp, setup_logging
@@ -24,12 +27,15 @@ from .ai import bot_decision
 from .game_logic import Game   # 👈 AHORA VIENE DE LA CARPETA Game/
 
 __all__ = [
-    "WIDTH", "HEIGHT", "FPS",
+    "WIDTH", "HEIGHT", "FPS", "RESIZABLE", "IDLE_WAIT_MS", "MAX_FRAME_MS", "PROFILE_FRAMES", "PROFILE_CSV",
     "TABLE_COLOR", "CARD_W", "CARD_H", "FOOTER_H", "PLAYER_Y", "BOT_MAX_Y",
     "STARTING_STACK", "SMALL_BLIND", "BIG_BLIND", "MAX_BOTS",
     "ARCADE_REBUY", "AUTO_REBUY_BOTS",
-    "BOT_THINK_MS", "BOT_POST_ACT_PAUSE", "BANNER_MS",
-    "EASY", "MED", "HARD",
+    "BOT_THINK_MS", "BOT_POST_ACT_PAUSE", "BANNER_MS", "LOG_MAX_ENTRIES", "KEYFRAME_EVERY",
+    "HAND_RECORD_PATH",
+    "EASY", "MED", "HARD", "MCTS", "MCTS_TIME_MS", "MCTS_MAX_NODES",
+    "SERVER_HOST", "SERVER_PORT", "SERVER_SEATS", "ACTION_TIMEOUT_S",
+    "BLIND_LEVELS", "HANDS_PER_LEVEL", "TOURNAMENT_SEATS",
     "clamp", "setup_logging",
     "Card", "Deck", "SUITS", "RANKS", "RANK_TO_INT",
     "evaluate7", "quick_strength",
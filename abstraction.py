@@ -0,0 +1,341 @@
+from __future__ import annotations
+import os
+import argparse
+import logging
+from multiprocessing import Pool
+from typing import List, Tuple, Dict
+
+import numpy as np
+
+from cards import Card, card_to_int, sample_live_cards
+from combos import (
+    BINOM, HOLE_CLASSES, apply_suit_perm, canonical_index, colex_combos,
+    colex_rank_batch, colex_unrank_batch, perms_to,
+)
+from eval_vec import evaluate_codes
+from utils import setup_logging
+
+"""
+abstraction.py
+--------------
+Abstracción de cartas por clustering de histogramas de equity.
+
+Para cada calle (flop / turn / river) se enumeran todos los spots
+canónicos (hole, board) bajo isomorfismo de palos, se calcula para
+cada uno un histograma de equity contra una mano aleatoria (Monte Carlo
+vectorizado sobre runouts y rivales) y se agrupan con k-means
+mini-batch en N buckets.
+
+Todo se guarda como .npy memory-mappable en el directorio de salida:
+
+    {calle}_keys.npy      claves canónicas ordenadas (int64)
+    {calle}_features.npy  histograma por spot (float16)
+    {calle}_done.npy      chunks ya calculados (para reanudar)
+    {calle}_kmeans.npz    checkpoint de centros
+    {calle}_buckets.npy   bucket por spot (uint16)
+
+Uso:
+    python abstraction.py --street flop --buckets 200 --out abstraction_data
+
+Si se interrumpe, volver a lanzar el mismo comando continúa donde quedó.
+"""
+
+STREETS: Dict[str, int] = {"flop": 3, "turn": 4, "river": 5}
+
+
+# --- índices combinatorios / isomorfismo (combos.py) ---
+def canonical_key(hole: List[Card], board: List[Card]) -> int:
+    """
+    Clave canónica (hole, board) tal como aparece en {calle}_keys.npy.
+    """
+    return canonical_index([card_to_int(c) for c in hole], [card_to_int(c) for c in board])
+
+
+def enumerate_canonical(k: int) -> np.ndarray:
+    """
+    Devuelve las claves canónicas ordenadas de todos los spots con k
+    cartas de board (3 = flop: 1.286.792 spots).
+    """
+    boards = colex_combos(52, k, dtype=np.int64)
+    idx = np.arange(len(boards), dtype=np.int64)
+    keys = []
+    for cls, hole in enumerate(HOLE_CLASSES):
+        live = ~np.isin(boards, hole).any(axis=1)
+        b, own = boards[live], idx[live]
+        best = own.copy()
+        for p in perms_to(hole, hole):
+            np.minimum(best, colex_rank_batch(apply_suit_perm(p, b)), out=best)
+        canon = np.sort(own[own == best])
+        keys.append(cls * BINOM[52, k] + canon)
+    return np.concatenate(keys)
+
+
+def decode_keys(keys: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Claves -> (holes (N, 2), boards (N, k)) como enteros de carta.
+    """
+    cls, bidx = np.divmod(np.asarray(keys, dtype=np.int64), BINOM[52, k])
+    holes = np.array(HOLE_CLASSES, dtype=np.int64)[cls]
+    return holes, colex_unrank_batch(bidx, k)
+
+
+# --- histogramas de equity ---
+def equity_histograms(
+    holes: np.ndarray,
+    boards: np.ndarray,
+    bins: int,
+    runouts: int,
+    opponents: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Histograma de equity (vs. una mano aleatoria) de cada spot.
+
+    Para cada spot se muestrean 'runouts' completados del board y, en cada
+    uno, 'opponents' manos rivales; la equity del runout es la media de
+    victorias (+0.5 empates). En el river no hay runout y el resultado es
+    una sola columna con la equity.
+
+    Returns:
+        Array (N, bins) float32 normalizado (o (N, 1) en el river).
+    """
+    m, k = boards.shape
+    need = 5 - k
+    r = runouts if need > 0 else 1
+
+    dead = np.zeros((m, 52), dtype=bool)
+    rows = np.arange(m)[:, None]
+    dead[rows, holes] = True
+    dead[rows, boards] = True
+
+    # resto del board: need cartas vivas por runout
+    dead_r = np.repeat(dead, r, axis=0)
+    full = np.broadcast_to(boards[:, None, :], (m, r, k))
+    if need > 0:
+        extra = sample_live_cards(dead_r, need, rng).astype(np.int64)
+        dead_r[np.arange(m * r)[:, None], extra] = True
+        full = np.concatenate([full, extra.reshape(m, r, need)], axis=2)
+
+    # cada rival, 2 cartas de la baraja viva independientes de los demás
+    # (manos aleatorias, no una mesa de 'opponents' jugadores)
+    opp = np.stack(
+        [sample_live_cards(dead_r, 2, rng) for _ in range(opponents)], axis=1
+    ).astype(np.int64).reshape(m, r, opponents, 2)
+
+    hero7 = np.concatenate([np.broadcast_to(holes[:, None, :], (m, r, 2)), full], axis=2)
+    hero = evaluate_codes(hero7.reshape(-1, 7)).reshape(m, r, 1)
+    opp7 = np.concatenate(
+        [opp, np.broadcast_to(full[:, :, None, :], (m, r, opponents, 5))], axis=3
+    )
+    vill = evaluate_codes(opp7.reshape(-1, 7)).reshape(m, r, opponents)
+    eq = ((hero > vill) + 0.5 * (hero == vill)).mean(axis=2)
+
+    if need == 0:
+        return eq.astype(np.float32)
+    b = np.minimum((eq * bins).astype(np.int64), bins - 1)
+    counts = np.bincount((np.arange(m)[:, None] * bins + b).ravel(), minlength=m * bins)
+    return (counts.reshape(m, bins) / r).astype(np.float32)
+
+
+def _embed(x: np.ndarray) -> np.ndarray:
+    # distancia L2 sobre la CDF ~ EMD entre histogramas ordenados
+    x = np.asarray(x, dtype=np.float32)
+    return np.cumsum(x, axis=1) if x.shape[1] > 1 else x
+
+
+def _paths(out: str, street: str) -> Dict[str, str]:
+    return {
+        name: os.path.join(out, f"{street}_{name}.{ext}")
+        for name, ext in (
+            ("keys", "npy"), ("features", "npy"), ("done", "npy"),
+            ("kmeans", "npz"), ("buckets", "npy"),
+        )
+    }
+
+
+def _feature_chunk(args: Tuple[str, str, int, int, int, int, int, int]) -> int:
+    out, street, chunk, size, bins, runouts, opponents, seed = args
+    p = _paths(out, street)
+    keys = np.load(p["keys"], mmap_mode="r")
+    feats = np.load(p["features"], mmap_mode="r+")
+    lo, hi = chunk * size, min(len(keys), (chunk + 1) * size)
+    holes, boards = decode_keys(keys[lo:hi], STREETS[street])
+    rng = np.random.default_rng([seed, STREETS[street], chunk])
+    feats[lo:hi] = equity_histograms(holes, boards, bins, runouts, opponents, rng)
+    feats.flush()
+    return chunk
+
+
+def _assign_chunk(args: Tuple[str, str, int, int]) -> int:
+    out, street, chunk, size = args
+    p = _paths(out, street)
+    feats = np.load(p["features"], mmap_mode="r")
+    buckets = np.load(p["buckets"], mmap_mode="r+")
+    centers = np.load(p["kmeans"])["centers"]
+    lo, hi = chunk * size, min(len(feats), (chunk + 1) * size)
+    buckets[lo:hi] = _nearest(_embed(feats[lo:hi]), centers)
+    buckets.flush()
+    return chunk
+
+
+def _nearest(x: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    d = (
+        (x * x).sum(axis=1)[:, None]
+        - 2.0 * x @ centers.T
+        + (centers * centers).sum(axis=1)[None, :]
+    )
+    return d.argmin(axis=1)
+
+
+# --- k-means mini-batch ---
+def minibatch_kmeans(
+    feats: np.ndarray,
+    k: int,
+    batch: int,
+    iters: int,
+    rng: np.random.Generator,
+    checkpoint: str,
+) -> np.ndarray:
+    """
+    K-means mini-batch (Sculley 2010) sobre filas de 'feats' (memmap).
+    Guarda checkpoint cada 50 iteraciones y reanuda desde él si existe.
+
+    Returns:
+        Centros (k, d) en el espacio de _embed().
+    """
+    n = len(feats)
+    start = 0
+    if os.path.exists(checkpoint):
+        ck = np.load(checkpoint)
+        centers, counts, start = ck["centers"], ck["counts"], int(ck["iteration"])
+    else:
+        # k-means++ sobre una muestra
+        sample = _embed(feats[np.sort(rng.choice(n, min(n, 20 * k), replace=False))])
+        centers = np.empty((k, sample.shape[1]), dtype=np.float32)
+        centers[0] = sample[rng.integers(len(sample))]
+        d2 = ((sample - centers[0]) ** 2).sum(axis=1)
+        for j in range(1, k):
+            total = d2.sum()
+            pick = rng.choice(len(sample), p=d2 / total) if total > 0 else rng.integers(len(sample))
+            centers[j] = sample[pick]
+            np.minimum(d2, ((sample - centers[j]) ** 2).sum(axis=1), out=d2)
+        counts = np.zeros(k, dtype=np.int64)
+
+    for it in range(start, iters):
+        x = _embed(feats[np.sort(rng.choice(n, min(n, batch), replace=False))])
+        lab = _nearest(x, centers)
+        nb = np.bincount(lab, minlength=k)
+        counts += nb
+        sums = np.zeros_like(centers)
+        np.add.at(sums, lab, x)
+        hit = nb > 0
+        eta = (nb[hit] / counts[hit])[:, None]
+        centers[hit] += eta * (sums[hit] / nb[hit][:, None] - centers[hit])
+
+        if (it + 1) % 50 == 0 or it + 1 == iters:
+            np.savez(checkpoint, centers=centers, counts=counts, iteration=it + 1)
+    return centers
+
+
+# --- lookup ---
+class BucketMap:
+    """
+    Lectura de los buckets ya calculados (memory-mapped).
+    """
+
+    def __init__(self, out: str, street: str) -> None:
+        p = _paths(out, street)
+        self.keys = np.load(p["keys"], mmap_mode="r")
+        self.buckets = np.load(p["buckets"], mmap_mode="r")
+
+    def bucket(self, hole: List[Card], board: List[Card]) -> int:
+        key = canonical_key(hole, board)
+        i = int(np.searchsorted(self.keys, key))
+        if i >= len(self.keys) or self.keys[i] != key:
+            raise KeyError(f"spot no canónico/desconocido: {hole} {board}")
+        return int(self.buckets[i])
+
+
+# --- CLI ---
+def build(
+    street: str,
+    out: str,
+    buckets: int,
+    bins: int,
+    runouts: int,
+    opponents: int,
+    chunk: int,
+    workers: int,
+    batch: int,
+    iters: int,
+    seed: int,
+) -> None:
+    os.makedirs(out, exist_ok=True)
+    p = _paths(out, street)
+    k = STREETS[street]
+
+    if not os.path.exists(p["keys"]):
+        logging.info(f"[{street}] enumerando spots canónicos...")
+        keys = enumerate_canonical(k)
+        np.save(p["keys"] + ".tmp.npy", keys)
+        os.replace(p["keys"] + ".tmp.npy", p["keys"])
+    keys = np.load(p["keys"], mmap_mode="r")
+    n = len(keys)
+    nchunks = (n + chunk - 1) // chunk
+    width = 1 if k == 5 else bins
+    logging.info(f"[{street}] {n} spots, {nchunks} chunks")
+
+    if not os.path.exists(p["features"]):
+        np.lib.format.open_memmap(p["features"], mode="w+", dtype=np.float16, shape=(n, width))
+        np.save(p["done"], np.zeros(nchunks, dtype=bool))
+    done = np.load(p["done"], mmap_mode="r+")
+
+    todo = [
+        (out, street, c, chunk, bins, runouts, opponents, seed)
+        for c in range(nchunks) if not done[c]
+    ]
+    with Pool(workers) as pool:
+        for i, c in enumerate(pool.imap_unordered(_feature_chunk, todo), 1):
+            done[c] = True
+            done.flush()
+            if i % 50 == 0 or i == len(todo):
+                logging.info(f"[{street}] histogramas {nchunks - len(todo) + i}/{nchunks}")
+
+        feats = np.load(p["features"], mmap_mode="r")
+        minibatch_kmeans(
+            feats, buckets, batch, iters, np.random.default_rng(seed), p["kmeans"]
+        )
+        logging.info(f"[{street}] k-means listo, asignando buckets...")
+
+        np.lib.format.open_memmap(p["buckets"], mode="w+", dtype=np.uint16, shape=(n,))
+        for _ in pool.imap_unordered(
+            _assign_chunk, [(out, street, c, chunk) for c in range(nchunks)]
+        ):
+            pass
+    logging.info(f"[{street}] buckets guardados en {p['buckets']}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Abstracción de cartas por histogramas de equity.")
+    ap.add_argument("--street", choices=list(STREETS), default="flop")
+    ap.add_argument("--out", default="abstraction_data")
+    ap.add_argument("--buckets", type=int, default=200)
+    ap.add_argument("--bins", type=int, default=10, help="columnas del histograma")
+    ap.add_argument("--runouts", type=int, default=32, help="runouts muestreados por spot")
+    ap.add_argument("--opponents", type=int, default=32, help="manos rivales por runout")
+    ap.add_argument("--chunk", type=int, default=2000, help="spots por tarea")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--batch", type=int, default=10_000, help="tamaño del mini-batch")
+    ap.add_argument("--iters", type=int, default=500, help="iteraciones de k-means")
+    ap.add_argument("--seed", type=int, default=0)
+    a = ap.parse_args()
+
+    setup_logging("abstraction.log")
+    build(
+        a.street, a.out, a.buckets, a.bins, a.runouts, a.opponents,
+        a.chunk, a.workers, a.batch, a.iters, a.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
 from __future__ import annotations
 import random
-from typing import Tuple, List
+from typing import Tuple, List, Dict, NamedTuple
+
+import numpy as np
 
 from player import Player        # ⬅ sin punto
 from cards import Card           # ⬅ sin punto
-from config import EASY, MED
+from config import EASY, MED, HARD
 from eval_hand import quick_strength
 
 """
@@ -14,6 +16,32 @@ Lógica de decisión de los bots (fold/call/raise/allin).
 """
 
 
+class BotParams(NamedTuple):
+    """
+    Parámetros de agresividad de bot_decision().
+    """
+    fold_t_base: float
+    raise_t_base: float
+    bluff_chance: float
+    raise_factor: float
+    call_bias: float
+
+
+# fold_t_base / raise_t_base son percentiles de quick_strength (PERCENTILES)
+BOT_PARAMS: Dict[str, BotParams] = {
+    EASY: BotParams(0.97, 0.99, 0.02, 0.8, 0.55),
+    MED: BotParams(0.92, 0.98, 0.07, 1.2, 0.45),
+    HARD: BotParams(0.88, 0.96, 0.14, 1.7, 0.30),
+}
+
+# Versión vectorizada: dificultad como código entero y acción como código
+DIFFICULTY_CODES: List[str] = [EASY, MED, HARD]
+ACTIONS: List[str] = ['fold', 'call', 'raise_to', 'allin']
+ACT_FOLD, ACT_CALL, ACT_RAISE_TO, ACT_ALLIN = range(4)
+
+_PARAM_TABLE = np.array([BOT_PARAMS[d] for d in DIFFICULTY_CODES], dtype=np.float64)
+
+
 def bot_decision(
     player: Player,
     to_call: int,
@@ -29,30 +57,13 @@ def bot_decision(
 
     strength = quick_strength(player.hole, board)
 
-    # Tabla de agresividad por dificultad
-    if player.difficulty == EASY:
-        fold_t_base = 0.30
-        raise_t_base = 0.60
-        bluff_chance = 0.02
-        raise_factor = 0.8
-        call_bias = 0.55
-    elif player.difficulty == MED:
-        fold_t_base = 0.22
-        raise_t_base = 0.50
-        bluff_chance = 0.07
-        raise_factor = 1.2
-        call_bias = 0.45
-    else:
-        # HARD
-        fold_t_base = 0.14
-        raise_t_base = 0.38
-        bluff_chance = 0.14
-        raise_factor = 1.7
-        call_bias = 0.30
+    # Tabla de agresividad por dificultad (o la del asiento, si la trae)
+    params = player.params or BOT_PARAMS.get(player.difficulty, BOT_PARAMS[HARD])
+    fold_t_base, raise_t_base, bluff_chance, raise_factor, call_bias = params
 
     pot_pressure = min(1.0, pot / 400.0)
     fold_t = max(0.05, fold_t_base - 0.10 * pot_pressure)
-    raise_t = min(0.95, raise_t_base - 0.05 * pot_pressure)
+    raise_t = min(0.99, raise_t_base - 0.05 * pot_pressure)
 
     # posible farol agresivo
     if random.random() < bluff_chance and to_call <= pot * 0.4:
@@ -83,3 +94,66 @@ def bot_decision(
         return ('raise_to', target_total)
 
     return ('call', to_call)
+
+
+def bot_decision_batch(
+    strength: np.ndarray,
+    to_call: np.ndarray,
+    min_raise: np.ndarray,
+    pot: np.ndarray,
+    stack: np.ndarray,
+    difficulty: np.ndarray,
+    round_index: np.ndarray,
+    rng: np.random.Generator,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    bot_decision() para N asientos de una vez, con las mismas
+    probabilidades. Todos los argumentos son arrays (N,) o escalares;
+    'difficulty' son índices de DIFFICULTY_CODES y la fuerza ya viene
+    calculada (quick_strength).
+
+    Returns:
+        (acciones, cantidades): códigos de ACTIONS (ACT_*) y la cantidad
+        de cada uno, como en la versión escalar.
+    """
+    strength = np.asarray(strength, dtype=np.float64)
+    n = strength.shape[0]
+    to_call = np.broadcast_to(np.asarray(to_call, dtype=np.int64), (n,))
+    min_raise = np.broadcast_to(np.asarray(min_raise, dtype=np.int64), (n,))
+    pot = np.broadcast_to(np.asarray(pot, dtype=np.int64), (n,))
+    stack = np.broadcast_to(np.asarray(stack, dtype=np.int64), (n,))
+    round_index = np.broadcast_to(np.asarray(round_index), (n,))
+
+    fold_t_base, raise_t_base, bluff_chance, raise_factor, call_bias = (
+        _PARAM_TABLE[np.asarray(difficulty)].T
+    )
+    u_bluff, u_check_raise, u_allin = rng.random((3, n))
+
+    pot_pressure = np.minimum(1.0, pot / 400.0)
+    fold_t = np.maximum(0.05, fold_t_base - 0.10 * pot_pressure)
+    raise_t = np.minimum(0.99, raise_t_base - 0.05 * pot_pressure)
+
+    bluff = (u_bluff < bluff_chance) & (to_call <= pot * 0.4)
+    fold = (strength < fold_t) & (to_call > 0)
+    want_raise = (strength > raise_t) | ((to_call == 0) & (u_check_raise > call_bias))
+    short_stack = stack < np.maximum(80, pot * 0.6)
+    push = (short_stack | (round_index >= 2)) & (u_allin < 0.15 * raise_factor)
+
+    bluff_total = to_call + np.maximum(
+        min_raise, (pot * 0.4 + strength * 80 * raise_factor).astype(np.int64)
+    )
+    raise_total = to_call + np.maximum(
+        min_raise, (pot * 0.3 + strength * 100 * raise_factor).astype(np.int64)
+    )
+
+    acts = np.select(
+        [bluff, fold, want_raise & push, want_raise],
+        [ACT_RAISE_TO, ACT_FOLD, ACT_ALLIN, ACT_RAISE_TO],
+        default=ACT_CALL,
+    )
+    amounts = np.select(
+        [bluff, fold, want_raise & push, want_raise],
+        [bluff_total, 0, stack, raise_total],
+        default=to_call,
+    )
+    return acts, amounts
@@ -1,6 +1,8 @@
 from __future__ import annotations
 import random
-from typing import List, Dict, Tuple
+from typing import Iterable, List, Dict, Optional, Tuple
+
+import numpy as np
 
 """
 cards.py
@@ -24,6 +26,10 @@ RANKS: List[str] = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K',
 # Nota: está hecho como en tu código original para evaluación de manos
 RANK_TO_INT: Dict[str, int] = {r: i for i, r in enumerate('..23456789TJQKA')}
 
+# Índice entero de carta (0..51) en el mismo orden en que Deck() las crea:
+# palo * 13 + rango, con rango 0 = '2' ... 12 = 'A'.
+NUM_CARDS: int = 52
+
 
 class Card:
     """
@@ -43,14 +49,47 @@ class Card:
         return f"{self.rank}{self.suit}"
 
 
+# las 52 cartas, una instancia de cada una, en orden de card_to_int
+CARDS: List[Card] = [Card(r, s) for s in SUITS for r in RANKS]
+
+
 class Deck:
     """
     Baraja de 52 cartas. Se baraja automáticamente al crearla.
+
+    Reutilizable: 'cards' es una permutación de las 52 cartas de CARDS
+    (siempre los mismos objetos) y deal() avanza un cursor sobre ella, sin
+    copiar el resto de la baraja. shuffle() / load() la preparan para la
+    mano siguiente sin crear cartas nuevas.
     """
 
-    def __init__(self) -> None:
-        self.cards: List[Card] = [Card(r, s) for s in SUITS for r in RANKS]
+    __slots__ = ("cards", "pos")
+
+    def __init__(self, shuffled: bool = True) -> None:
+        self.cards: List[Card] = list(CARDS)
+        self.pos: int = 0
+        if shuffled:
+            random.shuffle(self.cards)
+
+    def shuffle(self) -> None:
+        """
+        Vuelve a barajar desde el orden de CARDS (misma secuencia que una
+        Deck() nueva con el mismo estado de random).
+        """
+        self.cards[:] = CARDS
         random.shuffle(self.cards)
+        self.pos = 0
+
+    def load(self, order) -> None:
+        """
+        Usa una permutación de índices 0..51 ya barajada (p.ej. una fila
+        de shuffled_decks).
+        """
+        self.cards[:] = [CARDS[i] for i in order]
+        self.pos = 0
+
+    def remaining(self) -> int:
+        return NUM_CARDS - self.pos
 
     def deal(self, n: int = 1) -> List[Card]:
         """
@@ -62,6 +101,156 @@ class Deck:
         Returns:
             Lista de n Card.
         """
-        out = self.cards[:n]
-        self.cards = self.cards[n:]
+        out = self.cards[self.pos:self.pos + n]
+        self.pos += len(out)
         return out
+
+
+def shuffled_decks(k: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    K barajas mezcladas de una vez: array (K, 52) uint8 de índices de
+    carta (card_to_int), una permutación independiente por fila.
+    """
+    base = np.broadcast_to(np.arange(NUM_CARDS, dtype=np.uint8), (k, NUM_CARDS))
+    return rng.permuted(base, axis=1)
+
+
+class DeckPool:
+    """
+    Barajas pre-mezcladas para simuladores: genera bloques de 'block'
+    permutaciones con shuffled_decks y entrega una por mano. Con la misma
+    semilla da la misma secuencia de manos, sin tocar el random global.
+    """
+
+    def __init__(self, seed: Optional[int] = None, block: int = 1024) -> None:
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.block: int = block
+        self._rows: List[List[int]] = []
+        self._next: int = 0
+
+    def next_order(self) -> List[int]:
+        if self._next >= len(self._rows):
+            self._rows = shuffled_decks(self.block, self.rng).tolist()
+            self._next = 0
+        row = self._rows[self._next]
+        self._next += 1
+        return row
+
+    def deal_into(self, deck: Deck) -> None:
+        deck.load(self.next_order())
+
+
+class DeadCardSampler:
+    """
+    Muestreo sin reemplazo de las cartas vivas (las 52 menos las muertas:
+    hole cards propias, board...), p.ej. para completar el board y repartir
+    k manos rivales en cada runout.
+
+    Las cartas vivas (índices de card_to_int) están en una lista fija; cada
+    muestra hace un Fisher–Yates parcial que sólo toca las k posiciones que
+    necesita y deshace los intercambios al terminar, así que cuesta O(k) y
+    no reserva memoria (sample_into escribe en una lista del llamador).
+    """
+
+    __slots__ = ("live", "n", "_swaps")
+
+    def __init__(self, dead: Iterable[int] = ()) -> None:
+        self.live: List[int] = list(range(NUM_CARDS))
+        self._swaps: List[int] = [0] * NUM_CARDS
+        self.n: int = NUM_CARDS
+        self.set_dead(dead)
+
+    def set_dead(self, dead: Iterable[int]) -> None:
+        """
+        Cambia las cartas muertas; reordena 'live' en sitio.
+        """
+        is_dead = [False] * NUM_CARDS
+        for c in dead:
+            is_dead[c] = True
+        n = 0
+        for c in range(NUM_CARDS):
+            if not is_dead[c]:
+                self.live[n] = c
+                n += 1
+        self.n = n
+
+    def sample_into(self, out: List[int], k: int) -> None:
+        """
+        Escribe en out[0:k] k cartas vivas distintas al azar.
+        """
+        live, swaps, n = self.live, self._swaps, self.n
+        if k > n:
+            raise ValueError(f"sólo quedan {n} cartas vivas, se piden {k}")
+        rnd = random.random
+        for i in range(k):
+            j = i + int(rnd() * (n - i))
+            swaps[i] = j
+            c = live[j]
+            live[j] = live[i]
+            live[i] = c
+            out[i] = c
+        # deshacer en orden inverso: 'live' vuelve a quedar como estaba
+        for i in range(k - 1, -1, -1):
+            j = swaps[i]
+            live[i], live[j] = live[j], live[i]
+
+    def sample(self, k: int) -> List[int]:
+        out = [0] * k
+        self.sample_into(out, k)
+        return out
+
+
+def sample_live_cards(
+    dead: np.ndarray, k: int, rng: np.random.Generator, samples: Optional[int] = None
+) -> np.ndarray:
+    """
+    Versión vectorizada de DeadCardSampler: k cartas vivas distintas por
+    fila, con un Fisher–Yates parcial de k pasos sobre todas las filas a la
+    vez.
+
+    Args:
+        dead: máscara bool (M, 52) de cartas muertas por fila, o (52,) común
+            a todas (entonces 'samples' dice cuántas filas).
+        k: cartas por muestra.
+        rng: Generator de NumPy.
+        samples: número de filas M cuando 'dead' es (52,); obligatorio en
+            ese caso (ValueError si falta) e ignorado con una máscara (M, 52).
+
+    Returns:
+        Array (M, k) uint8 de índices de carta.
+    """
+    dead = np.asarray(dead, dtype=bool)
+    if dead.ndim == 1:
+        if samples is None:
+            raise ValueError("con una máscara 'dead' de 52 cartas hay que indicar 'samples'")
+        alive = np.flatnonzero(~dead).astype(np.uint8)
+        live = np.tile(alive, (samples, 1))
+        n = np.full(samples, len(alive))
+    else:
+        # vivas primero en cada fila (orden estable), muertas al final
+        live = np.argsort(dead, axis=1, kind="stable").astype(np.uint8)
+        n = NUM_CARDS - dead.sum(axis=1)
+    m = live.shape[0]
+    if k > n.min(initial=NUM_CARDS):
+        raise ValueError(f"sólo quedan {n.min()} cartas vivas, se piden {k}")
+    rows = np.arange(m)
+    for i in range(k):
+        j = i + (rng.random(m) * (n - i)).astype(np.int64)
+        a = live[rows, j]
+        live[rows, j] = live[:, i]
+        live[:, i] = a
+    return live[:, :k]
+
+
+def card_to_int(card: Card) -> int:
+    """
+    Convierte una Card a su índice entero 0..51 (palo * 13 + rango).
+    """
+    return SUITS.index(card.suit) * 13 + RANKS.index(card.rank)
+
+
+def int_to_card(idx: int) -> Card:
+    """
+    Inversa de card_to_int().
+    """
+    return Card(RANKS[idx % 13], SUITS[idx // 13])
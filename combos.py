@@ -0,0 +1,274 @@
+from __future__ import annotations
+import itertools
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+"""
+combos.py
+---------
+Índices combinatorios densos para tablas de consulta (tablas preflop,
+mapas de buckets, cachés de equity): en vez de claves dict de tuplas
+de Card, un entero en 0..N-1 que indexa un array plano.
+
+Las cartas son enteros 0..51 (cards.card_to_int). Un conjunto de k
+cartas c1 < c2 < ... < ck se numera en orden colex:
+
+    colex_rank = C(c1, 1) + C(c2, 2) + ... + C(ck, k)
+
+de modo que los conjuntos que sólo usan cartas < c son exactamente los
+C(c, k) primeros. Tamaños:
+
+    hole (2 cartas)   1.326          flop (3)   22.100
+    turn (4)        270.725          river (5)  2.598.960
+
+Un par (hole, board) se numera como hole * C(50, k) + rango del board
+entre las 50 cartas que quedan, sin huecos.
+
+Isomorfismo de palos: las 169 clases de mano inicial (HOLE_CLASSES,
+hole_class_of) y la clave canónica (clase, board mínimo bajo las
+permutaciones de palos que fijan la mano) que usa abstraction.py.
+
+Cada función tiene su versión vectorizada *_batch sobre arrays (N, k).
+"""
+
+MAX_K: int = 7
+
+# C(n, k) para n <= 52, k <= 7
+BINOM = np.zeros((53, MAX_K + 1), dtype=np.int64)
+for _n in range(53):
+    BINOM[_n, 0] = 1
+    for _k in range(1, min(_n, MAX_K) + 1):
+        BINOM[_n, _k] = BINOM[_n - 1, _k - 1] + (BINOM[_n - 1, _k] if _k <= _n - 1 else 0)
+_BINOM_PY: List[List[int]] = BINOM.tolist()
+
+N_HOLE: int = 1326
+N_FLOP: int = 22_100
+N_TURN: int = 270_725
+N_RIVER: int = 2_598_960
+N_HOLE_CLASSES: int = 169
+
+# permutaciones de los 4 palos
+SUIT_PERMS = np.array(list(itertools.permutations(range(4))), dtype=np.int64)
+
+
+def binom(n: int, k: int) -> int:
+    if k < 0 or k > n:
+        return 0
+    return _BINOM_PY[n][k]
+
+
+# --- colex ---
+def colex_rank(cards: Sequence[int]) -> int:
+    """
+    Índice colex de un conjunto de cartas (en cualquier orden).
+    """
+    r = 0
+    for i, c in enumerate(sorted(cards), 1):
+        r += _BINOM_PY[c][i]
+    return r
+
+
+def colex_unrank(idx: int, k: int) -> Tuple[int, ...]:
+    """
+    Inversa de colex_rank: las k cartas, ascendentes.
+    """
+    out = [0] * k
+    c = 52
+    for i in range(k, 0, -1):
+        c -= 1
+        while _BINOM_PY[c][i] > idx:
+            c -= 1
+        out[i - 1] = c
+        idx -= _BINOM_PY[c][i]
+    return tuple(out)
+
+
+def colex_rank_batch(combos: np.ndarray, presorted: bool = False) -> np.ndarray:
+    """
+    colex_rank por filas de un array (N, k) de cartas.
+    """
+    combos = np.asarray(combos, dtype=np.int64)
+    if not presorted:
+        combos = np.sort(combos, axis=1)
+    k = combos.shape[1]
+    return BINOM[combos, np.arange(1, k + 1)].sum(axis=1)
+
+
+def colex_unrank_batch(idx: np.ndarray, k: int) -> np.ndarray:
+    """
+    colex_unrank de un array de índices: (N, k) int64 ascendente por fila.
+    """
+    idx = np.asarray(idx, dtype=np.int64).copy()
+    out = np.zeros((idx.shape[0], k), dtype=np.int64)
+    for i in range(k, 0, -1):
+        c = np.searchsorted(BINOM[:, i], idx, side="right") - 1
+        out[:, i - 1] = c
+        idx -= BINOM[c, i]
+    return out
+
+
+def colex_combos(n: int, k: int, dtype=np.uint8) -> np.ndarray:
+    """
+    Todas las k-combinaciones de range(n) en orden colex (fila i = unrank(i)).
+    """
+    return colex_unrank_batch(np.arange(binom(n, k)), k).astype(dtype)
+
+
+# --- hole / board / (hole, board) ---
+def hole_index(a: int, b: int) -> int:
+    """
+    Índice 0..1325 de dos cartas.
+    """
+    if a > b:
+        a, b = b, a
+    return a + _BINOM_PY[b][2]
+
+
+def hole_from_index(idx: int) -> Tuple[int, int]:
+    return colex_unrank(idx, 2)
+
+
+def board_index(board: Sequence[int]) -> int:
+    """
+    Índice de un board de 3, 4 o 5 cartas entre los C(52, k) de su tamaño.
+    """
+    return colex_rank(board)
+
+
+def board_from_index(idx: int, k: int) -> Tuple[int, ...]:
+    return colex_unrank(idx, k)
+
+
+def pair_index(hole: Sequence[int], board: Sequence[int]) -> int:
+    """
+    Índice denso de (hole, board) en 0 .. 1326 * C(50, k) - 1: el board se
+    numera entre las 50 cartas que no son del hole.
+    """
+    a, b = sorted(hole)
+    r = 0
+    for i, c in enumerate(sorted(board), 1):
+        r += _BINOM_PY[c - (c > a) - (c > b)][i]
+    return hole_index(a, b) * _BINOM_PY[50][len(board)] + r
+
+
+def pair_from_index(idx: int, k: int) -> Tuple[Tuple[int, int], Tuple[int, ...]]:
+    h, r = divmod(idx, _BINOM_PY[50][k])
+    a, b = hole_from_index(h)
+    board = []
+    for c in colex_unrank(r, k):
+        # de 0..49 a 0..51 saltando las dos cartas del hole
+        if c >= a:
+            c += 1
+        if c >= b:
+            c += 1
+        board.append(c)
+    return (a, b), tuple(board)
+
+
+def hole_index_batch(holes: np.ndarray) -> np.ndarray:
+    return colex_rank_batch(holes)
+
+
+def pair_index_batch(holes: np.ndarray, boards: np.ndarray) -> np.ndarray:
+    holes = np.sort(np.asarray(holes, dtype=np.int64), axis=1)
+    boards = np.asarray(boards, dtype=np.int64)
+    shifted = boards - (boards > holes[:, :1]) - (boards > holes[:, 1:])
+    k = boards.shape[1]
+    return colex_rank_batch(holes, presorted=True) * BINOM[50, k] + colex_rank_batch(shifted)
+
+
+def pair_from_index_batch(idx: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    h, r = np.divmod(np.asarray(idx, dtype=np.int64), BINOM[50, k])
+    holes = colex_unrank_batch(h, 2)
+    boards = colex_unrank_batch(r, k)
+    boards += boards >= holes[:, :1]
+    boards += boards >= holes[:, 1:]
+    return holes, boards
+
+
+# --- isomorfismo de palos ---
+def apply_suit_perm(perm: np.ndarray, cards: np.ndarray) -> np.ndarray:
+    return perm[cards // 13] * 13 + cards % 13
+
+
+def _hole_classes() -> List[Tuple[int, int]]:
+    """
+    Las 169 manos iniciales canónicas como pares de índices de carta:
+    pareja en palos 0/1, suited en palo 0, offsuit alta en 0 y baja en 1.
+    """
+    out = []
+    for hi in range(13):
+        for lo in range(hi + 1):
+            if hi == lo:
+                out.append((hi, 13 + hi))
+            else:
+                out.append((lo, hi))
+                out.append((13 + lo, hi))
+    return out
+
+
+HOLE_CLASSES: List[Tuple[int, int]] = _hole_classes()
+
+
+def hole_class_of(hole: Tuple[int, int]) -> int:
+    """
+    Índice 0..168 de la clase canónica de un par de cartas (enteros).
+    """
+    a, b = hole
+    ra, rb = a % 13, b % 13
+    hi, lo = max(ra, rb), min(ra, rb)
+    base = hi * hi  # clases de todos los 'hi' menores: sum(2*h + 1)
+    if hi == lo:
+        return base + 2 * hi
+    return base + 2 * lo + (0 if a // 13 == b // 13 else 1)
+
+
+def hole_class_batch(holes: np.ndarray) -> np.ndarray:
+    holes = np.asarray(holes, dtype=np.int64)
+    r = holes % 13
+    hi, lo = r.max(axis=1), r.min(axis=1)
+    offsuit = (holes[:, 0] // 13 != holes[:, 1] // 13).astype(np.int64)
+    return hi * hi + np.where(hi == lo, 2 * hi, 2 * lo + offsuit)
+
+
+def perms_to(hole: Tuple[int, int], target: Tuple[int, int]) -> np.ndarray:
+    """
+    Permutaciones de palos que llevan el conjunto 'hole' a 'target'.
+    """
+    h = np.array(hole, dtype=np.int64)
+    want = sorted(target)
+    keep = [p for p in SUIT_PERMS if sorted(apply_suit_perm(p, h).tolist()) == want]
+    return np.array(keep, dtype=np.int64)
+
+
+def canonical_index(hole: Sequence[int], board: Sequence[int]) -> int:
+    """
+    Índice canónico de (hole, board) bajo isomorfismo de palos:
+    clase * C(52, k) + menor colex del board entre las permutaciones de
+    palos que llevan el hole a su representante de HOLE_CLASSES.
+    """
+    h = tuple(hole)
+    cls = hole_class_of(h)
+    perms = perms_to(h, HOLE_CLASSES[cls])
+    b = np.asarray(board, dtype=np.int64)
+    best = colex_rank_batch(perms[:, b // 13] * 13 + b % 13).min()
+    return int(cls * BINOM[52, len(b)] + best)
+
+
+def canonical_index_batch(holes: np.ndarray, boards: np.ndarray) -> np.ndarray:
+    """
+    canonical_index por filas: prueba las 24 permutaciones de palos a la
+    vez y se queda con el menor board entre las que fijan la clase.
+    """
+    holes = np.asarray(holes, dtype=np.int64)
+    boards = np.asarray(boards, dtype=np.int64)
+    n, k = boards.shape
+    cls = hole_class_batch(holes)
+    rep = np.sort(np.array(HOLE_CLASSES, dtype=np.int64)[cls], axis=1)
+    # (24, N, ...) : cada permutación de palos aplicada a todas las filas
+    ph = np.sort(SUIT_PERMS[:, holes // 13] * 13 + holes % 13, axis=2)
+    ok = (ph == rep).all(axis=2)
+    pb = colex_rank_batch((SUIT_PERMS[:, boards // 13] * 13 + boards % 13).reshape(-1, k))
+    best = np.where(ok, pb.reshape(len(SUIT_PERMS), n), np.iinfo(np.int64).max).min(axis=0)
+    return cls * BINOM[52, k] + best
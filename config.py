@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Tuple
+from typing import Optional, Tuple
 
 """
 config.py
@@ -12,6 +12,11 @@ ciegas, tiempos, etiquetas de dificultad, etc.
 WIDTH: int = 1280
 HEIGHT: int = 720
 FPS: int = 60
+RESIZABLE: bool = True          # ventana redimensionable, mínimo WIDTH x HEIGHT
+IDLE_WAIT_MS: int = 250         # sin timers ni animaciones: se espera a eventos
+MAX_FRAME_MS: int = 100         # tope de dt por frame (p.ej. tras arrastrar la ventana)
+PROFILE_FRAMES: int = 600       # ventana del perfilador de frames (F3)
+PROFILE_CSV: str = "frame_profile.csv"
 
 TABLE_COLOR: Tuple[int, int, int] = (18, 80, 56)
 CARD_W: int = 76
@@ -33,8 +38,30 @@ AUTO_REBUY_BOTS: bool = True    # bots < BB se recargan al inicio de mano
 BOT_THINK_MS: int = 900         # "pensando..."
 BOT_POST_ACT_PAUSE: int = 800   # pausa breve tras acción bot
 BANNER_MS: int = 1800           # banner de acción en pantalla
+LOG_MAX_ENTRIES: int = 300      # historial de acciones (tecla H)
+KEYFRAME_EVERY: int = 50        # estado completo cada tantas versiones (state_delta)
+HAND_RECORD_PATH: Optional[str] = None  # manos grabadas para replay_export.py (None = no grabar; main.py --record-hands)
 
 # Dificultad bots
 EASY: str = "Fácil"
 MED: str = "Media"
 HARD: str = "Difícil"
+MCTS: str = "MCTS"              # bot de búsqueda (game_logic/mcts.py)
+
+# Presupuesto del bot MCTS por decisión
+MCTS_TIME_MS: int = 400
+MCTS_MAX_NODES: int = 20_000
+
+# Servidor de mesas (table_server.py)
+SERVER_HOST: str = "127.0.0.1"
+SERVER_PORT: int = 7777
+SERVER_SEATS: int = 6           # asientos por mesa; los libres los juegan bots
+ACTION_TIMEOUT_S: float = 15.0  # sin acción a tiempo: check si se puede, si no fold
+
+# Torneo (tournament.py): niveles de ciegas (chica, grande); tras el último se doblan
+BLIND_LEVELS: Tuple[Tuple[int, int], ...] = (
+    (10, 20), (15, 30), (25, 50), (40, 80), (50, 100), (75, 150),
+    (100, 200), (150, 300), (200, 400), (300, 600), (400, 800), (600, 1200),
+)
+HANDS_PER_LEVEL: int = 12
+TOURNAMENT_SEATS: int = 9       # asientos por mesa de torneo
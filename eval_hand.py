@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import List, Tuple, Optional
+import os
+from typing import List, Tuple, Optional, Dict
 from collections import Counter
 
 from cards import Card, RANK_TO_INT   # ⬅ sin punto
@@ -11,9 +12,29 @@ eval_hand.py
 Lógica de:
 - detectar escalera
 - evaluar la mejor mano de 5 cartas entre 7+ cartas
+- codificar esa evaluación como un entero comparable
 - heurística rápida quick_strength() para la IA
 """
 
+# Percentil de cada código entre todas las manos de 5/6/7 cartas
+# (generado por strength_table.py). Sin el archivo se usa la heurística vieja.
+_STRENGTH_TABLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "strength_table.npz")
+
+
+def _load_percentiles() -> Dict[int, Dict[int, float]]:
+    try:
+        import numpy as np
+        data = np.load(_STRENGTH_TABLE)
+    except (ImportError, OSError):
+        return {}
+    return {
+        n: dict(zip(data[f"codes{n}"].tolist(), (data[f"pct{n}"] / 65535.0).tolist()))
+        for n in (5, 6, 7)
+    }
+
+
+PERCENTILES: Dict[int, Dict[int, float]] = _load_percentiles()
+
 
 def is_straight(vals_desc: List[int]) -> Optional[int]:
     """
@@ -27,10 +48,6 @@ def is_straight(vals_desc: List[int]) -> Optional[int]:
         return None
     v = sorted(set(vals_desc), reverse=True)
 
-    # rueda A-5 (A=14 contado como bajo)
-    if {14, 5, 4, 3, 2}.issubset(v):
-        return 5
-
     run = 1
     for i in range(len(v) - 1):
         if v[i] - 1 == v[i + 1]:
@@ -39,6 +56,10 @@ def is_straight(vals_desc: List[int]) -> Optional[int]:
                 return v[i + 1] + 4
         else:
             run = 1
+
+    # rueda A-5 (A=14 contado como bajo); sólo si no hay otra más alta
+    if {14, 5, 4, 3, 2}.issubset(v):
+        return 5
     return None
 
 
@@ -131,16 +152,41 @@ def evaluate7(cards: List[Card]) -> Tuple[int, ...]:
     return (0, *highs)
 
 
+def score_to_code(score: Tuple[int, ...]) -> int:
+    """
+    Empaqueta la tupla de evaluate7() en un entero que ordena igual:
+    categoría en los bits 20..23 y cada valor siguiente en un nibble
+    (bits 16..19, 12..15, ...). Los huecos quedan a 0.
+    """
+    code = score[0] << 20
+    shift = 16
+    for v in score[1:]:
+        code |= v << shift
+        shift -= 4
+    return code
+
+
+def evaluate7_code(cards: List[Card]) -> int:
+    """
+    Igual que evaluate7() pero devuelve el código entero (ver score_to_code).
+    """
+    return score_to_code(evaluate7(cards))
+
+
 def quick_strength(hole: List[Card], board: List[Card]) -> float:
     """
     Heurística aproximada de fuerza de mano para la IA.
-    Devuelve algo ~[0..1]. Usa evaluate7() si hay suficientes cartas,
-    o aproximación preflop si no.
+    Devuelve algo ~[0..1]. Con 5+ cartas es el percentil real de la mano
+    entre todas las de ese número de cartas (PERCENTILES), o aproximación
+    preflop si no.
     """
     cards = hole + board
     if len(cards) >= 5:
-        score = evaluate7(cards)[0]
-        return (score + 0.1) / 9.0
+        code = evaluate7_code(cards)
+        table = PERCENTILES.get(len(cards))
+        if table:
+            return table[code]
+        return ((code >> 20) + 0.1) / 9.0
 
     # Preflop-ish
     a, b = hole
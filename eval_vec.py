@@ -0,0 +1,136 @@
+from __future__ import annotations
+import numpy as np
+
+"""
+eval_vec.py
+-----------
+Evaluación vectorizada (NumPy) de muchas manos a la vez.
+
+Las cartas se representan como enteros 0..51 (ver cards.card_to_int) y
+el resultado es el mismo código entero que eval_hand.evaluate7_code(),
+así que ambos caminos son intercambiables y comparables.
+"""
+
+_MASKS = np.arange(1 << 13, dtype=np.int64)
+_RANK_BITS = (1 << np.arange(13, dtype=np.int64))
+
+
+def _build_high() -> np.ndarray:
+    # valor (2..14) del bit más alto de cada máscara de 13 bits, 0 si vacía
+    out = np.zeros(1 << 13, dtype=np.int64)
+    for r in range(13):
+        out[(_MASKS >> r) & 1 == 1] = r + 2
+    return out
+
+
+def _build_top(k: int) -> np.ndarray:
+    # los k rangos más altos de cada máscara, empaquetados desde el bit 16
+    out = np.zeros(1 << 13, dtype=np.int64)
+    rest = _MASKS.copy()
+    for i in range(k):
+        hi = _HIGH[rest]
+        out |= hi << (16 - 4 * i)
+        rest = np.where(hi > 0, rest & ~(1 << np.maximum(hi - 2, 0)), rest)
+    return out
+
+
+def _build_straight() -> np.ndarray:
+    # carta alta de la mejor escalera contenida en la máscara (rueda = 5)
+    out = np.zeros(1 << 13, dtype=np.int64)
+    for low in range(9):
+        run = 0b11111 << low
+        out[(_MASKS & run) == run] = low + 6
+    wheel = 0b1000000001111
+    out[((_MASKS & wheel) == wheel) & (out == 0)] = 5
+    return out
+
+
+_HIGH = _build_high()
+_TOP2 = _build_top(2)
+_TOP3 = _build_top(3)
+_TOP5 = _build_top(5)
+_STRAIGHT = _build_straight()
+
+
+def _popcount(m: np.ndarray) -> np.ndarray:
+    return np.unpackbits(
+        m.astype(">u2").view(np.uint8).reshape(-1, 2), axis=1
+    ).sum(axis=1)
+
+
+def _bit(v: np.ndarray) -> np.ndarray:
+    # máscara de un rango 2..14; 0 si v == 0
+    return np.where(v > 0, 1 << np.maximum(v - 2, 0), 0)
+
+
+def evaluate_codes(cards: np.ndarray) -> np.ndarray:
+    """
+    Evalúa un lote de manos de 5 a 7 cartas.
+
+    Args:
+        cards: array (N, k) de enteros 0..51, 5 <= k <= 7, sin repetidas
+               dentro de cada fila.
+
+    Returns:
+        Array (N,) int64 con el código de cada mano (mayor = mejor).
+    """
+    cards = np.asarray(cards)
+    n = cards.shape[0]
+    ranks = (cards % 13).astype(np.int64)
+    suits = (cards // 13).astype(np.int64)
+
+    rows = np.arange(n, dtype=np.int64)[:, None]
+    rc = np.bincount((rows * 13 + ranks).ravel(), minlength=n * 13).reshape(n, 13)
+    sc = np.bincount((rows * 4 + suits).ravel(), minlength=n * 4).reshape(n, 4)
+
+    rank_mask = np.bitwise_or.reduce(1 << ranks, axis=1)
+    m4 = (rc == 4) @ _RANK_BITS
+    m3 = (rc == 3) @ _RANK_BITS
+    m2 = (rc == 2) @ _RANK_BITS
+
+    fsuit = sc.argmax(axis=1)
+    has_flush = sc[rows[:, 0], fsuit] >= 5
+    flush_mask = np.where(
+        has_flush,
+        np.bitwise_or.reduce(np.where(suits == fsuit[:, None], 1 << ranks, 0), axis=1),
+        0,
+    )
+
+    sf = _STRAIGHT[flush_mask]
+    st = _STRAIGHT[rank_mask]
+
+    q = _HIGH[m4]
+    t = _HIGH[m3]
+    p1 = _HIGH[m2]
+    p2 = _HIGH[m2 & ~_bit(p1)]
+    fh_second = _HIGH[(m3 & ~_bit(t)) | m2]
+
+    conds = [
+        sf > 0,
+        q > 0,
+        (t > 0) & (fh_second > 0),
+        has_flush,
+        st > 0,
+        t > 0,
+        p2 > 0,
+        p1 > 0,
+    ]
+    choices = [
+        (8 << 20) | (sf << 16),
+        (7 << 20) | (q << 16) | (_HIGH[rank_mask & ~_bit(q)] << 12),
+        (6 << 20) | (t << 16) | (fh_second << 12),
+        (5 << 20) | _TOP5[flush_mask],
+        (4 << 20) | (st << 16),
+        (3 << 20) | (t << 16) | (_TOP2[rank_mask & ~_bit(t)] >> 4),
+        (2 << 20) | (p1 << 16) | (p2 << 12)
+        | (_HIGH[rank_mask & ~_bit(p1) & ~_bit(p2)] << 8),
+        (1 << 20) | (p1 << 16) | (_TOP3[rank_mask & ~_bit(p1)] >> 4),
+    ]
+    return np.select(conds, choices, default=_TOP5[rank_mask])
+
+
+def categories(codes: np.ndarray) -> np.ndarray:
+    """
+    Categoría (0..8, como en evaluate7) de cada código.
+    """
+    return np.asarray(codes) >> 20
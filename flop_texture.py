@@ -0,0 +1,215 @@
+from __future__ import annotations
+import os
+import argparse
+import logging
+from multiprocessing import Pool
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from cards import Card, card_to_int
+from combos import N_FLOP, board_index, colex_combos
+from eval_vec import evaluate_codes
+from utils import setup_logging
+
+"""
+flop_texture.py
+---------------
+Textura de los 22.100 flops precalculada en una tabla indexada por el
+id del flop (combos.board_index, orden colex):
+
+- flags (bits): pareado, trío, monocolor, dos palos, arcoíris, escalera
+  posible, proyecto de escalera y proyecto de color;
+- connect: máximo de rangos distintos del flop dentro de una misma
+  ventana de escalera (1..3, el as cuenta también como bajo);
+- high: rango de la carta más alta (2..14);
+- cats: de los 1.176 holes posibles con ese flop, cuántos hacen cada
+  categoría de mano (0 = carta alta ... 8 = escalera de color, como
+  eval_hand.evaluate7).
+
+Los bots y el HUD leen la textura con una consulta (flop_texture) en
+vez de recalcularla desde self.board en cada decisión.
+
+Uso:
+    python flop_texture.py
+"""
+
+FLOP_TEXTURE_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "flop_texture.npz")
+
+PAIRED = 1
+TRIPS = 2
+MONOTONE = 4
+TWO_TONE = 8
+RAINBOW = 16
+STRAIGHT_POSSIBLE = 32   # algún hole hace escalera
+STRAIGHT_DRAW = 64       # algún hole tiene proyecto de escalera
+FLUSH_DRAW = 128         # dos o más cartas del mismo palo
+
+TEXTURE_DTYPE = np.dtype([("flags", "u1"), ("connect", "u1"), ("high", "u1"), ("cats", "<u2", (9,))])
+
+N_CATEGORIES = 9
+HOLES_PER_FLOP = 1176  # C(49, 2)
+
+
+class FlopTexture(NamedTuple):
+    flags: int
+    connect: int
+    high: int
+    cats: Tuple[int, ...]
+
+    @property
+    def paired(self) -> bool:
+        return bool(self.flags & PAIRED)
+
+    @property
+    def monotone(self) -> bool:
+        return bool(self.flags & MONOTONE)
+
+    @property
+    def two_tone(self) -> bool:
+        return bool(self.flags & TWO_TONE)
+
+    @property
+    def straight_draw(self) -> bool:
+        return bool(self.flags & STRAIGHT_DRAW)
+
+    @property
+    def flush_draw(self) -> bool:
+        return bool(self.flags & FLUSH_DRAW)
+
+    def describe(self) -> str:
+        """
+        Etiqueta corta para el HUD / log, p.ej. "pareado, dos palos".
+        """
+        out = []
+        if self.flags & TRIPS:
+            out.append("trío")
+        elif self.flags & PAIRED:
+            out.append("pareado")
+        if self.flags & MONOTONE:
+            out.append("monocolor")
+        elif self.flags & TWO_TONE:
+            out.append("dos palos")
+        else:
+            out.append("arcoíris")
+        if self.connect == 3:
+            out.append("conectado")
+        elif self.connect == 2:
+            out.append("semi-conectado")
+        return ", ".join(out)
+
+
+# --- cálculo ---
+def board_features(flops: np.ndarray) -> np.ndarray:
+    """
+    flags / connect / high de un array (N, 3) de flops (cartas enteras).
+    """
+    flops = np.asarray(flops, dtype=np.int64)
+    n = len(flops)
+    ranks = flops % 13
+    suits = flops // 13
+    out = np.zeros(n, dtype=TEXTURE_DTYPE)
+
+    mask = np.bitwise_or.reduce(np.left_shift(1, ranks), axis=1)
+    distinct = np.array([bin(m).count("1") for m in range(1 << 13)], dtype=np.int64)[mask]
+    suit_max = np.zeros(n, dtype=np.int64)
+    for s in range(4):
+        suit_max = np.maximum(suit_max, (suits == s).sum(axis=1))
+
+    # ventanas de escalera sobre 14 bits (bit 0 = as bajo)
+    ext = (mask << 1) | ((mask >> 12) & 1)
+    popcnt = np.array([bin(m).count("1") for m in range(32)], dtype=np.int64)
+    connect = np.max([popcnt[(ext >> s) & 31] for s in range(10)], axis=0)
+
+    flags = np.zeros(n, dtype=np.int64)
+    flags |= np.where(distinct <= 2, PAIRED, 0)
+    flags |= np.where(distinct == 1, TRIPS, 0)
+    flags |= np.where(suit_max == 3, MONOTONE, 0)
+    flags |= np.where(suit_max == 2, TWO_TONE, 0)
+    flags |= np.where(suit_max == 1, RAINBOW, 0)
+    flags |= np.where(connect == 3, STRAIGHT_POSSIBLE, 0)
+    flags |= np.where(connect >= 2, STRAIGHT_DRAW, 0)
+    flags |= np.where(suit_max >= 2, FLUSH_DRAW, 0)
+
+    out["flags"] = flags
+    out["connect"] = connect
+    out["high"] = ranks.max(axis=1) + 2
+    return out
+
+
+_PAIRS = colex_combos(49, 2, dtype=np.int64)
+
+
+def category_counts(flops: np.ndarray) -> np.ndarray:
+    """
+    (N, 9) holes de cada categoría de mano para cada flop.
+    """
+    flops = np.asarray(flops, dtype=np.int64)
+    n = len(flops)
+    dead = np.zeros((n, 52), dtype=bool)
+    dead[np.arange(n)[:, None], flops] = True
+    live = np.argsort(dead, axis=1, kind="stable")[:, :49]
+    holes = live[:, _PAIRS]  # (N, 1176, 2)
+    hands = np.concatenate(
+        [holes, np.broadcast_to(flops[:, None, :], (n, HOLES_PER_FLOP, 3))], axis=2
+    )
+    cat = evaluate_codes(hands.reshape(-1, 5)).reshape(n, HOLES_PER_FLOP) >> 20
+    idx = np.arange(n)[:, None] * N_CATEGORIES + cat
+    return np.bincount(idx.ravel(), minlength=n * N_CATEGORIES).reshape(n, N_CATEGORIES)
+
+
+def _chunk(bounds: Tuple[int, int]) -> np.ndarray:
+    lo, hi = bounds
+    flops = colex_combos(52, 3, dtype=np.int64)[lo:hi]
+    out = board_features(flops)
+    out["cats"] = category_counts(flops)
+    return out
+
+
+def build(path: str = FLOP_TEXTURE_PATH, workers: int = 0, chunk: int = 500) -> None:
+    bounds = [(lo, min(lo + chunk, N_FLOP)) for lo in range(0, N_FLOP, chunk)]
+    with Pool(workers or os.cpu_count() or 1) as pool:
+        table = np.concatenate(pool.map(_chunk, bounds))
+    assert (table["cats"].sum(axis=1) == HOLES_PER_FLOP).all()
+    np.savez_compressed(path, texture=table)
+    logging.info(f"[flop] tabla de {len(table)} flops guardada en {path}")
+
+
+# --- consulta ---
+_TABLE: Optional[np.ndarray] = None
+
+
+def load_table(path: str = FLOP_TEXTURE_PATH) -> np.ndarray:
+    """
+    La tabla (22.100,) con TEXTURE_DTYPE; se carga una vez.
+    """
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = np.load(path)["texture"]
+    return _TABLE
+
+
+def flop_id(board: List[Card]) -> int:
+    return board_index([card_to_int(c) for c in board[:3]])
+
+
+def flop_texture(board: List[Card]) -> FlopTexture:
+    """
+    Textura del flop (las tres primeras cartas de 'board').
+    """
+    row = load_table()[flop_id(board)]
+    return FlopTexture(int(row["flags"]), int(row["connect"]), int(row["high"]), tuple(row["cats"].tolist()))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Tabla de textura de los 22.100 flops.")
+    ap.add_argument("--out", default=FLOP_TEXTURE_PATH)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    a = ap.parse_args()
+
+    setup_logging("flop_texture.log")
+    build(a.out, a.workers)
+
+
+if __name__ == "__main__":
+    main()
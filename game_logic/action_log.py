@@ -0,0 +1,110 @@
+# game_logic/action_log.py
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Iterator, List, Optional
+
+import pygame
+
+from config import LOG_MAX_ENTRIES
+
+HUD_LINES: int = 6  # líneas de la mano actual que muestra el HUD
+
+
+class LogEntry:
+    __slots__ = ("seq", "hand_no", "round_label", "text", "hud_surf", "hist_surf")
+
+    def __init__(self, seq: int, hand_no: int, round_label: str, text: str) -> None:
+        self.seq = seq
+        self.hand_no = hand_no
+        self.round_label = round_label
+        self.text = text
+        self.hud_surf: Optional[pygame.Surface] = None
+        self.hist_surf: Optional[pygame.Surface] = None
+
+    def hud_surface(self, font: pygame.font.Font) -> pygame.Surface:
+        if self.hud_surf is None:
+            self.hud_surf = font.render("• " + self.text, True, (230, 230, 230))
+        return self.hud_surf
+
+    def history_surface(self, font: pygame.font.Font) -> pygame.Surface:
+        if self.hist_surf is None:
+            self.hist_surf = font.render(
+                f"#{self.hand_no}  {self.round_label:<9} {self.text}", True, (225, 225, 225)
+            )
+        return self.hist_surf
+
+
+class ActionLog:
+    """
+    Historial de acciones acotado (anillo de LOG_MAX_ENTRIES entradas).
+
+    Cada entrada guarda sus superficies ya renderizadas, que se crean al
+    primer dibujo y se sueltan cuando dejan de verse (salen del HUD o de
+    la página de historial). Memoria y coste por frame no dependen de lo
+    larga que sea la mano o la sesión.
+    """
+
+    def __init__(self, maxlen: int = LOG_MAX_ENTRIES) -> None:
+        self.entries: Deque[LogEntry] = deque(maxlen=maxlen)
+        self.seq: int = 0         # entradas añadidas en total (firma para dirty rects)
+        self._hand_seq: int = 0   # seq al empezar la mano actual
+        self._page: List[LogEntry] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[LogEntry]:
+        return iter(self.entries)
+
+    @property
+    def hud_key(self) -> tuple:
+        # cambia cuando cambian las líneas del HUD
+        return (self.seq, self._hand_seq)
+
+    def append(self, text: str, hand_no: int = 0, round_label: str = "") -> None:
+        self.entries.append(LogEntry(self.seq, hand_no, round_label, text))
+        self.seq += 1
+        # la que acaba de salir del HUD ya no necesita su superficie
+        if len(self.entries) > HUD_LINES:
+            self.entries[-HUD_LINES - 1].hud_surf = None
+
+    def new_hand(self) -> None:
+        """
+        El HUD sólo muestra líneas de la mano actual; el historial sigue.
+        """
+        for e in self.recent():
+            e.hud_surf = None
+        self._hand_seq = self.seq
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self._page = []
+        self._hand_seq = self.seq
+
+    def recent(self, n: int = HUD_LINES) -> List[LogEntry]:
+        """
+        Últimas n entradas de la mano actual (las más viejas primero).
+        """
+        k = min(n, self.seq - self._hand_seq, len(self.entries))
+        return [self.entries[i] for i in range(len(self.entries) - k, len(self.entries))]
+
+    # --- historial paginado ---
+    def page_count(self, per_page: int) -> int:
+        return max(1, -(-len(self.entries) // per_page))
+
+    def page(self, page_no: int, per_page: int) -> List[LogEntry]:
+        """
+        Página 0 = las más recientes. Devuelve las entradas en orden
+        cronológico y libera las superficies de la página anterior.
+        """
+        n = len(self.entries)
+        hi = n - page_no * per_page
+        lo = max(0, hi - per_page)
+        entries = [self.entries[i] for i in range(max(0, lo), max(0, hi))]
+        keep = set(map(id, entries))
+        for e in self._page:
+            if id(e) not in keep:
+                e.hist_surf = None
+        self._page = entries
+        return entries
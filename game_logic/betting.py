@@ -1,33 +1,96 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional, Tuple
 import random
 
-from config import BIG_BLIND, BOT_THINK_MS, BOT_POST_ACT_PAUSE, FPS
+from config import BOT_THINK_MS, BOT_POST_ACT_PAUSE, MCTS
 from ai import bot_decision
 
+from .rules import ActionEvent, legal_actions, min_raise_size
+
 class BettingMixin:
+    # --- máscaras de asientos (bit i = asiento i) ---
+    def reset_seat_masks(self) -> None:
+        """
+        Recalcula las máscaras desde los flags de los jugadores; sólo al
+        empezar la mano. Después se mantienen con fold_seat/allin_seat y
+        los cambios de pendientes, en O(1) por acción.
+        """
+        self.active_mask = self.allin_mask = self.pending_mask = 0
+        self.active_count = self.allin_count = self.pending_count = 0
+        for i, p in enumerate(self.players):
+            if not p.folded:
+                self.active_mask |= 1 << i
+                self.active_count += 1
+                if p.all_in:
+                    self.allin_mask |= 1 << i
+                    self.allin_count += 1
+
+    def fold_seat(self, idx: int) -> None:
+        self.players[idx].folded = True
+        bit = 1 << idx
+        if self.active_mask & bit:
+            self.active_mask ^= bit
+            self.active_count -= 1
+        if self.allin_mask & bit:
+            self.allin_mask ^= bit
+            self.allin_count -= 1
+
+    def allin_seat(self, idx: int) -> None:
+        self.players[idx].all_in = True
+        bit = 1 << idx
+        if not self.allin_mask & bit:
+            self.allin_mask |= bit
+            self.allin_count += 1
+
+    def is_pending(self, idx: int) -> bool:
+        return bool(self.pending_mask >> idx & 1)
+
+    def discard_pending(self, idx: int) -> None:
+        bit = 1 << idx
+        if self.pending_mask & bit:
+            self.pending_mask ^= bit
+            self.pending_count -= 1
+
+    def seats_in(self, mask: int) -> List[int]:
+        return [i for i in range(len(self.players)) if mask >> i & 1]
+
+    @staticmethod
+    def next_seat_in(mask: int, i: int) -> int:
+        """
+        Primer asiento de 'mask' después de i en orden circular (puede ser
+        el propio i); i si la máscara está vacía.
+        """
+        if not mask:
+            return i
+        m = (mask >> (i + 1) << (i + 1)) or mask
+        return (m & -m).bit_length() - 1
+
     # --- betting engine core ---
-    def eligible_players_for_street(self) -> List[int]:
-        return [
-            i
-            for i, p in enumerate(self.players)
-            if not p.folded and not p.all_in and p.stack > 0
-        ]
+    def eligible_mask(self) -> Tuple[int, int]:
+        """
+        (máscara, cantidad) de asientos que pueden actuar en una calle:
+        no retirados, no all-in y con fichas.
+        """
+        m = self.active_mask & ~self.allin_mask
+        count = 0
+        rest = m
+        while rest:
+            low = rest & -rest
+            if self.players[low.bit_length() - 1].stack > 0:
+                count += 1
+            else:
+                m ^= low
+            rest ^= low
+        return m, count
 
     def next_in_pending_from(self, start_idx: int) -> int:
-        if not self.pending_to_act:
-            return start_idx
-        n = len(self.players)
-        for step in range(1, n + 1):
-            j = (start_idx + step) % n
-            if j in self.pending_to_act:
-                return j
-        return start_idx
+        return self.next_seat_in(self.pending_mask, start_idx)
 
     def start_street(self, first_player: int, preflop: bool = False) -> None:
         self.first_to_act = first_player
         self.acted_set = set()
+        self.street_actions = []
 
         if not preflop:
             for p in self.players:
@@ -36,13 +99,12 @@ class BettingMixin:
             self.current_bet = 0
             self.last_raiser = None
             self.had_aggression = False
-            self.pending_to_act = set(self.eligible_players_for_street())
+            self.pending_mask, self.pending_count = self.eligible_mask()
         else:
             self.had_aggression = True
-            elig = set(self.eligible_players_for_street())
-            if self.last_raiser is not None and self.last_raiser in elig:
-                elig.discard(self.last_raiser)
-            self.pending_to_act = elig
+            self.pending_mask, self.pending_count = self.eligible_mask()
+            if self.last_raiser is not None:
+                self.discard_pending(self.last_raiser)
 
         self.current_player = self.next_in_pending_from(
             (first_player - 1) % len(self.players)
@@ -53,37 +115,39 @@ class BettingMixin:
         return max(0, self.current_bet - p.bet)
 
     def min_raise_amount(self) -> int:
-        if self.current_bet == 0:
-            return BIG_BLIND
-        return max(self.last_raise_size, BIG_BLIND)
+        return min_raise_size(self)
 
     def only_one_left(self) -> bool:
-        return sum(1 for p in self.players if not p.folded) == 1
+        return self.active_count == 1
 
     def mark_action(self, idx: int, kind: str) -> None:
+        self.street_actions.append((idx, kind, self.players[idx].bet))
+
         if kind in ("check", "call", "fold"):
-            if idx in self.pending_to_act:
-                self.pending_to_act.discard(idx)
+            self.discard_pending(idx)
             return
 
         if kind in ("bet", "raise", "allin"):
             self.had_aggression = True
             self.last_raiser = idx
-            elig = [
-                i for i, p in enumerate(self.players) if not p.folded and not p.all_in
-            ]
-            self.pending_to_act = {
-                i for i in elig
-                if i != idx and self.players[i].bet < self.current_bet
-            }
+            # vuelven a actuar los vivos sin all-in que no cubren la subida
+            # (y con fichas: sin stack no hay nada que decidir)
+            rest = self.active_mask & ~self.allin_mask & ~(1 << idx)
+            pending = count = 0
+            while rest:
+                low = rest & -rest
+                p = self.players[low.bit_length() - 1]
+                if p.bet < self.current_bet and p.stack > 0:
+                    pending |= low
+                    count += 1
+                rest ^= low
+            self.pending_mask, self.pending_count = pending, count
 
     def street_should_end(self) -> bool:
-        if len(self.pending_to_act) == 0:
-            return True
-        vivos = [p for p in self.players if not p.folded]
-        if vivos and all(p.all_in for p in vivos):
+        if self.pending_count == 0:
             return True
-        return False
+        # todos los vivos están all-in
+        return self.active_count > 0 and self.allin_count == self.active_count
 
     def proceed_round(self) -> None:
         if getattr(self, "_advancing", False):
@@ -133,142 +197,116 @@ class BettingMixin:
         finally:
             self._advancing = False
 
-    # --- acciones humano ---
-    def _human_can_act_now(self) -> bool:
-        return self.state in ("BETTING", "BOT_PAUSE")
-
-    def human_action(self, label: str) -> None:
-        p = self.players[self.current_player]
-        self.banner(label, who=p.name)
-        self.push_log(f"{p.name}: {label}")
-
-    def player_action_fold(self) -> None:
-        if not self._human_can_act_now():
-            return
-        p = self.players[self.current_player]
-        if (not p.is_human) or p.folded or p.all_in:
-            return
-        if self.current_player not in self.pending_to_act:
-            return
-        p.folded = True
-        self.human_action("Se retira")
-        self.mark_action(self.current_player, "fold")
-        self.advance_after_action()
-
-    def player_action_call(self) -> None:
-        if not self._human_can_act_now():
-            return
-        p = self.players[self.current_player]
-        if (not p.is_human) or p.folded or p.all_in:
-            return
-
-        to_call = self.to_call_amount(self.current_player)
-        if to_call > 0 and self.current_player not in self.pending_to_act:
-            return
-
-        if not self.can_allin_now():
-            if p.stack - min(to_call, p.stack) < BIG_BLIND and to_call > 0:
-                self.banner(f"No puedes bajar de {BIG_BLIND} antes del river.")
-                return
+    # --- núcleo de acciones (humano y bots) ---
+    def apply_action(self, seat: int, kind: str, amount: int = 0) -> Optional[str]:
+        """
+        Único sitio que mueve fichas por una acción, con las reglas de
+        rules.legal_actions para humanos y bots por igual.
+
+        Args:
+            kind: "fold", "call" (o check), "raise_to" (amount = apuesta
+                total de la calle) o "allin".
+
+        Returns:
+            lo que se aplicó ("fold", "check", "call", "raise", "allin") o
+            None si no es legal (el estado no cambia). Una subida que no
+            llega a subir se aplica como call.
+        """
+        legal = legal_actions(self, seat)
+        if legal is None:
+            return None
+        p = self.players[seat]
+
+        if kind == "fold":
+            self.fold_seat(seat)
+            self.mark_action(seat, "fold")
+            done = "fold"
+
+        elif kind == "call" or (kind == "raise_to" and (
+            amount <= self.current_bet or not legal.can_raise
+        )):
+            if legal.can_check:
+                self.mark_action(seat, "check")
+                done = "check"
+            elif legal.can_call:
+                put = legal.call_amount
+                p.stack -= put
+                p.bet += put
+                p.invested += put
+                self.pot += put
+                if p.stack == 0:
+                    self.allin_seat(seat)
+                self.mark_action(seat, "call")
+                done = "call"
+            else:
+                return None
 
-        need = to_call
-        put = min(need, p.stack)
-        if put > 0:
+        elif kind in ("raise_to", "allin"):
+            if kind == "allin":
+                if not legal.can_allin:
+                    return None
+                target = legal.allin_to
+            else:
+                target = legal.clamp_raise(amount)
+            put = min(target - p.bet, p.stack)
+            prev_cb = self.current_bet
             p.stack -= put
             p.bet += put
+            p.invested += put
             self.pot += put
-        if p.stack == 0 and need > 0:
-            p.all_in = True
-
-        self.human_action("Iguala" if need > 0 else "Pasa")
-        self.mark_action(self.current_player, "call" if need > 0 else "check")
-        self.advance_after_action()
-
-    def player_action_allin(self) -> None:
-        if not self._human_can_act_now():
-            return
-        if not self.can_allin_now():
-            self.banner("El all-in solo está permitido en la última ronda.")
-            return
-        p = self.players[self.current_player]
-        if (not p.is_human) or p.folded or p.all_in or p.stack == 0:
-            return
-        if self.current_player not in self.pending_to_act:
-            return
+            if p.stack == 0:
+                self.allin_seat(seat)
+            if p.bet > prev_cb:
+                self.current_bet = p.bet
+                self.last_raiser = seat
+                if kind == "allin":
+                    self.last_raise_size = max(self.last_raise_size, p.bet - prev_cb)
+                elif p.bet - prev_cb >= self.min_raise_amount():
+                    self.last_raise_size = p.bet - prev_cb
+                self.mark_action(seat, "allin" if kind == "allin" else "raise")
+                done = kind if kind == "allin" else "raise"
+            else:
+                self.mark_action(seat, "call")
+                done = "allin" if kind == "allin" else "call"
 
-        total = p.stack
-        p.stack = 0
-        p.bet += total
-        self.pot += total
-        p.all_in = True
-
-        prev_cb = self.current_bet
-        if p.bet > self.current_bet:
-            self.current_bet = p.bet
-            self.last_raiser = self.current_player
-            self.last_raise_size = max(
-                self.last_raise_size, self.current_bet - prev_cb
-            )
-            self.mark_action(self.current_player, "allin")
         else:
-            self.mark_action(self.current_player, "call")
+            return None
 
-        self.human_action("All-in")
-        self.advance_after_action()
+        if self.action_listeners:
+            ev = ActionEvent(seat, done, p.bet, self.pot)
+            for fn in self.action_listeners:
+                fn(ev)
+        return done
 
-    def player_action_raise_to(self, target_total: int) -> None:
-        if not self._human_can_act_now():
-            return
+    # --- acciones humano ---
+    def _human_can_act_now(self) -> bool:
+        if self.state not in ("BETTING", "BOT_PAUSE"):
+            return False
         p = self.players[self.current_player]
-        if (not p.is_human) or p.folded or p.all_in or p.stack == 0:
+        return p.is_human and legal_actions(self, self.current_player) is not None
+
+    def human_act(self, kind: str, amount: int = 0) -> None:
+        if not self._human_can_act_now():
             return
-        if self.current_player not in self.pending_to_act:
+        if self.apply_action(self.current_player, kind, amount) is None:
+            if kind == "allin":
+                self.banner("El all-in solo está permitido en la última ronda.")
+            else:
+                self.banner(f"No puedes bajar de {self.big_blind} antes del river.")
             return
+        self.advance_after_action()
 
-        if target_total <= self.current_bet:
-            return self.player_action_call()
-
-        if not self.can_allin_now():
-            target_total = self.pre_river_cap_target(self.current_player, target_total)
-            to_call = self.to_call_amount(self.current_player)
-            if (
-                p.stack - max(0, min(to_call, p.stack)) < BIG_BLIND
-                and target_total <= self.current_bet
-            ):
-                self.banner(f"No puedes bajar de {BIG_BLIND} antes del river.")
-                return
-
-        raise_diff = target_total - self.current_bet
-        if raise_diff < self.min_raise_amount():
-            target_total = self.current_bet + self.min_raise_amount()
-
-        need = max(0, target_total - p.bet)
-        if need <= 0:
-            return self.player_action_call()
+    def player_action_fold(self) -> None:
+        self.human_act("fold")
 
-        need = min(need, p.stack)
-        if need <= 0:
-            return
+    def player_action_call(self) -> None:
+        self.human_act("call")
 
-        prev_cb = self.current_bet
-        p.stack -= need
-        p.bet += need
-        self.pot += need
+    def player_action_allin(self) -> None:
+        self.human_act("allin")
 
-        if p.bet > self.current_bet:
-            self.current_bet = p.bet
-            self.last_raiser = self.current_player
-            if (self.current_bet - prev_cb) >= self.min_raise_amount():
-                self.last_raise_size = self.current_bet - prev_cb
-            if p.stack == 0:
-                p.all_in = True
-            self.human_action(f"Sube a {p.bet}")
-            self.mark_action(self.current_player, "raise")
-            self.advance_after_action()
-        else:
-            self.human_action("Iguala")
-            self.mark_action(self.current_player, "call")
-            self.advance_after_action()
+    def player_action_raise_to(self, target_total: int) -> None:
+        self.human_act("raise_to", target_total)
 
     def advance_after_action(self) -> None:
         if self.only_one_left():
@@ -285,153 +323,121 @@ class BettingMixin:
         self.dump_state("after_action")
 
     def next_player(self, i: int) -> int:
-        if not self.pending_to_act:
-            return i
-        n = len(self.players)
-        for step in range(1, n + 1):
-            j = (i + step) % n
-            if j in self.pending_to_act:
-                return j
-        return i
+        return self.next_seat_in(self.pending_mask, i)
 
     # --- turno de bots ---
-    def bot_take_turn_if_needed(self) -> None:
-        if self.state not in ("BETTING", "BOT_PAUSE"):
-            return
-
+    def settle_turn(self) -> bool:
+        """
+        Cierra la calle o salta asientos que ya no deben actuar.
+        Devuelve True si current_player tiene que decidir ahora.
+        """
         if self.street_should_end():
             self.proceed_round()
-            return
+            return False
 
-        if self.current_player not in self.pending_to_act:
+        if not self.is_pending(self.current_player):
             self.current_player = self.next_player(self.current_player)
             if self.street_should_end():
                 self.proceed_round()
-            return
+            return False
 
         p = self.players[self.current_player]
-
-        if p.is_human:
-            return
-
         if p.folded or p.all_in:
-            if self.current_player in self.pending_to_act:
-                self.pending_to_act.discard(self.current_player)
+            self.discard_pending(self.current_player)
             if self.street_should_end():
                 self.proceed_round()
             else:
                 self.current_player = self.next_player(self.current_player)
+            return False
+        return True
+
+    def bot_take_turn_if_needed(self) -> None:
+        if self.state not in ("BETTING", "BOT_PAUSE"):
+            return
+
+        if not self.settle_turn():
+            return
+
+        p = self.players[self.current_player]
+
+        if p.is_human:
             return
 
         # "pensando..."
         if self.bot_think_timer <= 0:
             self.bot_think_timer = BOT_THINK_MS * (0.8 + random.random() * 0.6)
             self.banner("pensando...", who=p.name)
+            if self.bot_pool is not None:
+                # decide en el executor del pool mientras dura la pausa
+                self.bot_future = (self.turn_key(), self.bot_pool.submit(self, self.current_player))
             return
         else:
-            self.bot_think_timer -= 1000 / FPS
+            self.bot_think_timer -= self.frame_ms
             if self.bot_think_timer > 0:
                 return
 
-        to_call = self.to_call_amount(self.current_player)
-        act, amount = bot_decision(
+        if self.bot_pool is not None:
+            if self.bot_future is None or self.bot_future[0] != self.turn_key():
+                self.bot_think_timer = 0.0  # turno nuevo: volver a encargar
+                return
+            if not self.bot_future[1].done():
+                # se consulta otra vez en el próximo frame, sin bloquear
+                self.bot_think_timer = self.frame_ms
+                return
+            act, amount = self.bot_future[1].result()
+            self.bot_future = None
+            self.apply_bot_action(act, amount)
+            self.bot_think_timer = 0.0
+            self.advance_after_action()
+        else:
+            self.bot_act()
+
+        if self.state in ("BETTING", "BOT_PAUSE"):
+            self.state = "BOT_PAUSE"
+            self.bot_pause_timer = float(BOT_POST_ACT_PAUSE)
+
+    def turn_key(self) -> Tuple[int, int, int, int]:
+        """
+        Identifica el turno actual (mano, calle, asiento, acciones de la
+        calle): una decisión encargada para otro turno no se aplica.
+        """
+        return (self.hand_no, self.round_index, self.current_player, len(self.street_actions))
+
+    def bot_act(self) -> None:
+        """
+        Decide y ejecuta la acción del bot en current_player.
+        """
+        act, amount = self.choose_bot_action(self.current_player)
+        self.apply_bot_action(act, amount)
+        self.bot_think_timer = 0.0
+        self.advance_after_action()
+
+    def choose_bot_action(self, idx: int) -> Tuple[str, int]:
+        p = self.players[idx]
+        if p.difficulty == MCTS and self.mcts_bot is not None:
+            return self.mcts_bot.decide(self, idx)
+        return bot_decision(
             p,
-            to_call,
+            self.to_call_amount(idx),
             self.min_raise_amount(),
             self.pot,
             self.board,
             self.round_index,
         )
 
-        allin_allowed = self.can_allin_now()
-        label = ""
-
-        if act == "fold":
-            p.folded = True
-            label = "se retira"
-            self.mark_action(self.current_player, "fold")
-
-        elif act == "call":
-            if (
-                not allin_allowed
-                and p.stack - min(to_call, p.stack) < BIG_BLIND
-                and to_call > 0
-            ):
-                p.folded = True
-                label = "se retira"
-                self.mark_action(self.current_player, "fold")
-            else:
-                put = min(to_call, p.stack)
-                p.stack -= put
-                p.bet += put
-                self.pot += put
-                if p.stack == 0 and to_call > 0:
-                    p.all_in = True
-                label = "iguala" if to_call > 0 else "pasa"
-                self.mark_action(
-                    self.current_player, "call" if to_call > 0 else "check"
-                )
-
-        elif act == "allin":
-            if not allin_allowed:
-                amount = self.pre_river_cap_target(
-                    self.current_player,
-                    p.bet + p.stack - 1,
-                )
-                act = "raise_to" if amount > max(self.current_bet, p.bet) else "call"
-
-            if allin_allowed:
-                total = p.stack
-                p.stack = 0
-                p.bet += total
-                self.pot += total
-                p.all_in = True
-                label = "va all-in"
-                prev_cb = self.current_bet
-                if p.bet > self.current_bet:
-                    self.current_bet = p.bet
-                    self.last_raiser = self.current_player
-                    self.last_raise_size = max(
-                        self.last_raise_size, self.current_bet - prev_cb
-                    )
-                    self.mark_action(self.current_player, "allin")
-                else:
-                    self.mark_action(self.current_player, "call")
-
-        if act == "raise_to":
-            if not allin_allowed:
-                amount = self.pre_river_cap_target(self.current_player, amount)
-            need = max(0, amount - p.bet)
-            need = min(need, p.stack)
-            if need <= 0:
-                label = "pasa" if to_call == 0 else "iguala"
-                self.mark_action(
-                    self.current_player, "check" if to_call == 0 else "call"
-                )
-            else:
-                prev_cb = self.current_bet
-                p.stack -= need
-                p.bet += need
-                self.pot += need
-                label = f"sube a {p.bet}"
-                if p.bet > self.current_bet:
-                    self.current_bet = p.bet
-                    self.last_raiser = self.current_player
-                    if (self.current_bet - prev_cb) >= self.min_raise_amount():
-                        self.last_raise_size = self.current_bet - prev_cb
-                    if p.stack == 0:
-                        p.all_in = True
-                    self.mark_action(self.current_player, "raise")
-                else:
-                    self.mark_action(self.current_player, "call")
-
-        self.banner(label, who=p.name)
-        self.push_log(f"{p.name}: {label}.")
-
-        self.bot_think_timer = 0.0
-
-        self.advance_after_action()
-
-        if self.state in ("BETTING", "BOT_PAUSE"):
-            self.state = "BOT_PAUSE"
-            self.bot_pause_timer = float(BOT_POST_ACT_PAUSE)
+    def apply_bot_action(self, act: str, amount: int) -> Optional[str]:
+        """
+        Traduce (acción, cantidad) de bot_decision() a apply_action para
+        current_player: un all-in antes del river pasa a ser la subida
+        máxima permitida y lo que no sea legal, un fold.
+        """
+        seat = self.current_player
+        legal = legal_actions(self, seat)
+        if legal is None:
+            return None
+        if act == "allin" and not legal.can_allin:
+            act, amount = "raise_to", legal.max_raise_to
+        done = self.apply_action(seat, act, amount)
+        if done is None:
+            done = self.apply_action(seat, "fold")
+        return done
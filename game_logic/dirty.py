@@ -0,0 +1,156 @@
+# game_logic/dirty.py
+from __future__ import annotations
+
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import pygame
+
+
+Region = Tuple[pygame.Rect, Hashable]
+
+# más de estos rects sueltos -> se redibuja su unión de una vez
+MAX_DIRTY_RECTS: int = 8
+
+
+class DirtyRectMixin:
+    """
+    Render retenido: cada región de la escena tiene un rect y una firma
+    (tupla con todo lo que afecta a su dibujo). Sólo se redibuja (una vez,
+    recortado a la unión) y se envía a pantalla lo de las regiones cuya
+    firma cambió desde el frame anterior, más lo marcado a mano con
+    invalidate().
+    """
+
+    def init_dirty(self) -> None:
+        self._regions: Dict[Hashable, Region] = {}
+        self._forced: List[pygame.Rect] = []
+        self._full_redraw: bool = True
+
+    def invalidate(self, rect: Optional[pygame.Rect] = None) -> None:
+        """
+        Fuerza a redibujar 'rect' (o toda la pantalla) en el próximo frame.
+        """
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._forced.append(pygame.Rect(rect))
+
+    # --- regiones ---
+    def scene_regions(self) -> Dict[Hashable, Region]:
+        hover = self.pointer()
+        lay = self.layout
+        regions: Dict[Hashable, Region] = {
+            # lobby <-> mesa cambia todo el fondo
+            "scene": (self.screen.get_rect(), self.state == "LOBBY"),
+        }
+        if self.profiler.enabled:
+            # overlay del perfilador (F3)
+            regions["profiler"] = (self.profiler_rect(), self.profiler.panel_key)
+
+        for i, b in enumerate(self.buttons):
+            regions[("btn", i)] = (
+                b.rect.inflate(4, 4),
+                (b.label, tuple(b.rect), b.small, b.rect.collidepoint(*hover)),
+            )
+
+        if self.state == "LOBBY":
+            regions["lobby_cards"] = (
+                lay.lobby_cards_rect,
+                pygame.time.get_ticks(),  # animación: siempre sucia
+            )
+            regions["lobby_values"] = (
+                lay.lobby_values_rect,
+                (self.num_bots, self.bot_difficulty),
+            )
+            return regions
+
+        in_turn = self.state in ("BETTING", "BOT_PAUSE")
+        face_up_all = self.state in ("SHOWDOWN", "ENDHAND")
+        for i, (p, rect) in enumerate(zip(self.players, lay.seat_rects)):
+            regions[("seat", i)] = (
+                rect,
+                (
+                    p.name, p.stack, p.bet, p.total_won, p.folded,
+                    tuple(map(repr, p.hole)), p.is_human or face_up_all or self.reveal_cards,
+                    in_turn and i == self.current_player,
+                ),
+            )
+
+        regions["board"] = (
+            lay.board_rect,
+            (self.board_visible_count, tuple(map(repr, self.board_all))),
+        )
+
+        regions["hud"] = (
+            lay.hud_rect,
+            (self.pot, self.round_index, self.bot_difficulty),
+        )
+        regions["log"] = (
+            lay.log_rect,
+            self.log.hud_key,
+        )
+
+        footer: Tuple = (self.state,)
+        if in_turn:
+            footer += (
+                self.to_call_amount(self.current_player),
+                self.min_raise_amount(),
+                self.can_allin_now(),
+            )
+        if self.players and len(self.players) > self.hero_index:
+            footer += (self.players[self.hero_index].stack,)
+        regions["footer"] = (lay.footer_rect, footer)
+
+        regions["banner"] = (
+            lay.banner_rect,
+            self.banner_text if self.banner_timer > 0 else "",
+        )
+        regions["winner"] = (
+            lay.winner_rect,
+            self.last_winner_text if face_up_all else "",
+        )
+
+        keypad: Tuple = (self.keypad_visible,)
+        if self.keypad_visible:
+            keypad += (
+                self.keypad_value,
+                self.to_call_amount(self.current_player) if in_turn else 0,
+                self.min_raise_amount(),
+                self.can_allin_now(),
+            )
+        regions["keypad"] = (pygame.Rect(self.keypad_rect), keypad)
+
+        if self.history_page is not None:
+            regions["history"] = (lay.history_rect, (self.history_page, self.log.seq))
+        return regions
+
+    def collect_dirty(self) -> List[pygame.Rect]:
+        """
+        Compara las regiones con las del frame anterior y devuelve los
+        rects a redibujar (ya recortados a pantalla y agrupados).
+        """
+        regions = self.scene_regions()
+        screen_rect = self.screen.get_rect()
+
+        if self._full_redraw:
+            dirty = [screen_rect]
+        else:
+            dirty = list(self._forced)
+            for key in regions.keys() | self._regions.keys():
+                new = regions.get(key)
+                old = self._regions.get(key)
+                if new is not None and old is not None and new[1] == old[1] and new[0] == old[0]:
+                    continue
+                for reg in (old, new):
+                    if reg is not None and reg[0].w > 0 and reg[0].h > 0:
+                        dirty.append(reg[0])
+
+        self._regions = regions
+        self._forced = []
+        self._full_redraw = False
+
+        dirty = [r.clip(screen_rect) for r in dirty]
+        dirty = [r for r in dirty if r.w > 0 and r.h > 0]
+        if len(dirty) > MAX_DIRTY_RECTS:
+            dirty = [dirty[0].unionall(dirty[1:])]
+        return dirty
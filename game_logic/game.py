@@ -1,13 +1,15 @@
 # game_logic/game.py
 from __future__ import annotations
 
-from typing import List, Optional, Set
+from typing import List, Optional, Tuple
 import sys
+import logging
 import pygame
 
-from config import WIDTH, HEIGHT, FPS, MED, BIG_BLIND  # ⬅ sin punto
-from cards import Deck, Card                           # ⬅ sin punto
-from player import Player                              # ⬅ sin punto
+from config import (                                   # ⬅ sin punto
+    WIDTH, HEIGHT, FPS, MED, RESIZABLE, IDLE_WAIT_MS, MAX_FRAME_MS, PROFILE_CSV,
+    HAND_RECORD_PATH,
+)
 from ui import Button                                  # ⬅ sin punto
 
 from .logger import LoggerMixin
@@ -16,7 +18,12 @@ from .keypad import KeypadMixin
 from .betting import BettingMixin
 from .showdown import ShowdownMixin
 from .renderer import RendererMixin
+from .dirty import DirtyRectMixin
+from .sprites import SpriteCache
 from .state import StateMixin
+from .mcts import MCTSBot, BotPool
+from .hand_record import HandRecorder
+from .profiler import FrameProfiler
 
 
 class Game(
@@ -26,6 +33,7 @@ class Game(
     BettingMixin,
     ShowdownMixin,
     RendererMixin,
+    DirtyRectMixin,
     StateMixin,
 ):
     """
@@ -34,14 +42,39 @@ class Game(
     - flujo de rondas
     - apuestas humano/bots
     - HUD/render
+
+    Con 'surface' dibuja en esa Surface sin abrir ventana; así funciona
+    con SDL_VIDEODRIVER=dummy (exportar frames) y como mesa de una sesión
+    multi-mesa (game_logic.multitable). La geometría sale del tamaño de
+    la superficie (ver game_logic.layout).
+
+    'sprites' y 'bot_pool' permiten compartir entre varias mesas del
+    mismo proceso la caché de sprites y el executor donde deciden los
+    bots (la mesa no se bloquea mientras su bot piensa). Sin 'bot_pool',
+    la partida de ventana crea el suyo; con 'surface' los bots deciden
+    en línea.
+
+    'record_hands': fichero donde la partida de ventana graba sus manos
+    (ver game_logic.hand_record); None = no grabar.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        surface: Optional[pygame.Surface] = None,
+        sprites: Optional[SpriteCache] = None,
+        bot_pool: Optional[BotPool] = None,
+        record_hands: Optional[str] = HAND_RECORD_PATH,
+    ) -> None:
         pygame.init()
-        pygame.display.set_caption("Texas Hold’em")
 
         # Pygame core
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        self.headless: bool = surface is not None
+        if surface is not None:
+            self.screen = surface
+        else:
+            pygame.display.set_caption("Texas Hold’em")
+            flags = pygame.RESIZABLE if RESIZABLE else 0
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont(pygame.font.get_default_font(), 18)
         self.midfont = pygame.font.SysFont(
@@ -53,15 +86,16 @@ class Game(
         self.titlefont = pygame.font.SysFont(
             pygame.font.get_default_font(), 44, bold=True
         )
+        self.sprites = sprites if sprites is not None else SpriteCache(self.midfont)
 
         # Estado general
         self.state: str = "LOBBY"
         self.num_bots: int = 4
         self.bot_difficulty: str = MED
-
-        self.players: List[Player] = []
-        self.hero_index: int = 0
-        self.dealer_index: int = 0
+        self.reveal_cards: bool = False  # mostrar todas las cartas (replays)
+        # ratón en coordenadas de esta mesa si no coinciden con las de la
+        # ventana (mosaico multi-mesa); None = pygame.mouse.get_pos()
+        self.mouse_pos: Optional[Tuple[int, int]] = None
 
         self.buttons: List[Button] = []
 
@@ -70,47 +104,119 @@ class Game(
         self.keypad_value: int = 0
         self.keypad_rect: pygame.Rect = pygame.Rect(0, 0, 0, 0)
 
-        # ronda / board
-        self.round_index: int = 0
-        self.deck: Optional[Deck] = None
-        self.board_all: List[Card] = []
-        self.board_visible_count: int = 0
-        self.board: List[Card] = []
-
-        # apuestas
-        self.pot: int = 0
-        self.current_bet: int = 0
-        self.current_player: int = 0
-        self.last_raiser: Optional[int] = None
-        self.last_raise_size: int = BIG_BLIND
-
-        # calle actual
-        self.first_to_act: int = 0
-        self.acted_set: Set[int] = set()
-        self.had_aggression: bool = False
-        self.pending_to_act: Set[int] = set()
-
-        # feedback visual / timers
-        self.bot_think_timer: float = 0.0
-        self.bot_pause_timer: float = 0.0
-        self.banner_text: str = ""
-        self.banner_timer: float = 0.0
-        self.log: List[str] = []
-        self.last_winner_text: str = ""
-        self._advancing: bool = False  # para proteger proceed_round
+        # historial completo (None = oculto; si no, página desde la más reciente)
+        self.history_page: Optional[int] = None
+
+        self.init_table_state()
+        self.action_listeners.append(self.announce_action)
+        if surface is None and record_hands:
+            # la partida de ventana graba sus manos; multi-mesa lo hace por mesa
+            self.set_hand_recorder(HandRecorder(record_hands))
+        self.init_dirty()
+        # la partida de ventana usa su propio pool: MCTS no congela la UI;
+        # con 'surface' y sin pool (exportar frames) se decide en línea
+        self.owns_bot_pool: bool = bot_pool is None and surface is None
+        self.bot_pool = BotPool() if self.owns_bot_pool else bot_pool
+        self.mcts_bot = MCTSBot()
+        self.profiler = FrameProfiler()
 
         self.make_lobby_buttons()
 
     # --- main loop ---
     def run(self) -> None:
         while True:
-            self.clock.tick(FPS)
-            for event in pygame.event.get():
+            events, dt = next_events(self.clock, self.is_idle())
+            self.profiler.begin_frame()
+            for event in events:
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                for b in list(self.buttons):
-                    b.handle(event)
-
-            self.update()
-            self.draw()
+                    self.quit()
+                if event.type == pygame.VIDEORESIZE:
+                    self.on_resize(event.w, event.h)
+                self.handle_event(event)
+            self.frame(dt)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.invalidate()
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_F3:
+                self.profiler.toggle()
+                self.profiler.begin_frame()
+            elif event.key == pygame.K_h and self.state != "LOBBY":
+                self.toggle_history()
+            elif event.key == pygame.K_ESCAPE:
+                self.history_page = None
+            elif event.key == pygame.K_PAGEUP:
+                self.scroll_history(+1)
+            elif event.key == pygame.K_PAGEDOWN:
+                self.scroll_history(-1)
+        if self.history_page is not None and event.type == pygame.MOUSEBUTTONDOWN:
+            return  # el historial tapa la mesa: no pasar clics
+        for b in list(self.buttons):
+            b.handle(event)
+
+    def frame(self, dt: float) -> List[pygame.Rect]:
+        """
+        Avanza 'dt' ms y dibuja; devuelve los rects que cambiaron.
+        """
+        with self.profiler.section("update"):
+            self.update(min(dt, MAX_FRAME_MS))
+        dirty = self.draw()
+        self.profiler.end_frame(dt)
+        return dirty
+
+    def on_resize(self, w: int, h: int) -> None:
+        # el layout está pensado para WIDTH x HEIGHT o más
+        if w < WIDTH or h < HEIGHT:
+            pygame.display.set_mode((max(w, WIDTH), max(h, HEIGHT)), pygame.RESIZABLE)
+        self.screen = pygame.display.get_surface()
+        self.relayout()
+
+    def shutdown(self, profile_csv: str = PROFILE_CSV) -> None:
+        if self.owns_bot_pool:
+            self.bot_pool.shutdown()
+        if self.profiler.recorded:
+            self.profiler.dump_csv(profile_csv)
+            logging.info(f"[perfil] {len(self.profiler.frames)} frames guardados en {profile_csv}")
+
+    def quit(self) -> None:
+        self.shutdown()
+        pygame.quit()
+        sys.exit()
+
+    def pointer(self) -> Tuple[int, int]:
+        return self.mouse_pos if self.mouse_pos is not None else pygame.mouse.get_pos()
+
+    def is_idle(self) -> bool:
+        """
+        True si el próximo frame sería igual al actual salvo por un evento:
+        sin banner, sin pausa/turno de bot y sin la animación del lobby.
+        """
+        if self.state == "LOBBY" or self.banner_timer > 0:
+            return False
+        if self.state == "BOT_PAUSE":
+            return False
+        if self.state == "BETTING":
+            i = self.current_player
+            p = self.players[i]
+            # espera al humano; cualquier otra cosa la resuelve update()
+            return (
+                p.is_human
+                and self.is_pending(i)
+                and not (p.folded or p.all_in)
+                and not self.street_should_end()
+            )
+        return True
+
+
+def next_events(clock: pygame.time.Clock, idle: bool) -> Tuple[List[pygame.event.Event], int]:
+    """
+    Eventos del próximo frame y ms transcurridos. Si no hay nada que
+    animar duerme hasta un evento (o IDLE_WAIT_MS) en vez de ir a FPS.
+    """
+    if idle:
+        first = pygame.event.wait(IDLE_WAIT_MS)
+        events = [] if first.type == pygame.NOEVENT else [first]
+        events += pygame.event.get()
+        return events, clock.tick()
+    return pygame.event.get(), clock.tick(FPS)
@@ -0,0 +1,81 @@
+# game_logic/hand_record.py
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from cards import card_to_int
+
+from .rules import ActionEvent
+
+HandRecord = Dict[str, Any]
+
+# tipo de ActionEvent -> (kind de apply_action, usa la apuesta como amount)
+REPLAY_KINDS: Dict[str, str] = {
+    "fold": "fold",
+    "check": "call",
+    "call": "call",
+    "raise": "raise_to",
+    "allin": "allin",
+}
+
+
+class HandRecorder:
+    """
+    Graba cada mano jugada como una línea JSON con lo necesario para
+    repetirla tal cual (replay_export.py --hands):
+
+        {"hand": 12, "dealer": 3, "hero": 0, "blinds": [10, 20],
+         "players": [["Tú", 500], ["Bot 1", 480], ...],   # stacks antes de ciegas
+         "deck": [37, 5, ...],                            # orden de la baraja (card_to_int)
+         "actions": [[3, "raise", 50], [4, "call", 50], ...],
+         "stacks": [...]}                                 # stacks al terminar
+
+    Cada acción es un ActionEvent (asiento, tipo, apuesta total de la
+    calle), tal como lo emite BettingMixin.apply_action.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.current: Optional[HandRecord] = None
+
+    def begin(self, state) -> None:
+        """
+        Tras repartir y antes de las ciegas (StateMixin.start_hand).
+        """
+        self.current = {
+            "hand": state.hand_no,
+            "dealer": state.dealer_index,
+            "hero": state.hero_index,
+            "blinds": [state.small_blind, state.big_blind],
+            "players": [[p.name, p.stack] for p in state.players],
+            "deck": [card_to_int(c) for c in state.deck.cards],
+            "actions": [],
+        }
+
+    def on_action(self, ev: ActionEvent) -> None:
+        if self.current is not None:
+            self.current["actions"].append([ev.seat, ev.kind, ev.bet])
+
+    def end(self, state) -> None:
+        """
+        Al repartir el bote: añade la mano al fichero.
+        """
+        if self.current is None:
+            return
+        self.current["stacks"] = [p.stack for p in state.players]
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(self.current, ensure_ascii=False, separators=(",", ":")) + "\n")
+        except OSError as e:
+            logging.warning(f"[hands] no se pudo grabar la mano en {self.path}: {e}")
+        self.current = None
+
+
+def load_hands(path: str) -> List[HandRecord]:
+    """
+    Manos grabadas por HandRecorder, en orden.
+    """
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
@@ -2,22 +2,18 @@ from __future__ import annotations
 
 import pygame
 
-from config import WIDTH, HEIGHT, BIG_BLIND
 from utils import clamp
 from ui import Button
 
+from .rules import allin_open, raise_cap, legal_actions
+
 class KeypadMixin:
     # --- keypad modal ---
     def open_keypad(self) -> None:
-        p = self.players[self.current_player] if self.players else None
-        if (
-            not p
-            or (self.state not in ("BETTING", "BOT_PAUSE"))
-            or p.folded
-            or p.all_in
-            or p.stack <= 0
-            or self.current_player not in self.pending_to_act
-        ):
+        if not self.players or self.state not in ("BETTING", "BOT_PAUSE"):
+            return
+        legal = legal_actions(self, self.current_player)
+        if legal is None or self.players[self.current_player].stack <= 0:
             return
         self.keypad_visible = True
         self.keypad_value = max(
@@ -26,37 +22,25 @@ class KeypadMixin:
         self.make_keypad_buttons()
 
     def can_allin_now(self) -> bool:
-        return (
-            self.round_index == 2
-            and self.state in ("BETTING", "BOT_PAUSE")
-            and len(self.board) == 5
-        )
+        return allin_open(self)
 
     def pre_river_cap_target(self, idx: int, proposed_target: int) -> int:
         if self.can_allin_now():
             return proposed_target
-        p = self.players[idx]
-        to_call = self.to_call_amount(idx)
-
-        cap_by_rule = p.bet + to_call + min(self.pot, 4 * BIG_BLIND)
-        cap_by_floor = p.bet + max(0, p.stack - BIG_BLIND)
-        legal_max = max(self.current_bet, min(cap_by_rule, cap_by_floor))
         legal_min = self.current_bet + 1
-        return int(clamp(proposed_target, legal_min, legal_max))
+        return int(clamp(proposed_target, legal_min, raise_cap(self, idx)))
 
     def make_keypad_buttons(self) -> None:
         self.buttons = []
 
-        panel_w, panel_h = 480, 240
-        self.keypad_rect = pygame.Rect(
-            WIDTH // 2 - panel_w // 2,
-            HEIGHT // 2 - panel_h // 2,
-            panel_w,
-            panel_h,
-        )
+        lay = self.layout
+        self.keypad_rect = pygame.Rect(lay.keypad_rect)
 
-        def legal_min_target() -> int:
-            return max(self.current_bet + self.min_raise_amount(), self.current_bet + 1)
+        legal = legal_actions(self, self.current_player)
+        if legal is None:
+            # ya no le toca: el keypad no tiene nada que ofrecer
+            self.close_keypad()
+            return
 
         def set_target(val: int) -> None:
             try:
@@ -64,25 +48,13 @@ class KeypadMixin:
             except Exception:
                 self.keypad_value = max(0, self.current_bet + self.min_raise_amount())
 
-        def capped_max_target() -> int:
-            p = self.players[self.current_player]
-            if self.can_allin_now():
-                return p.bet + p.stack
-            return self.pre_river_cap_target(
-                self.current_player,
-                p.bet + p.stack - 1,
-            )
-
-        to_call = (
-            self.to_call_amount(self.current_player)
-            if self.state in ("BETTING", "BOT_PAUSE")
-            else 0
+        to_call = legal.to_call
+        min_target = legal.min_raise_to
+        max_target = max(legal.max_raise_to, min_target)
+        pot_sized = legal.clamp_raise(
+            self.players[self.current_player].bet + to_call + max(0, self.pot)
         )
-        p = self.players[self.current_player]
-        pot = max(0, self.pot)
-        min_target = legal_min_target()
-        pot_sized = p.bet + to_call + pot
-        allin_total = p.bet + p.stack
+        allin_total = legal.allin_to
 
         def do_equal() -> None:
             self.close_keypad()
@@ -92,19 +64,16 @@ class KeypadMixin:
             set_target(max(min_target, self.keypad_value - self.min_raise_amount()))
 
         def more_bb() -> None:
-            set_target(min(capped_max_target(), self.keypad_value + self.min_raise_amount()))
+            set_target(min(max_target, self.keypad_value + self.min_raise_amount()))
 
         def set_pot() -> None:
-            set_target(min(capped_max_target(), pot_sized))
+            set_target(pot_sized)
 
         def set_allin() -> None:
             set_target(allin_total)
 
         def ok() -> None:
-            target = max(self.keypad_value, min_target)
-            if not self.can_allin_now():
-                target = self.pre_river_cap_target(self.current_player, target)
-            target = min(target, capped_max_target())
+            target = min(max(self.keypad_value, min_target), max_target)
 
             self.close_keypad()
             if to_call > 0 and target <= self.current_bet:
@@ -115,39 +84,26 @@ class KeypadMixin:
         def cancel() -> None:
             self.close_keypad()
 
-        r = self.keypad_rect
-        y1 = r.y + 86
-        y2 = y1 + 56
-        x = r.x + 16
-        w = 96
-        gap = 12
+        row = iter(lay.keypad_row)
 
         if to_call > 0:
             self.buttons.append(
-                Button((x, y1, w, 44), "Igualar", do_equal, small=True)
+                Button(next(row), "Igualar", do_equal, small=True)
             )
-            x += w + gap
-
-        self.buttons.append(Button((x, y1, w, 44), "−BB", less_bb, small=True))
-        x += w + gap
-        self.buttons.append(Button((x, y1, w, 44), "+BB", more_bb, small=True))
-        x += w + gap
-        self.buttons.append(Button((x, y1, w, 44), "Pote", set_pot, small=True))
-        x += w + gap
+
+        self.buttons.append(Button(next(row), "−BB", less_bb, small=True))
+        self.buttons.append(Button(next(row), "+BB", more_bb, small=True))
+        self.buttons.append(Button(next(row), "Pote", set_pot, small=True))
         self.buttons.append(
             Button(
-                (x, y1, w, 44),
-                "All-in" if self.can_allin_now() else "All-in (cap)",
+                next(row),
+                "All-in" if legal.can_allin else "All-in (cap)",
                 set_allin,
                 small=True,
             )
         )
-        self.buttons.append(
-            Button((r.centerx - 54, y2, 108, 48), "OK", ok, small=True)
-        )
-        self.buttons.append(
-            Button((r.right - 116, y2, 100, 48), "Cerrar", cancel, small=True)
-        )
+        self.buttons.append(Button(lay.keypad_ok, "OK", ok, small=True))
+        self.buttons.append(Button(lay.keypad_close, "Cerrar", cancel, small=True))
 
     def close_keypad(self) -> None:
         self.keypad_visible = False
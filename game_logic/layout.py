@@ -0,0 +1,133 @@
+# game_logic/layout.py
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import List, Tuple
+
+import pygame
+
+from config import CARD_W, CARD_H, FOOTER_H
+
+Point = Tuple[int, int]
+Size = Tuple[int, int]
+
+
+class TableLayout:
+    """
+    Geometría de la pantalla para (número de asientos, resolución):
+    asientos, anclas de cartas, HUD, footer, botones, keypad y lobby.
+
+    Se calcula una sola vez por clave (ver table_layout); todo lo que
+    dibuja o crea botones lee de aquí en vez de rehacer las cuentas.
+    Los Rect son compartidos: copiarlos antes de modificarlos.
+    """
+
+    def __init__(self, n_seats: int, size: Size) -> None:
+        w, h = size
+        self.n_seats = n_seats
+        self.size = size
+        self.cx = w // 2
+        self.screen_rect = pygame.Rect(0, 0, w, h)
+
+        # --- asientos ---
+        self.player_y = h - FOOTER_H - CARD_H - 28
+        self.bot_max_y = self.player_y - CARD_H - 60
+        self.seats: List[Point] = self._seat_positions(n_seats, w, h)
+        # topleft de las dos hole cards de cada asiento
+        self.hole_cards: List[Tuple[Point, Point]] = [
+            ((sx - CARD_W - 10, sy - 6 - CARD_H // 2), (sx + 10, sy - 6 - CARD_H // 2))
+            for sx, sy in self.seats
+        ]
+        self.seat_rects: List[pygame.Rect] = [
+            pygame.Rect(sx - 120, sy - 70, 240, 164) for sx, sy in self.seats
+        ]
+
+        # --- board ---
+        gap = CARD_W + 18
+        bx, by = self.cx - 2 * gap, h // 2 - 28 - CARD_H // 2
+        self.board_slots: List[Point] = [(bx + i * gap, by) for i in range(5)]
+        self.board_rect = pygame.Rect(bx, by, 4 * gap + CARD_W, CARD_H)
+
+        # --- HUD ---
+        self.pot_pos: Point = (24, 20)
+        self.phase_pos: Point = (24, 56)
+        self.difficulty_pos: Point = (24, 80)
+        self.hud_rect = pygame.Rect(0, 0, 420, 104)
+        self.log_pos: Point = (24, 110)
+        self.log_rect = pygame.Rect(0, 104, w // 2, 126)
+        self.banner_rect = pygame.Rect(self.cx - 320, 88, 640, 52)
+        self.winner_center: Point = (self.cx, h - FOOTER_H - 40)
+        self.winner_rect = pygame.Rect(0, h - FOOTER_H - 60, w, 40)
+        self.profiler_rect = pygame.Rect(w - 328, 8, 320, 288)
+
+        # --- footer ---
+        fy = h - FOOTER_H
+        self.footer_rect = pygame.Rect(0, fy, w, FOOTER_H)
+        self.to_call_pos: Point = (20, fy + 10)
+        self.min_raise_pos: Point = (20, fy + 34)
+        self.max_raise_pos: Point = (20, fy + 54)
+        self.hero_stack_br: Point = (w - 24, fy + 60)
+        # Retirarse / Igualar / Aumentar / All-in / Menu
+        self.action_buttons: List[pygame.Rect] = [
+            pygame.Rect(self.cx - 430 + k * 170, fy + 18, 150, 48) for k in range(5)
+        ]
+        self.continue_button = pygame.Rect(self.cx - 100, fy + 18, 200, 48)
+        self.continue_menu_button = pygame.Rect(self.cx + 320, fy + 18, 150, 48)
+
+        # --- keypad ---
+        kp = self.keypad_rect = pygame.Rect(self.cx - 240, h // 2 - 120, 480, 240)
+        # fila de hasta 5 botones chicos; se usan desde la izquierda
+        self.keypad_row: List[pygame.Rect] = [
+            pygame.Rect(kp.x + 16 + k * 108, kp.y + 86, 96, 44) for k in range(5)
+        ]
+        self.keypad_ok = pygame.Rect(kp.centerx - 54, kp.y + 142, 108, 48)
+        self.keypad_close = pygame.Rect(kp.right - 116, kp.y + 142, 100, 48)
+
+        # --- historial (tecla H) ---
+        self.history_rect = pygame.Rect(self.cx - 380, 60, 760, h - FOOTER_H - 80)
+        self.history_per_page = (self.history_rect.h - 64) // 20
+
+        # --- lobby ---
+        self.lobby_title: Point = (self.cx, 120)
+        self.lobby_cards: List[Point] = [(self.cx - 2 * gap + i * gap, 220) for i in range(5)]
+        self.lobby_cards_rect = pygame.Rect(
+            self.cx - 2 * gap - 12, 212, 4 * gap + CARD_W + 24, CARD_H + 16
+        )
+        self.lobby_values_rect = pygame.Rect(self.cx - 180, 330, 360, 150)
+        self.lobby_labels: List[Point] = [
+            (self.cx, 350), (self.cx, 380), (self.cx, 430), (self.cx, 460)
+        ]
+        # - / + / < / > / Empezar
+        self.lobby_buttons: List[pygame.Rect] = [
+            pygame.Rect(self.cx - 240, 340, 56, 56),
+            pygame.Rect(self.cx + 184, 340, 56, 56),
+            pygame.Rect(self.cx - 240, 420, 56, 56),
+            pygame.Rect(self.cx + 184, 420, 56, 56),
+            pygame.Rect(self.cx - 140, 520, 280, 64),
+        ]
+
+    def _seat_positions(self, n_seats: int, w: int, h: int) -> List[Point]:
+        # héroe abajo al centro; bots repartidos en un arco superior
+        pos = [(self.cx, self.player_y)]
+        nb = n_seats - 1
+        cx, cy = self.cx, h // 2 - 20
+        rx, ry = (w - 440) // 2, (h - 300) // 2
+        a0 = math.radians(190)
+        a1 = math.radians(350)
+        for k in range(nb):
+            t = (k + 1) / (nb + 1)
+            ang = a0 + (a1 - a0) * t
+            x = int(cx + rx * math.cos(ang))
+            y = int(cy + ry * math.sin(ang))
+            pos.append((x, min(y, self.bot_max_y)))
+        return pos
+
+
+@lru_cache(maxsize=32)
+def table_layout(n_seats: int, size: Size) -> TableLayout:
+    """
+    Layout compartido para (asientos, resolución): sólo se recalcula
+    cuando cambia la composición de la mesa o el tamaño de la ventana.
+    """
+    return TableLayout(n_seats, size)
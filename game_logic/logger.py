@@ -1,9 +1,20 @@
 # game/logger.py
 from __future__ import annotations
+import json
 import logging
 
 from config import BANNER_MS   # estaba como .config, pásalo así
 
+from .rules import ActionEvent
+
+ACTION_LABELS = {
+    "fold": "se retira",
+    "check": "pasa",
+    "call": "iguala",
+    "raise": "sube a {bet}",
+    "allin": "va all-in",
+}
+
 
 class LoggerMixin:
     # --- logging helpers / UI status ---
@@ -17,29 +28,34 @@ class LoggerMixin:
         self.banner_text = (who + ": " + text) if who else text
         self.banner_timer = float(BANNER_MS)
 
+    def announce_action(self, ev: ActionEvent) -> None:
+        """
+        Suscriptor de apply_action: banner + línea de log.
+        """
+        label = ACTION_LABELS[ev.kind].format(bet=ev.bet)
+        name = self.players[ev.seat].name
+        self.banner(label, who=name)
+        self.push_log(f"{name}: {label}.")
+
     def push_log(self, msg: str) -> None:
-        self.log.append(msg)
+        self.log.append(msg, self.hand_no, self.round_label())
         try:
             logging.info(f"[{self.round_label()}] {msg}")
         except Exception:
             pass
 
     def dump_state(self, tag: str = "") -> None:
+        """
+        Registra sólo lo que cambió desde el último volcado (con keyframe
+        completo cada KEYFRAME_EVERY versiones; ver state_delta).
+        """
         try:
-            stacks = [p.stack for p in self.players]
-            bets = [p.bet for p in self.players]
-            folds = [p.folded for p in self.players]
-            allins = [p.all_in for p in self.players]
-            who = (
-                self.players[self.current_player].name
-                if 0 <= self.current_player < len(self.players)
-                else "?"
-            )
+            msg = self.state_delta.update(self)
+            if msg is None:
+                return
             logging.info(
-                f"[STATE {tag}] round={self.round_index}({self.round_label()}) "
-                f"pot={self.pot} current_bet={self.current_bet} current_player={who} "
-                f"stacks={stacks} bets={bets} folded={folds} allin={allins} "
-                f"pending={sorted(list(self.pending_to_act))}"
+                f"[STATE {tag}] {json.dumps(msg, ensure_ascii=False, separators=(',', ':'))} "
+                f"pending={self.seats_in(self.pending_mask)}"
             )
         except Exception:
             pass
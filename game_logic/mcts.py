@@ -0,0 +1,239 @@
+# game_logic/mcts.py
+from __future__ import annotations
+
+import math
+import random
+import time
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from config import MCTS_TIME_MS, MCTS_MAX_NODES
+from cards import CARDS, DeadCardSampler, card_to_int
+
+from .table import Table
+from .rules import legal_actions
+
+Choice = Tuple[str, int]
+ActionKey = Tuple[int, str, int]
+
+
+class _Node:
+    __slots__ = ("choice", "children", "untried", "n", "w")
+
+    def __init__(self, choice: Optional[Choice] = None) -> None:
+        self.choice = choice                        # acción que llevó aquí
+        self.children: Dict[ActionKey, _Node] = {}  # por (asiento, tipo, apuesta)
+        self.untried: Optional[List[Choice]] = None
+        self.n = 0
+        self.w = 0.0
+
+
+class MCTSBot:
+    """
+    Bot de Monte Carlo Tree Search (open-loop, con determinizaciones).
+
+    En cada playout:
+      1. copia la mesa (table.Table.snapshot) y muestrea las cartas
+         ocultas de los rivales y el resto del board;
+      2. baja por el árbol con UCT en los nodos propios (fold/call/
+         subidas discretas/all-in de rules.legal_actions) y con la
+         política heurística en los ajenos;
+      3. expande un nodo y termina la mano con los bots heurísticos;
+      4. propaga la ganancia de fichas del asiento.
+
+    El árbol se reutiliza entre llamadas de la misma calle de la misma
+    mano, bajando por las acciones que ocurrieron desde la raíz.
+    """
+
+    def __init__(
+        self,
+        time_ms: int = MCTS_TIME_MS,
+        max_nodes: int = MCTS_MAX_NODES,
+        exploration: float = 1.2,
+    ) -> None:
+        self.time_ms = time_ms
+        self.max_nodes = max_nodes
+        self.exploration = exploration
+
+        self.root: Optional[_Node] = None
+        self._root_key: Optional[Tuple[int, int, int]] = None
+        self._root_len: int = 0
+        self.nodes: int = 0
+        self.sampler = DeadCardSampler()  # cartas vivas para el asiento que decide
+
+        # throughput de la última decisión
+        self.last_playouts: int = 0
+        self.last_ms: float = 0.0
+        self.playouts_per_sec: float = 0.0
+
+    # --- API ---
+    def decide(self, game, idx: int) -> Choice:
+        """
+        Devuelve (acción, cantidad) como ai.bot_decision() para el asiento idx.
+        """
+        root = self._reuse(game, idx)
+        self.sampler.set_dead(card_to_int(c) for c in game.players[idx].hole + game.board)
+        t0 = time.perf_counter()
+        deadline = t0 + self.time_ms / 1000.0
+        n = 0
+        while True:
+            self._playout(game, idx, root)
+            n += 1
+            if root.untried:
+                continue
+            if self.nodes >= self.max_nodes or time.perf_counter() >= deadline:
+                break
+
+        self.last_playouts = n
+        self.last_ms = (time.perf_counter() - t0) * 1000.0
+        self.playouts_per_sec = n / max(1e-9, self.last_ms / 1000.0)
+        logging.info(
+            f"[MCTS] {game.players[idx].name}: {n} playouts en {self.last_ms:.0f} ms "
+            f"({self.playouts_per_sec:.0f}/s), nodos={self.nodes}"
+        )
+
+        best = max(root.children.values(), key=lambda c: c.n)
+        return best.choice
+
+    # --- árbol ---
+    def _reuse(self, game, idx: int) -> _Node:
+        # un MCTSBot por mesa: la clave no necesita la identidad de la mesa
+        # (con BotPool, 'game' es una copia nueva en cada decisión)
+        key = (game.hand_no, game.round_index, idx)
+        node = self.root if key == self._root_key else None
+        if node is not None:
+            for rec in game.street_actions[self._root_len:]:
+                node = node.children.get(rec)
+                if node is None:
+                    break
+
+        if node is None:
+            node = _Node()
+        self.root = node
+        self._root_key = key
+        self._root_len = len(game.street_actions)
+        self.nodes = self._count(node)
+        return node
+
+    @staticmethod
+    def _count(node: _Node) -> int:
+        total, stack = 0, [node]
+        while stack:
+            nd = stack.pop()
+            total += 1
+            stack.extend(nd.children.values())
+        return total
+
+    def _select(self, node: _Node) -> _Node:
+        log_n = math.log(max(1, node.n))
+        c = self.exploration
+        return max(
+            node.children.values(),
+            key=lambda ch: ch.w / ch.n + c * math.sqrt(log_n / ch.n),
+        )
+
+    @staticmethod
+    def choices(sim: Table, idx: int) -> List[Choice]:
+        """
+        Acciones discretas legales del asiento idx (rules.legal_actions):
+        fold si hay que pagar, call/check, subida mínima, media pote,
+        pote y all-in (sólo river).
+        """
+        legal = legal_actions(sim, idx)
+        return legal.choices() if legal is not None else [("call", 0)]
+
+    # --- playout ---
+    def _determinize(self, sim: Table, idx: int) -> None:
+        # rivales y resto del board salen de las cartas vivas de idx (sampler)
+        opps = [
+            p for j, p in enumerate(sim.players)
+            if j != idx and len(p.hole) == 2 and not p.folded
+        ]
+        unknown = [CARDS[c] for c in self.sampler.sample(2 * len(opps) + 5 - len(sim.board))]
+        k = 0
+        for p in opps:
+            p.hole = unknown[k:k + 2]
+            k += 2
+        sim.board_all = sim.board + unknown[k:]
+
+    def _playout(self, game, idx: int, root: _Node) -> None:
+        sim = Table.snapshot(game, light=True)
+        self._determinize(sim, idx)
+        hero = sim.players[idx]
+        stack0 = hero.stack
+        scale = float(max(1, stack0 + sim.pot))
+
+        node = root
+        path = [root]
+        in_tree = True
+        while sim.state in ("BETTING", "BOT_PAUSE", "ROUND_PAUSE"):
+            if sim.state == "ROUND_PAUSE":
+                sim.continue_after_pause()
+                continue
+            sim.state = "BETTING"
+            if not sim.settle_turn():
+                continue
+
+            seat = sim.current_player
+            if in_tree and seat == idx:
+                if node.untried is None:
+                    node.untried = self.choices(sim, idx)
+                    random.shuffle(node.untried)
+                if node.untried:
+                    choice = node.untried.pop()
+                else:
+                    choice = self._select(node).choice
+            else:
+                choice = sim.choose_bot_action(seat)
+
+            n_rec = len(sim.street_actions)
+            sim.apply_bot_action(*choice)
+            rec = (
+                sim.street_actions[-1]
+                if len(sim.street_actions) > n_rec
+                else (seat, "none", sim.players[seat].bet)
+            )
+            sim.advance_after_action()
+
+            if in_tree:
+                child = node.children.get(rec)
+                if child is None:
+                    child = _Node(choice)
+                    node.children[rec] = child
+                    self.nodes += 1
+                    in_tree = False
+                node = child
+                path.append(node)
+
+        reward = (hero.stack - stack0) / scale
+        for nd in path:
+            nd.n += 1
+            nd.w += reward
+
+
+class BotPool:
+    """
+    Decisiones de bot de una o varias mesas de un mismo proceso, fuera
+    del hilo de la UI: cada mesa encarga la suya con submit() sobre una copia de la
+    mesa (table.Table.snapshot) y la recoge en un frame posterior cuando
+    el futuro termina, así una búsqueda MCTS no congela el loop.
+
+    Cada mesa conserva su propio MCTSBot (y su árbol, aunque se cambie de
+    mesa); los hilos del executor se comparten entre todas.
+    """
+
+    def __init__(self, workers: int = 1) -> None:
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix="bots")
+
+    def submit(self, table, idx: int) -> "Future[Choice]":
+        """
+        Encarga la decisión del asiento idx; la mesa no debe cambiar
+        mientras tanto (es su turno de bot).
+        """
+        snap = Table.snapshot(table)
+        snap.mcts_bot = table.mcts_bot
+        return self.executor.submit(snap.choose_bot_action, idx)
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,207 @@
+# game_logic/multitable.py
+from __future__ import annotations
+
+import os
+import sys
+import math
+from typing import List, Optional, Tuple
+
+import pygame
+
+from config import WIDTH, HEIGHT, MAX_FRAME_MS, PROFILE_CSV, HAND_RECORD_PATH
+
+from .game import Game, next_events
+from .mcts import BotPool
+from .hand_record import HandRecorder
+
+MOUSE_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+OFF_TABLE: Tuple[int, int] = (-1, -1)  # ratón fuera de la mesa: sin hover
+
+
+class MultiTable:
+    """
+    Varias mesas independientes en un solo proceso y un solo loop.
+
+    Cada mesa es un Game que dibuja en su propia Surface (sin ventana);
+    todas comparten el evaluador y la tabla de fuerza (módulos ya
+    cargados), la caché de sprites y un BotPool (executor donde deciden
+    los bots, sin bloquear el loop). La ventana muestra:
+    - vista "cambiar": la mesa enfocada a pantalla completa;
+    - vista "mosaico": todas las mesas escaladas en una rejilla.
+
+    Teclas: Tab / 1..9 cambian de mesa, F2 alterna mosaico. El resto de
+    eventos van a la mesa enfocada; en mosaico un clic sobre otra mesa
+    la enfoca y los eventos de ratón (y el hover de cada mesa) se
+    trasladan a las coordenadas del tile.
+
+    Con 'record_hands' cada mesa graba sus manos en su propio fichero
+    (sufijo _1, _2, ... como los perfiles de frames).
+    """
+
+    def __init__(self, n_tables: int = 2, record_hands: Optional[str] = HAND_RECORD_PATH) -> None:
+        pygame.init()
+        pygame.display.set_caption("Texas Hold’em — multi-mesa")
+        self.window = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+        self.clock = pygame.time.Clock()
+
+        self.bot_pool = BotPool()
+        sprites = None
+        self.tables: List[Game] = []
+        for k in range(n_tables):
+            t = Game(pygame.Surface((WIDTH, HEIGHT)), sprites=sprites, bot_pool=self.bot_pool)
+            sprites = t.sprites
+            if record_hands:
+                # un fichero por mesa (hands_1.jsonl, ...): sin líneas entrelazadas
+                stem, ext = os.path.splitext(record_hands)
+                t.set_hand_recorder(HandRecorder(f"{stem}_{k + 1}{ext}"))
+            self.tables.append(t)
+
+        self.focus: int = 0
+        self.tiled: bool = False
+        self._full: bool = True  # recomponer toda la ventana en el próximo frame
+
+    # --- vista ---
+    @property
+    def focused(self) -> Game:
+        return self.tables[self.focus]
+
+    def set_focus(self, k: int) -> None:
+        if 0 <= k < len(self.tables) and k != self.focus:
+            self.focus = k
+            self.focused.invalidate()
+            self._full = True
+
+    def toggle_tiled(self) -> None:
+        self.tiled = not self.tiled
+        for t in self.tables:
+            t.mouse_pos = None  # a pantalla completa, ventana = mesa
+            t.invalidate()
+        self._full = True
+
+    def grid(self) -> Tuple[int, int]:
+        cols = math.ceil(math.sqrt(len(self.tables)))
+        rows = math.ceil(len(self.tables) / cols)
+        return cols, rows
+
+    def tile_rect(self, k: int) -> pygame.Rect:
+        cols, rows = self.grid()
+        w, h = self.window.get_size()
+        cw, ch = w // cols, h // rows
+        return pygame.Rect((k % cols) * cw, (k // cols) * ch, cw, ch)
+
+    def to_table_pos(self, pos: Tuple[int, int]) -> Tuple[Optional[int], Tuple[int, int]]:
+        """
+        (mesa, posición en coordenadas de esa mesa) para un punto de la
+        ventana: en mosaico se resta el origen del tile y se deshace su
+        escala; None si el punto no cae en ningún tile.
+        """
+        if not self.tiled:
+            return self.focus, pos
+        for k, t in enumerate(self.tables):
+            r = self.tile_rect(k)
+            if r.collidepoint(pos):
+                tw, th = t.screen.get_size()
+                return k, ((pos[0] - r.x) * tw // r.w, (pos[1] - r.y) * th // r.h)
+        return None, pos
+
+    def route_mouse(self, event: pygame.event.Event) -> None:
+        """
+        Eventos de ratón en mosaico: actualiza el ratón (hover) de cada
+        mesa en sus coordenadas, enfoca la mesa clicada y pasa el evento,
+        trasladado a su escala, a la mesa enfocada si está debajo.
+        """
+        k, pos = self.to_table_pos(event.pos)
+        for j, t in enumerate(self.tables):
+            t.mouse_pos = pos if j == k else OFF_TABLE
+        if k is None:
+            return
+        if k != self.focus:
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self.set_focus(k)
+            return
+        attrs = dict(event.dict, pos=pos)
+        if event.type == pygame.MOUSEMOTION:
+            r = self.tile_rect(k)
+            tw, th = self.focused.screen.get_size()
+            attrs["rel"] = (event.rel[0] * tw // r.w, event.rel[1] * th // r.h)
+        self.focused.handle_event(pygame.event.Event(event.type, attrs))
+
+    # --- loop ---
+    def run(self) -> None:
+        while True:
+            idle = all(t.is_idle() for t in self.tables)
+            events, dt = next_events(self.clock, idle)
+            for t in self.tables:
+                t.profiler.begin_frame()
+            for event in events:
+                self.handle_event(event)
+            self.frame(dt)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.QUIT:
+            self.quit()
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self._full = True
+            return
+        if event.type == pygame.VIDEORESIZE:
+            self.on_resize(event.w, event.h)
+            return
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_TAB:
+                self.set_focus((self.focus + 1) % len(self.tables))
+                return
+            if event.key == pygame.K_F2:
+                self.toggle_tiled()
+                return
+            if pygame.K_1 <= event.key <= pygame.K_9:
+                self.set_focus(event.key - pygame.K_1)
+                return
+        if self.tiled and event.type in MOUSE_EVENTS:
+            self.route_mouse(event)
+            return
+        self.focused.handle_event(event)
+
+    def frame(self, dt: float) -> None:
+        for t in self.tables:
+            with t.profiler.section("update"):
+                t.update(min(dt, MAX_FRAME_MS))
+
+        updates: List[pygame.Rect] = []
+        if self.tiled:
+            for k, t in enumerate(self.tables):
+                if t.draw() or self._full:
+                    r = self.tile_rect(k)
+                    self.window.blit(pygame.transform.smoothscale(t.screen, r.size), r)
+                    if k == self.focus:
+                        pygame.draw.rect(self.window, (230, 200, 80), r, 3)
+                    updates.append(r)
+        else:
+            t = self.focused
+            dirty = t.draw()
+            if self._full:
+                dirty = [t.screen.get_rect()]
+            for r in dirty:
+                self.window.blit(t.screen, r, r)
+            updates.extend(dirty)
+        self._full = False
+
+        if updates:
+            pygame.display.update(updates)
+        for t in self.tables:
+            t.profiler.end_frame(dt)
+
+    def on_resize(self, w: int, h: int) -> None:
+        w, h = max(w, WIDTH), max(h, HEIGHT)
+        self.window = pygame.display.set_mode((w, h), pygame.RESIZABLE)
+        for t in self.tables:
+            t.screen = pygame.Surface((w, h))
+            t.relayout()
+        self._full = True
+
+    def quit(self) -> None:
+        stem, _, ext = PROFILE_CSV.rpartition(".")
+        for k, t in enumerate(self.tables):
+            t.shutdown(f"{stem}_{k + 1}.{ext}")
+        self.bot_pool.shutdown()
+        pygame.quit()
+        sys.exit()
@@ -0,0 +1,205 @@
+# game_logic/profiler.py
+from __future__ import annotations
+
+import csv
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+from config import PROFILE_FRAMES
+
+# el panel se recalcula cada tantos frames (ordenar la ventana no es gratis)
+PANEL_EVERY: int = 15
+
+# orden de columnas en el overlay y en el CSV
+SECTIONS: Tuple[str, ...] = (
+    "update", "bot", "lobby", "draw_table", "draw_board",
+    "draw_players", "draw_hud", "buttons", "keypad", "overlay", "flip",
+)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    Percentil q (0..100) por rango más cercano; 0.0 si no hay valores.
+    """
+    if not values:
+        return 0.0
+    s = sorted(values)
+    k = max(0, min(len(s) - 1, int(round(q / 100.0 * len(s) + 0.5)) - 1))
+    return s[k]
+
+
+class _Section:
+    __slots__ = ("prof", "name", "t0")
+
+    def __init__(self, prof: "FrameProfiler", name: str) -> None:
+        self.prof = prof
+        self.name = name
+        self.t0 = 0.0
+
+    def __enter__(self) -> None:
+        self.t0 = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        cur = self.prof._current
+        if cur is not None:
+            ms = (time.perf_counter() - self.t0) * 1000.0
+            cur[self.name] = cur.get(self.name, 0.0) + ms
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+_NULL = _NullSection()
+
+
+class FrameProfiler:
+    """
+    Perfilador de frames integrado (F3):
+    - mide cada fase de update/draw con 'with prof.section(nombre)';
+    - guarda los últimos PROFILE_FRAMES frames (ventana móvil);
+    - overlay con p50/p95/p99 del frame, coste por sección e histograma;
+    - volcado a CSV (un frame por fila) al salir.
+
+    Mientras está desactivado no mide nada.
+    """
+
+    def __init__(self, window: int = PROFILE_FRAMES) -> None:
+        self.enabled: bool = False
+        self.frames: Deque[Dict[str, float]] = deque(maxlen=window)
+        self.frame_no: int = 0
+        self.recorded: int = 0
+        self._current: Optional[Dict[str, float]] = None
+        self._t0: float = 0.0
+        self._sections: Dict[str, _Section] = {}
+        self._panel: Optional[pygame.Surface] = None
+        self._panel_key: Optional[int] = None
+
+    def toggle(self) -> None:
+        self.enabled = not self.enabled
+        self._current = None
+        self._panel = None
+
+    @property
+    def panel_key(self) -> int:
+        # cambia cuando toca redibujar el panel
+        return self.frame_no // PANEL_EVERY
+
+    # --- medición ---
+    def begin_frame(self) -> None:
+        if self.enabled:
+            self._current = {}
+            self._t0 = time.perf_counter()
+
+    def end_frame(self, dt: float) -> None:
+        """
+        Cierra el frame. 'dt' es el tiempo de reloj desde el anterior
+        (incluye la espera del loop); 'total' es sólo trabajo.
+        """
+        cur = self._current
+        if cur is None:
+            return
+        cur["total"] = (time.perf_counter() - self._t0) * 1000.0
+        cur["dt"] = dt
+        self.frames.append(cur)
+        self._current = None
+        self.frame_no += 1
+        self.recorded += 1
+
+    def section(self, name: str):
+        if self._current is None:
+            return _NULL
+        sec = self._sections.get(name)
+        if sec is None:
+            sec = self._sections[name] = _Section(self, name)
+        return sec
+
+    # --- estadísticas ---
+    def column(self, name: str) -> List[float]:
+        return [f.get(name, 0.0) for f in self.frames]
+
+    def frame_percentiles(self) -> Tuple[float, float, float]:
+        totals = self.column("total")
+        return percentile(totals, 50), percentile(totals, 95), percentile(totals, 99)
+
+    def section_stats(self) -> Dict[str, Tuple[float, float]]:
+        """
+        {sección: (media ms, p95 ms)} en la ventana actual.
+        """
+        out = {}
+        n = max(1, len(self.frames))
+        for name in SECTIONS:
+            col = self.column(name)
+            out[name] = (sum(col) / n, percentile(col, 95))
+        return out
+
+    def histogram(self, bin_ms: float = 2.0, bins: int = 17) -> List[int]:
+        """
+        Cuántos frames caen en [i*bin_ms, (i+1)*bin_ms); el último
+        acumula todo lo que se pase.
+        """
+        hist = [0] * bins
+        for t in self.column("total"):
+            hist[min(bins - 1, int(t / bin_ms))] += 1
+        return hist
+
+    def dump_csv(self, path: str) -> None:
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(("frame", "dt", "total") + SECTIONS)
+            first = self.frame_no - len(self.frames)
+            for i, fr in enumerate(self.frames):
+                w.writerow(
+                    [first + i]
+                    + [f"{fr.get(k, 0.0):.3f}" for k in ("dt", "total") + SECTIONS]
+                )
+
+    # --- overlay ---
+    def draw(self, surf: pygame.Surface, font: pygame.font.Font, rect: pygame.Rect,
+             cache_hit_rate: float = 0.0) -> None:
+        with self.section("overlay"):
+            if self._panel is None or self._panel_key != self.panel_key:
+                self._panel = self._render_panel(font, rect.size, cache_hit_rate)
+                self._panel_key = self.panel_key
+            surf.blit(self._panel, rect.topleft)
+
+    def _render_panel(self, font: pygame.font.Font, size: Tuple[int, int],
+                      cache_hit_rate: float) -> pygame.Surface:
+        # texto sin TEXT_CACHE: los números cambian en cada panel
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+        w, h = size
+
+        p50, p95, p99 = self.frame_percentiles()
+        lines = [
+            f"frames {len(self.frames)}   p50 {p50:.2f}  p95 {p95:.2f}  p99 {p99:.2f} ms",
+            f"texto en caché: {cache_hit_rate * 100:.0f}%",
+        ]
+        for name, (mean, p) in self.section_stats().items():
+            lines.append(f"{name:<13}{mean:6.2f}  p95 {p:6.2f}")
+
+        y = 6
+        for ln in lines:
+            panel.blit(font.render(ln, True, (220, 230, 220)), (8, y))
+            y += 16
+
+        # histograma del tiempo de frame (2 ms por barra)
+        hist = self.histogram()
+        top = max(1, max(hist))
+        bw = (w - 16) // len(hist)
+        base = h - 6
+        hmax = base - y - 4
+        for i, c in enumerate(hist):
+            bh = int(hmax * c / top)
+            color = (90, 200, 120) if i < 8 else (230, 190, 70) if i < 12 else (230, 90, 80)
+            pygame.draw.rect(panel, color, (8 + i * bw, base - bh, bw - 2, bh))
+        return panel
@@ -0,0 +1,144 @@
+# game_logic/rules.py
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+
+Choice = Tuple[str, int]
+
+# subidas discretas por defecto, en fracciones del pote (además de la mínima)
+BET_SIZES: Tuple[float, ...] = (0.5, 1.0)
+
+# Reglas de apuesta de la mesa en un solo sitio. Sirven para cualquier
+# objeto con el estado de una mesa (Game, table.Table o sus snapshots):
+# - all-in sólo en el river;
+# - antes del river: subir como mucho call + min(pote, 4 BB) y nunca
+#   quedarse con menos de una ciega grande (tampoco igualando);
+# - subida mínima = última subida (al menos la ciega grande).
+# La ciega grande es la de la mesa (state.big_blind), que un torneo sube
+# por niveles.
+
+
+def allin_open(state) -> bool:
+    # el all-in sólo se abre con el board completo en el river
+    return (
+        state.round_index == 2
+        and state.state in ("BETTING", "BOT_PAUSE")
+        and len(state.board) == 5
+    )
+
+
+def min_raise_size(state) -> int:
+    if state.current_bet == 0:
+        return state.big_blind
+    return max(state.last_raise_size, state.big_blind)
+
+
+def raise_cap(state, seat: int) -> int:
+    """
+    Apuesta total máxima antes del river (current_bet si no puede subir).
+    """
+    p = state.players[seat]
+    to_call = max(0, state.current_bet - p.bet)
+    cap_by_rule = p.bet + to_call + min(state.pot, 4 * state.big_blind)
+    cap_by_floor = p.bet + max(0, p.stack - state.big_blind)
+    return max(state.current_bet, min(cap_by_rule, cap_by_floor))
+
+
+class LegalActions:
+    """
+    Acciones legales de un asiento en un estado concreto.
+
+    Los importes de subida son apuestas totales de la calle ("subir a"),
+    igual que apply_action(asiento, "raise_to", total).
+    """
+
+    __slots__ = (
+        "seat", "to_call", "call_amount", "can_check", "can_call",
+        "can_raise", "min_raise_to", "max_raise_to", "can_allin", "allin_to",
+        "_current_bet", "_call_to", "_pot",
+    )
+
+    def __init__(self, state, seat: int) -> None:
+        p = state.players[seat]
+        allin = allin_open(state)
+        to_call = max(0, state.current_bet - p.bet)
+
+        self.seat = seat
+        self.to_call = to_call
+        self.call_amount = min(to_call, p.stack)
+        self.can_check = to_call == 0
+        # antes del river no se puede igualar quedándose bajo la ciega grande
+        self.can_call = to_call > 0 and (
+            allin or p.stack - self.call_amount >= state.big_blind
+        )
+
+        self.max_raise_to = p.bet + p.stack if allin else raise_cap(state, seat)
+        self.can_raise = self.max_raise_to > state.current_bet
+        self.min_raise_to = min(
+            state.current_bet + min_raise_size(state), self.max_raise_to
+        )
+        self.can_allin = allin and p.stack > 0
+        self.allin_to = p.bet + p.stack
+        self._current_bet = state.current_bet
+        self._call_to = p.bet + to_call
+        self._pot = state.pot
+
+    def clamp_raise(self, target: int) -> int:
+        return max(self.min_raise_to, min(self.max_raise_to, target))
+
+    def raise_sizes(self, fractions: Sequence[float] = BET_SIZES) -> List[int]:
+        """
+        Subidas discretas: la mínima y una por fracción de pote, recortadas
+        al rango legal y sin repetir.
+        """
+        if not self.can_raise:
+            return []
+        out = [self.min_raise_to]
+        for f in fractions:
+            t = min(self._call_to + int(self._pot * f), self.max_raise_to)
+            if t > self._current_bet and t not in out:
+                out.append(t)
+        return out
+
+    def choices(self, fractions: Sequence[float] = BET_SIZES) -> List[Choice]:
+        """
+        Lista discreta para búsqueda/simulación, en el formato de
+        bot_decision: fold (sólo si hay que pagar), call/check, subidas
+        de raise_sizes y all-in en el river (amount = fichas que mete).
+        """
+        out: List[Choice] = []
+        if self.to_call > 0:
+            out.append(("fold", 0))
+        if self.can_check or self.can_call:
+            out.append(("call", self.to_call))
+        out.extend(("raise_to", t) for t in self.raise_sizes(fractions))
+        if self.can_allin and self.allin_to > self._call_to:
+            # un all-in que no cubre el call ya es el "call"
+            out.append(("allin", self.allin_to - self._call_to + self.to_call))
+        return out
+
+
+def legal_actions(state, seat: int) -> Optional[LegalActions]:
+    """
+    Qué puede hacer 'seat' ahora mismo; None si no le toca decidir
+    (retirado, all-in o sin acción pendiente en la calle).
+    """
+    p = state.players[seat]
+    if p.folded or p.all_in or not state.pending_mask >> seat & 1:
+        return None
+    return LegalActions(state, seat)
+
+
+class ActionEvent:
+    """
+    Acción ya aplicada por BettingMixin.apply_action; se entrega a los
+    suscriptores de 'action_listeners' (banner, log, red...).
+    """
+
+    __slots__ = ("seat", "kind", "bet", "pot")
+
+    def __init__(self, seat: int, kind: str, bet: int, pot: int) -> None:
+        self.seat = seat
+        self.kind = kind  # "fold" | "check" | "call" | "raise" | "allin"
+        self.bet = bet    # apuesta total del asiento en la calle
+        self.pot = pot
@@ -1,6 +1,92 @@
 from __future__ import annotations
 
-from eval_hand import evaluate7
+from typing import List, Sequence, Tuple
+
+from eval_hand import evaluate7_code
+
+Pot = Tuple[int, List[int], int]  # (importe, asientos ganadores, candidatos)
+
+
+def settle_pots(
+    invested: Sequence[int], codes: Sequence[int], dealer: int
+) -> Tuple[List[int], List[Pot]]:
+    """
+    Reparte el bote por capas (bote principal y laterales) a partir de lo
+    que cada asiento puso en toda la mano.
+
+    Cada capa va de un nivel de aportación de los que siguen en la mano
+    al siguiente; la pagan todos los que llegaron a ella (también los
+    retirados) y la pueden ganar sólo los no retirados que la cubren. Lo
+    que un retirado puso por encima del último nivel va a la capa de
+    arriba; una capa con un solo candidato es una apuesta no igualada y
+    vuelve a su dueño.
+
+    Empates: importe // ganadores a cada uno y las fichas sueltas, de
+    una en una, a los ganadores más cercanos a la izquierda del botón.
+
+    Args:
+        invested: fichas puestas por cada asiento en la mano.
+        codes: código de evaluate7_code por asiento; -1 si no opta
+            (retirado o sin cartas).
+        dealer: asiento del botón.
+
+    Returns:
+        (cobro de cada asiento, botes [(importe, ganadores, candidatos)]
+        del principal al último lateral).
+    """
+    n = len(invested)
+    order = sorted(range(n), key=invested.__getitem__)
+    levels: List[int] = []
+    for i in order:
+        if codes[i] >= 0 and invested[i] > 0 and (not levels or invested[i] != levels[-1]):
+            levels.append(invested[i])
+    if not levels:
+        return [0] * n, []
+
+    # importe de cada capa en una pasada por los asientos ordenados
+    amounts: List[int] = []
+    k, prev = 0, 0
+    for li, lv in enumerate(levels):
+        top = li == len(levels) - 1
+        amt = 0
+        while k < n and (top or invested[order[k]] <= lv):
+            amt += invested[order[k]] - prev
+            k += 1
+        amt += (n - k) * (lv - prev)
+        amounts.append(amt)
+        prev = lv
+
+    # ganadores de cada capa, de arriba abajo: los candidatos sólo crecen
+    winners_at: List[List[int]] = [[] for _ in levels]
+    eligible_at: List[int] = [0] * len(levels)
+    best, winners, eligible = -1, [], 0
+    k = n - 1
+    for li in range(len(levels) - 1, -1, -1):
+        while k >= 0 and invested[order[k]] >= levels[li]:
+            i = order[k]
+            c = codes[i]
+            if c >= 0:
+                eligible += 1
+            if c > best:
+                best, winners = c, [i]
+            elif c == best and c >= 0:
+                winners.append(i)
+            k -= 1
+        winners_at[li] = winners
+        eligible_at[li] = eligible
+        winners = list(winners)
+
+    payout = [0] * n
+    pots: List[Pot] = []
+    for amt, ws, m in zip(amounts, winners_at, eligible_at):
+        if len(ws) > 1:
+            ws = sorted(ws, key=lambda i: (i - dealer - 1) % n)
+        share, odd = divmod(amt, len(ws))
+        for j, i in enumerate(ws):
+            payout[i] += share + (1 if j < odd else 0)
+        pots.append((amt, ws, m))
+    return payout, pots
+
 
 class ShowdownMixin:
     # --- showdown ---
@@ -23,36 +109,37 @@ class ShowdownMixin:
 
             self.pot = 0
             self.state = "ENDHAND"
+            self.record_hand_end()
             self.make_continue_button("Siguiente mano")
             return
 
         # Showdown múltiple
         for p in contenders:
-            self.push_log(f"{p.name} muestra {p.hole[0]} {p.hole[1]}.")
-
-        scored = [(evaluate7(p.hole + self.board), p) for p in contenders]
-        scored.sort(key=lambda x: x[0], reverse=True)
-
-        best = scored[0][0]
-        winners = [pl for sc, pl in scored if sc == best]
-
-        total_bote = self.pot
-        split = total_bote // len(winners)
-        resto = total_bote - split * len(winners)
+            if p.hole:
+                self.push_log(f"{p.name} muestra {p.hole[0]} {p.hole[1]}.")
 
-        names = ", ".join(w.name for w in winners)
+        codes = [
+            evaluate7_code(p.hole + self.board) if not p.folded and p.hole else -1
+            for p in self.players
+        ]
+        payout, pots = settle_pots([p.invested for p in self.players], codes, self.dealer_index)
+        for p, won in zip(self.players, payout):
+            p.stack += won
+            p.total_won += won
 
-        for w in winners:
-            w.stack += split
-            w.total_won += split
-        if resto > 0:
-            winners[0].stack += resto
-            winners[0].total_won += resto
+        # una capa con un solo candidato no se disputa (p.ej. apuesta no igualada)
+        shown = [(amt, ws) for amt, ws, m in pots if m > 1] or [(amt, ws) for amt, ws, _ in pots]
+        for k, (amt, ws) in enumerate(shown if len(shown) > 1 else []):
+            label = "Bote principal" if k == 0 else f"Bote lateral {k}"
+            names = ", ".join(self.players[i].name for i in ws)
+            self.push_log(f"{label} (${amt}): {names}.")
 
-        if len(winners) == 1:
-            msg = f"Gana {names} y se lleva ${total_bote}.  [{diff_label}]"
+        main_amt, main_ws = shown[0]
+        names = ", ".join(self.players[i].name for i in main_ws)
+        if len(main_ws) == 1:
+            msg = f"Gana {names} y se lleva ${payout[main_ws[0]]}.  [{diff_label}]"
         else:
-            msg = f"Empate entre {names}. Bote ${total_bote} dividido.  [{diff_label}]"
+            msg = f"Empate entre {names}. Bote ${main_amt} dividido.  [{diff_label}]"
 
         self.push_log(msg)
         self.banner(msg)
@@ -60,4 +147,5 @@ class ShowdownMixin:
 
         self.pot = 0
         self.state = "ENDHAND"
+        self.record_hand_end()
         self.make_continue_button("Siguiente mano")
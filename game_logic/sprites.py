@@ -0,0 +1,102 @@
+# game_logic/sprites.py
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from config import TABLE_COLOR, CARD_W, CARD_H
+from cards import Card, SUITS, RANKS
+
+Size = Tuple[int, int]
+
+
+def _prepare(surf: pygame.Surface, alpha: bool = False) -> pygame.Surface:
+    # al formato de la pantalla si ya hay una (blits más rápidos)
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha() if alpha else surf.convert()
+
+
+class SpriteCache:
+    """
+    Superficies estáticas pre-renderizadas una sola vez:
+    - fondo degradado y mesa, por resolución;
+    - atlas de 53 cartas (52 caras + dorso), construido al primer uso.
+
+    Dibujar cualquiera de ellas es un único blit.
+    """
+
+    def __init__(self, font: pygame.font.Font) -> None:
+        self.font = font
+        self._bg: Dict[Size, pygame.Surface] = {}
+        self._table: Dict[Size, pygame.Surface] = {}
+        self.atlas: Optional[pygame.Surface] = None
+        self._cards: Dict[Optional[Tuple[str, str]], pygame.Surface] = {}
+
+    # --- fondo / mesa ---
+    def background(self, size: Size) -> pygame.Surface:
+        surf = self._bg.get(size)
+        if surf is None:
+            w, h = size
+            surf = pygame.Surface(size)
+            for i in range(0, h, 4):
+                t = i / h
+                c = (int(14 + 20 * t), int(18 + 24 * t), int(22 + 30 * t))
+                pygame.draw.rect(surf, c, (0, i, w, 4))
+            surf = self._bg[size] = _prepare(surf)
+        return surf
+
+    def table(self, size: Size) -> pygame.Surface:
+        surf = self._table.get(size)
+        if surf is None:
+            w, h = size
+            surf = self.background(size).copy()
+            pygame.draw.ellipse(surf, TABLE_COLOR, (160, 46, w - 320, h - 150))
+            pygame.draw.ellipse(surf, (10, 40, 28), (150, 36, w - 300, h - 130), 8)
+            surf = self._table[size] = _prepare(surf)
+        return surf
+
+    # --- cartas ---
+    def card(self, card: Optional[Card]) -> pygame.Surface:
+        """
+        Sprite de la carta (o del dorso si card es None).
+        """
+        if self.atlas is None:
+            self.build_atlas()
+        return self._cards[(card.rank, card.suit) if card else None]
+
+    def build_atlas(self) -> None:
+        # una fila por palo y una última con el dorso
+        atlas = pygame.Surface((len(RANKS) * CARD_W, (len(SUITS) + 1) * CARD_H), pygame.SRCALPHA)
+        for row, suit in enumerate(SUITS):
+            for col, rank in enumerate(RANKS):
+                self._draw_card(atlas, col * CARD_W, row * CARD_H, Card(rank, suit))
+        self._draw_card(atlas, 0, len(SUITS) * CARD_H, None)
+        self.atlas = _prepare(atlas, alpha=True)
+
+        for row, suit in enumerate(SUITS):
+            for col, rank in enumerate(RANKS):
+                self._cards[(rank, suit)] = self.atlas.subsurface(
+                    (col * CARD_W, row * CARD_H, CARD_W, CARD_H)
+                )
+        self._cards[None] = self.atlas.subsurface((0, len(SUITS) * CARD_H, CARD_W, CARD_H))
+
+    def _draw_card(self, surf: pygame.Surface, x: int, y: int, card: Optional[Card]) -> None:
+        rect = pygame.Rect(x, y, CARD_W, CARD_H)
+        pygame.draw.rect(
+            surf,
+            (240, 240, 240) if card else (32, 46, 58),
+            rect,
+            border_radius=10,
+        )
+        pygame.draw.rect(surf, (200, 200, 200), rect, 2, border_radius=10)
+        if card:
+            rtxt = self.font.render(card.rank, True, (20, 20, 20))
+            surf.blit(rtxt, (x + 8, y + 6))
+            stxt = self.font.render(
+                card.suit,
+                True,
+                (230, 80, 90) if card.suit in ("♥", "♦") else (230, 230, 230),
+            )
+            surf.blit(stxt, (x + CARD_W - 28, y + CARD_H - 34))
@@ -1,18 +1,103 @@
 # game/state.py
 from __future__ import annotations
 
+from typing import Callable, List, Optional, Set, Tuple
+
 from config import (
     STARTING_STACK,
     SMALL_BLIND,
     BIG_BLIND,
     ARCADE_REBUY,
     AUTO_REBUY_BOTS,
+    FPS,
 )
-from cards import Deck
+from cards import Deck, DeckPool, Card
 from player import Player
 
+from .action_log import ActionLog
+from .rules import ActionEvent
+from .state_delta import DeltaEncoder
+from .hand_record import HandRecorder
+
 
 class StateMixin:
+    def init_table_state(self, light: bool = False) -> None:
+        """
+        Estado de mesa compartido por Game y la mesa headless (table.Table).
+        Con light=True no crea el log de acciones ni el codificador de
+        estado (copias de simulación que no escriben nada, ver
+        table.Table.snapshot).
+        """
+        self.players: List[Player] = []
+        self.hero_index: int = 0
+        self.dealer_index: int = 0
+        self.hand_no: int = 0
+        # ciegas de la mesa (un torneo las sube por niveles) y recompras
+        self.small_blind: int = SMALL_BLIND
+        self.big_blind: int = BIG_BLIND
+        self.rebuys: bool = True  # False en torneo: quien se queda sin fichas queda eliminado
+
+        # ronda / board
+        self.round_index: int = 0
+        self.deck: Optional[Deck] = None
+        self.deck_pool: Optional[DeckPool] = None  # barajas pre-mezcladas (simuladores)
+        self.next_deck_order: Optional[List[int]] = None  # baraja fija para la próxima mano (replays)
+        self.board_all: List[Card] = []
+        self.board_visible_count: int = 0
+        self.board: List[Card] = []
+
+        # apuestas
+        self.pot: int = 0
+        self.current_bet: int = 0
+        self.current_player: int = 0
+        self.last_raiser: Optional[int] = None
+        self.last_raise_size: int = self.big_blind
+
+        # calle actual
+        self.first_to_act: int = 0
+        self.acted_set: Set[int] = set()
+        self.had_aggression: bool = False
+        # máscaras de asientos (bit i = asiento i) y sus cuentas; ver BettingMixin
+        self.active_mask: int = 0    # no retirados
+        self.allin_mask: int = 0     # all-in (subconjunto de active)
+        self.pending_mask: int = 0   # deben actuar en esta calle
+        self.active_count: int = 0
+        self.allin_count: int = 0
+        self.pending_count: int = 0
+        self.street_actions: List[Tuple[int, str, int]] = []  # (asiento, tipo, apuesta)
+        # suscriptores de apply_action (banner/log en Game; vacío en simulación)
+        self.action_listeners: List[Callable[[ActionEvent], None]] = []
+
+        # feedback visual / timers
+        self.bot_think_timer: float = 0.0
+        self.bot_pause_timer: float = 0.0
+        self.banner_text: str = ""
+        self.banner_timer: float = 0.0
+        self.frame_ms: float = 1000 / FPS  # duración del último frame (update(dt))
+        self.log: Optional[ActionLog] = None if light else ActionLog()
+        self.state_delta: Optional[DeltaEncoder] = None if light else DeltaEncoder()  # dump_state / espectadores
+        self.last_winner_text: str = ""
+        self._advancing: bool = False  # para proteger proceed_round
+
+        self.mcts_bot = None  # Game lo sustituye por un game_logic.mcts.MCTSBot
+        self.bot_pool = None  # mcts.BotPool: decisiones fuera del hilo de la UI
+        self.bot_future = None  # (turn_key, Future) de la decisión encargada a bot_pool
+        self.hand_recorder: Optional[HandRecorder] = None
+
+    def set_hand_recorder(self, recorder: Optional[HandRecorder]) -> None:
+        """
+        Graba las manos de esta mesa (ver game_logic.hand_record).
+        """
+        if self.hand_recorder is not None:
+            self.action_listeners.remove(self.hand_recorder.on_action)
+        self.hand_recorder = recorder
+        if recorder is not None:
+            self.action_listeners.append(recorder.on_action)
+
+    def record_hand_end(self) -> None:
+        if self.hand_recorder is not None:
+            self.hand_recorder.end(self)
+
     # --- setup jugadores / start hand ---
     def setup_players(self) -> None:
         self.players = [Player("Tú", is_human=True)]
@@ -24,31 +109,42 @@ class StateMixin:
         self.dealer_index = 0
 
     def start_hand(self) -> None:
-        if AUTO_REBUY_BOTS:
+        if self.rebuys and AUTO_REBUY_BOTS:
             for pl in self.players:
-                if not pl.is_human and pl.stack < BIG_BLIND:
+                if not pl.is_human and pl.stack < self.big_blind:
                     pl.stack = STARTING_STACK
                     pl.total_won = 0
 
         for p in self.players:
             p.new_hand_reset()
 
+        self.hand_no += 1
         self.round_index = 0
         self.pot = 0
         self.current_bet = 0
         self.last_raiser = None
-        self.last_raise_size = BIG_BLIND
-        self.deck = Deck()
+        self.last_raise_size = self.big_blind
+        # la misma baraja se reutiliza: sólo se vuelve a mezclar
+        if self.deck is None:
+            self.deck = Deck(shuffled=False)
+        if self.next_deck_order is not None:
+            self.deck.load(self.next_deck_order)
+            self.next_deck_order = None
+        elif self.deck_pool is not None:
+            self.deck_pool.deal_into(self.deck)
+        else:
+            self.deck.shuffle()
 
         # limpiar feedback
         self.bot_think_timer = 0.0
+        self.bot_future = None
         self.bot_pause_timer = 0.0
         self.banner_text = ""
         self.banner_timer = 0.0
-        self.pending_to_act = set()
+        self.reset_seat_masks()
         self.last_winner_text = ""
         self.keypad_visible = False
-        self.log = []
+        self.log.new_hand()
 
         # hole cards
         if self.deck:
@@ -62,6 +158,8 @@ class StateMixin:
         self.board_visible_count = 3
         self.board = self.board_all[:self.board_visible_count]
 
+        if self.hand_recorder is not None:
+            self.hand_recorder.begin(self)
         self.post_blinds()
 
         self.current_player = (self.dealer_index + 3) % len(self.players)
@@ -69,23 +167,29 @@ class StateMixin:
 
         self.state = "BETTING"
         self.make_action_buttons()
-        self.push_log("Nueva mano. Ciegas 10/20.")
+        self.push_log(f"Nueva mano. Ciegas {self.small_blind}/{self.big_blind}.")
         self.dump_state("start_hand")
 
     def post_blinds(self) -> None:
         n = len(self.players)
         sb_i = (self.dealer_index + 1) % n
         bb_i = (self.dealer_index + 2) % n
-        sb = min(SMALL_BLIND, self.players[sb_i].stack)
-        bb = min(BIG_BLIND, self.players[bb_i].stack)
+        sb = min(self.small_blind, self.players[sb_i].stack)
+        bb = min(self.big_blind, self.players[bb_i].stack)
         self.players[sb_i].stack -= sb
         self.players[sb_i].bet += sb
+        self.players[sb_i].invested += sb
         self.players[bb_i].stack -= bb
         self.players[bb_i].bet += bb
+        self.players[bb_i].invested += bb
         self.pot += sb + bb
+        # una ciega que se lleva todo el stack deja al asiento all-in
+        for i in (sb_i, bb_i):
+            if self.players[i].stack == 0 and self.players[i].invested > 0:
+                self.allin_seat(i)
         self.current_bet = bb
         self.last_raiser = bb_i
-        self.last_raise_size = BIG_BLIND
+        self.last_raise_size = self.big_blind
         self.push_log(f"{self.players[sb_i].name} pone ciega chica ({sb}).")
         self.push_log(f"{self.players[bb_i].name} pone ciega grande ({bb}).")
 
@@ -98,7 +202,7 @@ class StateMixin:
         elif self.state in ("ENDHAND", "SHOWDOWN"):
             self.dealer_index = (self.dealer_index + 1) % len(self.players)
 
-            if ARCADE_REBUY and self.players[self.hero_index].stack <= 0:
+            if self.rebuys and ARCADE_REBUY and self.players[self.hero_index].stack <= 0:
                 self.players[self.hero_index].stack = STARTING_STACK
                 self.players[self.hero_index].total_won = 0
                 self.push_log("Recompra automática para el jugador.")
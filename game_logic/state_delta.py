@@ -0,0 +1,151 @@
+# game_logic/state_delta.py
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List, Optional
+
+from config import KEYFRAME_EVERY
+
+State = Dict[str, Any]
+
+# campos públicos de cada asiento (las hole cards no viajan aquí)
+PLAYER_FIELDS = ("name", "stack", "bet", "folded", "all_in")
+
+
+def public_state(t) -> State:
+    """
+    Estado público de una mesa (Game o Table) como dict plano de JSON.
+    """
+    return {
+        "hand": t.hand_no,
+        "round": t.round_index,
+        "state": t.state,
+        "board": [repr(c) for c in t.board],
+        "pot": t.pot,
+        "current_bet": t.current_bet,
+        "to_act": t.current_player,
+        "dealer": t.dealer_index,
+        "players": [
+            {"name": p.name, "stack": p.stack, "bet": p.bet,
+             "folded": p.folded, "all_in": p.all_in}
+            for p in t.players
+        ],
+    }
+
+
+def diff_state(old: State, new: State) -> State:
+    """
+    Sólo lo que cambió de 'old' a 'new'. Los asientos van como
+    {"players": {"3": {"stack": 480, "bet": 20}}}; si cambia el número
+    de asientos, la lista entera.
+    """
+    d: State = {}
+    for k, v in new.items():
+        if k == "players":
+            continue
+        if old.get(k) != v:
+            d[k] = v
+
+    op, np_ = old.get("players", []), new["players"]
+    if len(op) != len(np_):
+        d["players"] = np_
+    else:
+        seats: Dict[str, State] = {}
+        for i, (a, b) in enumerate(zip(op, np_)):
+            ch = {f: b[f] for f in PLAYER_FIELDS if a[f] != b[f]}
+            if ch:
+                seats[str(i)] = ch
+        if seats:
+            d["players"] = seats
+    return d
+
+
+def apply_diff(state: State, d: State) -> None:
+    """
+    Aplica en sitio un diff de diff_state.
+    """
+    for k, v in d.items():
+        if k == "players" and isinstance(v, dict):
+            for i, ch in v.items():
+                state["players"][int(i)].update(ch)
+        else:
+            state[k] = v
+
+
+class DeltaEncoder:
+    """
+    Productor de versiones del estado público: cada llamada a update()
+    devuelve un mensaje con número de secuencia monótono y sólo los
+    campos que cambiaron desde la versión anterior, o None si no cambió
+    nada. Cada 'keyframe_every' versiones manda el estado completo para
+    que un cliente desincronizado se recupere sin pedirlo.
+
+    Mensajes:
+        {"seq": n, "key": true, "state": {...}}   keyframe
+        {"seq": n, "d": {...}}                    diff contra n - 1
+    """
+
+    def __init__(self, keyframe_every: int = KEYFRAME_EVERY) -> None:
+        self.keyframe_every = keyframe_every
+        self.seq: int = 0
+        self._last: Optional[State] = None
+
+    def update(self, t) -> Optional[State]:
+        cur = public_state(t)
+        if self._last is not None:
+            d = diff_state(self._last, cur)
+            if not d:
+                return None
+        self.seq += 1
+        key = self._last is None or self.seq % self.keyframe_every == 0
+        self._last = cur
+        if key:
+            return {"seq": self.seq, "key": True, "state": cur}
+        return {"seq": self.seq, "d": d}
+
+    def keyframe(self) -> Optional[State]:
+        """
+        La versión actual completa (para quien se suscribe a mitad).
+        """
+        if self._last is None:
+            return None
+        return {"seq": self.seq, "key": True, "state": self._last}
+
+
+class DeltaApplier:
+    """
+    Lado cliente: reconstruye el estado a partir de keyframes y diffs.
+    Si falta una versión (hueco en seq) ignora diffs hasta el próximo
+    keyframe.
+    """
+
+    def __init__(self) -> None:
+        self.state: Optional[State] = None
+        self.seq: int = 0
+        self.gaps: int = 0
+
+    @property
+    def synced(self) -> bool:
+        return self.state is not None
+
+    def apply(self, msg: State) -> bool:
+        """
+        True si el mensaje se aplicó.
+        """
+        if msg.get("key"):
+            self.state = copy.deepcopy(msg["state"])
+            self.seq = msg["seq"]
+            return True
+        if self.state is not None and msg["seq"] <= self.seq:
+            return False  # repetido o viejo
+        if self.state is None or msg["seq"] != self.seq + 1:
+            if self.state is not None:
+                self.gaps += 1
+                self.state = None  # esperar al próximo keyframe
+            return False
+        apply_diff(self.state, msg["d"])
+        self.seq = msg["seq"]
+        return True
+
+    def players(self) -> List[State]:
+        return self.state["players"] if self.state else []
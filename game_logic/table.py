@@ -0,0 +1,122 @@
+# game_logic/table.py
+from __future__ import annotations
+
+from typing import List, Optional
+
+from config import MED
+from player import Player
+
+from .logger import LoggerMixin
+from .keypad import KeypadMixin
+from .betting import BettingMixin
+from .showdown import ShowdownMixin
+from .state import StateMixin
+
+
+class Table(
+    LoggerMixin,
+    KeypadMixin,
+    BettingMixin,
+    ShowdownMixin,
+    StateMixin,
+):
+    """
+    Mesa sin ventana ni timers: mismas reglas que Game, pero todos los
+    asientos actúan en cuanto les toca (vía choose_bot_action).
+
+    Sirve para simulaciones (rollouts del bot MCTS, harness, etc.).
+    Con verbose=False no escribe nada en el log; con light=True ni
+    siquiera lo tiene (sólo para terminar la mano en curso, ver snapshot).
+    """
+
+    def __init__(
+        self,
+        players: Optional[List[Player]] = None,
+        verbose: bool = False,
+        light: bool = False,
+    ) -> None:
+        self.init_table_state(light=light and not verbose)
+        self.state: str = "IDLE"
+        self.bot_difficulty: str = MED
+        self.verbose: bool = verbose
+        self.buttons: list = []
+        self.keypad_visible: bool = False
+        if players is not None:
+            self.players = players
+        if verbose:
+            self.action_listeners.append(self.announce_action)
+
+    @classmethod
+    def snapshot(cls, src, light: bool = False) -> "Table":
+        """
+        Copia el estado de mesa de 'src' (Game o Table) en una Table nueva,
+        con asientos clonados: modificar la copia no toca el original.
+
+        light=True: sin log de acciones ni codificador de estado, para
+        copias que sólo juegan lo que queda de la mano (playouts MCTS).
+        """
+        t = cls([p.clone() for p in src.players], light=light)
+        t.state = src.state
+        t.bot_difficulty = src.bot_difficulty
+        t.hero_index = src.hero_index
+        t.dealer_index = src.dealer_index
+        t.hand_no = src.hand_no
+        t.small_blind, t.big_blind = src.small_blind, src.big_blind
+        t.rebuys = src.rebuys
+        t.round_index = src.round_index
+        t.board_all = list(src.board_all)
+        t.board_visible_count = src.board_visible_count
+        t.board = list(src.board)
+        t.pot = src.pot
+        t.current_bet = src.current_bet
+        t.current_player = src.current_player
+        t.last_raiser = src.last_raiser
+        t.last_raise_size = src.last_raise_size
+        t.first_to_act = src.first_to_act
+        t.acted_set = set(src.acted_set)
+        t.had_aggression = src.had_aggression
+        t.active_mask, t.active_count = src.active_mask, src.active_count
+        t.allin_mask, t.allin_count = src.allin_mask, src.allin_count
+        t.pending_mask, t.pending_count = src.pending_mask, src.pending_count
+        t.street_actions = list(src.street_actions)
+        return t
+
+    # --- sin UI ---
+    def make_action_buttons(self) -> None:
+        pass
+
+    def make_continue_button(self, label: str = "Continuar") -> None:
+        pass
+
+    def push_log(self, msg: str) -> None:
+        if self.verbose:
+            super().push_log(msg)
+
+    def dump_state(self, tag: str = "") -> None:
+        if self.verbose:
+            super().dump_state(tag)
+
+    # --- avance ---
+    def hand_over(self) -> bool:
+        return self.state in ("ENDHAND", "SHOWDOWN")
+
+    def step(self) -> None:
+        """
+        Avanza un paso: reanuda tras la pausa de calle o hace actuar al
+        asiento al que le toca.
+        """
+        if self.state == "ROUND_PAUSE":
+            self.continue_after_pause()
+            return
+        if self.state in ("BETTING", "BOT_PAUSE"):
+            self.state = "BETTING"
+            if self.settle_turn():
+                self.bot_act()
+
+    def play_hand(self) -> None:
+        """
+        Juega una mano completa desde start_hand() hasta el reparto.
+        """
+        self.start_hand()
+        while not self.hand_over():
+            self.step()
@@ -1,14 +1,26 @@
 from __future__ import annotations
 import random
+import argparse
 
+from config import HAND_RECORD_PATH
 from utils import setup_logging        # utils está al lado de main.py
 from game_logic import Game            # Game viene del paquete game_logic
+from game_logic.multitable import MultiTable
 
 
 def main() -> None:
+    ap = argparse.ArgumentParser(description="Texas Hold'em con pygame.")
+    ap.add_argument("--tables", type=int, default=1, help="mesas simultáneas (Tab/F2 para cambiar/mosaico)")
+    ap.add_argument("--record-hands", metavar="PATH", default=HAND_RECORD_PATH,
+                    help="graba las manos en PATH (con --tables, PATH_1, PATH_2, ...) para replay_export.py --hands")
+    a = ap.parse_args()
+
     setup_logging()
     random.seed()
-    Game().run()
+    if a.tables > 1:
+        MultiTable(a.tables, record_hands=a.record_hands).run()
+    else:
+        Game(record_hands=a.record_hands).run()
 
 
 if __name__ == "__main__":
@@ -20,6 +20,7 @@ class Player:
         self.name: str = name
         self.is_human: bool = is_human
         self.difficulty: Optional[str] = difficulty  # "Fácil","Media","Difícil" o None
+        self.params = None  # ai.BotParams propios; None = los de su dificultad
         self.reset_all()
 
     def reset_all(self) -> None:
@@ -38,3 +39,22 @@ class Player:
         self.folded: bool = False
         self.all_in: bool = False
         self.bet: int = 0
+        self.invested: int = 0  # fichas puestas en el bote en toda la mano (botes laterales)
+
+    def clone(self) -> "Player":
+        """
+        Copia independiente del asiento (para simulaciones).
+        """
+        c = Player.__new__(Player)
+        c.name = self.name
+        c.is_human = self.is_human
+        c.difficulty = self.difficulty
+        c.params = self.params
+        c.stack = self.stack
+        c.total_won = self.total_won
+        c.hole = list(self.hole)
+        c.folded = self.folded
+        c.all_in = self.all_in
+        c.bet = self.bet
+        c.invested = self.invested
+        return c
@@ -0,0 +1,263 @@
+from __future__ import annotations
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # sin ventana: antes de importar pygame
+
+import random
+import argparse
+import logging
+from multiprocessing import get_context
+from multiprocessing.util import Finalize
+from typing import Callable, List, Optional, Tuple
+
+import pygame
+
+from config import WIDTH, HEIGHT, MAX_BOTS, EASY, MED, HARD
+from game_logic import Game
+from game_logic.hand_record import HandRecord, REPLAY_KINDS, load_hands
+from player import Player
+from utils import setup_logging
+
+"""
+replay_export.py
+----------------
+Exporta manos completas a secuencias PNG sin ventana (SDL dummy) y sin
+esperar a los timers: un frame tras cada acción y cada cambio de calle.
+
+Dos fuentes de manos:
+- --hands: manos grabadas con main.py --record-hands (ver game_logic.hand_record).
+  Se repiten tal cual se jugaron: mismos stacks, botón, ciegas, orden de
+  la baraja y secuencia de acciones. --select elige cuáles (1 = la
+  primera del fichero).
+- --seeds: manos sintéticas. No reproducen nada jugado: cada semilla
+  genera una mano nueva que juegan los bots de la dificultad elegida en
+  todos los asientos (también "Tú") con stacks iniciales; la misma
+  semilla da siempre la misma mano.
+
+Uso:
+    python replay_export.py --hands hands.jsonl --select 1-50 --out replays
+    python replay_export.py --seeds 1-1000 --out replays
+    python replay_export.py --seeds 7 --scale 0.25 --final-only   # miniatura
+
+Los ficheros se llaman {semilla o nº de mano:06d}_{frame:03d}.png.
+"""
+
+_GAME: Optional[Game] = None
+
+
+def parse_seeds(spec: str) -> List[int]:
+    """
+    "1-100,250,300-310" -> [1..100, 250, 300..310]
+    """
+    out: List[int] = []
+    for part in spec.split(","):
+        a, _, b = part.partition("-")
+        out.extend(range(int(a), int(b or a) + 1))
+    return out
+
+
+def _save(game: Game, path: str, scale: float) -> None:
+    game.draw()
+    surf = game.screen
+    if scale != 1.0:
+        size = (max(1, int(WIDTH * scale)), max(1, int(HEIGHT * scale)))
+        surf = pygame.transform.smoothscale(surf, size)
+    pygame.image.save(surf, path)
+
+
+def _export_frames(
+    game: Game, name: int, out_dir: str, scale: float, final_only: bool,
+    act: Callable[[], bool],
+) -> int:
+    """
+    Avanza la mano ya empezada en 'game' hasta el final, con act() para
+    cada turno (False corta la mano), y guarda sus frames.
+
+    Returns:
+        número de PNG escritos.
+    """
+    frames = 0
+
+    def shot() -> None:
+        nonlocal frames
+        if not final_only:
+            _save(game, os.path.join(out_dir, f"{name:06d}_{frames:03d}.png"), scale)
+        frames += 1
+
+    shot()
+    while game.state not in ("ENDHAND", "SHOWDOWN"):
+        if game.state == "ROUND_PAUSE":
+            game.continue_after_pause()
+        else:
+            game.state = "BETTING"
+            if not game.settle_turn():
+                continue
+            if not act():
+                break
+        shot()
+
+    if final_only:
+        _save(game, os.path.join(out_dir, f"{name:06d}_{frames - 1:03d}.png"), scale)
+        return 1
+    return frames
+
+
+def render_hand(
+    game: Game, seed: int, out_dir: str, scale: float = 1.0, final_only: bool = False
+) -> int:
+    """
+    Genera la mano sintética 'seed' en 'game' (bots en todos los asientos)
+    y guarda sus frames.
+
+    Returns:
+        número de PNG escritos.
+    """
+    random.seed(seed)
+    game.setup_players()
+    for p in game.players:
+        p.is_human = False
+        p.difficulty = game.bot_difficulty
+    game.start_hand()
+    game.invalidate()
+
+    def act() -> bool:
+        game.bot_act()
+        return True
+
+    return _export_frames(game, seed, out_dir, scale, final_only, act)
+
+
+def replay_hand(
+    game: Game, num: int, rec: HandRecord, out_dir: str, scale: float = 1.0,
+    final_only: bool = False,
+) -> int:
+    """
+    Repite en 'game' una mano grabada por HandRecorder y guarda sus frames.
+    Si una acción grabada no encaja con la mesa (fichero de otra versión
+    de las reglas, mano a medias) se avisa y se corta ahí.
+
+    Returns:
+        número de PNG escritos.
+    """
+    game.players = []
+    for i, (name, stack) in enumerate(rec["players"]):
+        p = Player(name, is_human=i == rec["hero"])
+        p.stack = stack
+        game.players.append(p)
+    game.hero_index = rec["hero"]
+    game.dealer_index = rec["dealer"]
+    game.small_blind, game.big_blind = rec["blinds"]
+    game.rebuys = False  # los stacks grabados ya incluyen las recompras
+    game.hand_no = rec["hand"] - 1
+    game.next_deck_order = rec["deck"]
+    game.start_hand()
+    game.invalidate()
+
+    actions = iter(rec["actions"])
+
+    def act() -> bool:
+        step = next(actions, None)
+        if step is None:
+            logging.warning(f"[replay] mano {num}: faltan acciones, se corta")
+            return False
+        seat, kind, bet = step
+        if seat != game.current_player or game.apply_action(seat, REPLAY_KINDS[kind], bet) is None:
+            logging.warning(f"[replay] mano {num}: la acción {step} no encaja, se corta")
+            return False
+        game.advance_after_action()
+        return True
+
+    frames = _export_frames(game, num, out_dir, scale, final_only, act)
+    if "stacks" in rec and [p.stack for p in game.players] != rec["stacks"]:
+        logging.warning(f"[replay] mano {num}: los stacks finales no coinciden con la grabación")
+    return frames
+
+
+def _init_worker(num_bots: int, difficulty: str, reveal: bool) -> None:
+    global _GAME
+    _GAME = Game(surface=pygame.Surface((WIDTH, HEIGHT)))
+    _GAME.num_bots = num_bots
+    _GAME.bot_difficulty = difficulty
+    _GAME.reveal_cards = reveal
+    # el worker sale por os._exit (sin atexit): cerrar pygame con los
+    # finalizadores de multiprocessing, que sí corren al salir del worker
+    Finalize(None, pygame.quit, exitpriority=10)
+
+
+def _render_task(args: Tuple[int, Optional[HandRecord], str, float, bool]) -> int:
+    num, rec, out_dir, scale, final_only = args
+    if rec is None:
+        return render_hand(_GAME, num, out_dir, scale, final_only)
+    return replay_hand(_GAME, num, rec, out_dir, scale, final_only)
+
+
+def export(
+    tasks: List[Tuple[int, Optional[HandRecord]]],
+    out_dir: str,
+    num_bots: int = 4,
+    difficulty: str = MED,
+    scale: float = 1.0,
+    final_only: bool = False,
+    reveal: bool = True,
+    workers: int = 0,
+) -> int:
+    """
+    Exporta todas las manos en paralelo (un Game offscreen por proceso).
+
+    Args:
+        tasks: (nombre, mano grabada) o (semilla, None) para una mano
+            sintética.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    total = 0
+    jobs = [(num, rec, out_dir, scale, final_only) for num, rec in tasks]
+    # spawn: cada worker arranca sin heredar el estado de SDL del padre
+    pool = get_context("spawn").Pool(
+        workers or os.cpu_count() or 1,
+        initializer=_init_worker,
+        initargs=(num_bots, difficulty, reveal),
+    )
+    try:
+        for done, n in enumerate(pool.imap_unordered(_render_task, jobs, chunksize=4), 1):
+            total += n
+            if done % 100 == 0 or done == len(jobs):
+                logging.info(f"[replay] {done}/{len(jobs)} manos, {total} frames")
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    return total
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Exporta manos a secuencias PNG sin ventana.")
+    ap.add_argument("--hands", help="manos grabadas (main.py --record-hands)")
+    ap.add_argument("--select", help='manos de --hands, p.ej. "1-50" (por defecto todas)')
+    ap.add_argument("--seeds", default="1", help='manos sintéticas sin --hands: p.ej. "1-1000" o "3,8,20-30"')
+    ap.add_argument("--out", default="replays")
+    ap.add_argument("--bots", type=int, default=4, choices=range(1, MAX_BOTS + 1))
+    ap.add_argument("--difficulty", choices=[EASY, MED, HARD], default=MED)
+    ap.add_argument("--scale", type=float, default=1.0, help="p.ej. 0.25 para miniaturas")
+    ap.add_argument("--final-only", action="store_true", help="sólo el último frame")
+    ap.add_argument("--hide-cards", action="store_true", help="no destapar las cartas rivales")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    a = ap.parse_args()
+
+    setup_logging("replay_export.log")
+    tasks: List[Tuple[int, Optional[HandRecord]]]
+    if a.hands:
+        hands = load_hands(a.hands)
+        picked = parse_seeds(a.select) if a.select else range(1, len(hands) + 1)
+        tasks = [(k, hands[k - 1]) for k in picked if 1 <= k <= len(hands)]
+    else:
+        tasks = [(s, None) for s in parse_seeds(a.seeds)]
+    total = export(
+        tasks, a.out, a.bots, a.difficulty, a.scale,
+        a.final_only, not a.hide_cards, a.workers,
+    )
+    print(f"{len(tasks)} manos, {total} frames en {a.out}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+import os
+import argparse
+import logging
+from multiprocessing import Pool
+from typing import Tuple
+
+import numpy as np
+
+from combos import binom, colex_combos
+from eval_vec import evaluate_codes
+from utils import setup_logging
+
+"""
+strength_table.py
+-----------------
+Precalcula el percentil de cada código de mano (eval_hand.evaluate7_code)
+entre TODAS las manos de 5, 6 y 7 cartas (2.598.960 / 20.358.520 /
+133.784.560), enumerándolas con el evaluador vectorizado en paralelo.
+
+El resultado (STRENGTH_TABLE_PATH) guarda, por número de cartas, los
+códigos ordenados y su percentil como uint16 (0..65535). quick_strength()
+lo carga una vez y hace la consulta en O(1).
+
+Uso:
+    python strength_table.py
+"""
+
+STRENGTH_TABLE_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "strength_table.npz")
+
+
+def _count_top2(args: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    # manos de n cartas cuya segunda carta más alta es c2 (las C(c2, k)
+    # primeras combinaciones colex sólo usan cartas < c2)
+    n, c2 = args
+    k = n - 2
+    base = _COMBOS[k][:binom(c2, k)]
+    codes, counts = [], []
+    for c1 in range(c2 + 1, 52):
+        hands = np.empty((len(base), n), dtype=np.uint8)
+        hands[:, :k] = base
+        hands[:, k] = c2
+        hands[:, k + 1] = c1
+        u, c = np.unique(evaluate_codes(hands), return_counts=True)
+        codes.append(u)
+        counts.append(c)
+    return _merge(codes, counts)
+
+
+def _merge(codes, counts) -> Tuple[np.ndarray, np.ndarray]:
+    if not codes:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    allc = np.concatenate(codes)
+    u, inv = np.unique(allc, return_inverse=True)
+    return u, np.bincount(inv, weights=np.concatenate(counts)).astype(np.int64)
+
+
+_COMBOS = {}
+
+
+def _init_worker() -> None:
+    for k in (3, 4, 5):
+        _COMBOS[k] = colex_combos(50, k)
+
+
+def count_codes(n: int, pool: Pool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Enumera todas las manos de n cartas (5..7).
+
+    Returns:
+        (códigos únicos ordenados, cuántas manos tienen cada uno)
+    """
+    parts = pool.map(_count_top2, [(n, c2) for c2 in range(n - 2, 51)])
+    codes, counts = _merge([p[0] for p in parts], [p[1] for p in parts])
+    assert counts.sum() == binom(52, n)
+    return codes, counts
+
+
+def percentiles(counts: np.ndarray) -> np.ndarray:
+    """
+    Fracción de manos que cada código supera (+ medio empate), en uint16.
+    """
+    below = np.cumsum(counts) - counts
+    pct = (below + 0.5 * counts) / counts.sum()
+    return np.round(pct * 65535).astype(np.uint16)
+
+
+def build(path: str = STRENGTH_TABLE_PATH, workers: int = 0) -> None:
+    arrays = {}
+    with Pool(workers or os.cpu_count() or 1, initializer=_init_worker) as pool:
+        for n in (5, 6, 7):
+            codes, counts = count_codes(n, pool)
+            arrays[f"codes{n}"] = codes.astype(np.uint32)
+            arrays[f"pct{n}"] = percentiles(counts)
+            logging.info(f"[strength] {n} cartas: {counts.sum()} manos, {len(codes)} códigos")
+    np.savez_compressed(path, **arrays)
+    logging.info(f"[strength] tabla guardada en {path}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Tabla de percentiles de fuerza de mano.")
+    ap.add_argument("--out", default=STRENGTH_TABLE_PATH)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    a = ap.parse_args()
+
+    setup_logging("strength_table.log")
+    build(a.out, a.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+import json
+import time
+import random
+import asyncio
+import argparse
+from typing import Dict, List
+
+from config import SERVER_HOST, SERVER_PORT
+from game_logic.state_delta import DeltaApplier
+
+"""
+table_client.py
+---------------
+Clientes de prueba para table_server.py: se conectan, se sientan y
+juegan acciones legales al azar (de "your_turn" -> legal.choices) hasta
+ver N manos. Reconstruyen la mesa con DeltaApplier y comprueban los
+stacks contra cada hand_end. Con --slow una parte de los turnos no responde, para
+ejercitar los timeouts; con --illegal a veces mandan basura primero.
+
+Uso:
+    python table_server.py --humans 2 --timeout 2 &
+    python table_client.py --clients 40 --hands 20 --slow 0.02
+"""
+
+
+async def play(
+    name: str,
+    host: str,
+    port: int,
+    hands: int,
+    slow: float = 0.0,
+    illegal: float = 0.0,
+    think_s: float = 0.0,
+    seed: int = 0,
+) -> Dict[str, int]:
+    rng = random.Random(seed)
+    stats = {
+        "turns": 0, "timeouts": 0, "errors": 0, "events": 0, "hands": 0,
+        "bytes": 0, "gaps": 0, "mismatch": 0,
+    }
+    view = DeltaApplier()
+    reader, writer = await asyncio.open_connection(host, port)
+
+    def send(msg: dict) -> None:
+        writer.write((json.dumps(msg) + "\n").encode("utf-8"))
+
+    send({"type": "join", "name": name})
+    await writer.drain()
+
+    async for raw in reader:
+        stats["bytes"] += len(raw)
+        msg = json.loads(raw)
+        kind = msg["type"]
+        if kind == "delta":
+            view.apply(msg)
+        elif kind == "your_turn":
+            stats["turns"] += 1
+            if rng.random() < slow:
+                continue  # que venza el plazo
+            if rng.random() < illegal:
+                send({"type": "action", "kind": "volar"})
+            if think_s:
+                await asyncio.sleep(rng.random() * think_s)
+            act, amount = rng.choice(msg["legal"]["choices"])
+            send({"type": "action", "kind": act, "amount": amount})
+            await writer.drain()
+        elif kind == "event":
+            stats["events"] += 1
+        elif kind == "timeout":
+            stats["timeouts"] += 1
+        elif kind == "error":
+            stats["errors"] += 1
+        elif kind == "hand_end":
+            stats["hands"] += 1
+            if [p["stack"] for p in view.players()] != msg["stacks"]:
+                stats["mismatch"] += 1
+            if stats["hands"] >= hands:
+                send({"type": "leave"})
+                await writer.drain()
+                break
+
+    writer.close()
+    stats["gaps"] = view.gaps
+    return stats
+
+
+async def run_clients(a: argparse.Namespace) -> List[Dict[str, int]]:
+    tasks = [
+        play(f"Cliente {i + 1}", a.host, a.port, a.hands, a.slow, a.illegal, a.think, a.seed + i)
+        for i in range(a.clients)
+    ]
+    return await asyncio.gather(*tasks)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Clientes de prueba para table_server.py.")
+    ap.add_argument("--host", default=SERVER_HOST)
+    ap.add_argument("--port", type=int, default=SERVER_PORT)
+    ap.add_argument("--clients", type=int, default=4)
+    ap.add_argument("--hands", type=int, default=10, help="manos por cliente")
+    ap.add_argument("--slow", type=float, default=0.0, help="prob. de no responder un turno")
+    ap.add_argument("--illegal", type=float, default=0.0, help="prob. de mandar antes una acción ilegal")
+    ap.add_argument("--think", type=float, default=0.0, help="segundos máx. de 'pensar'")
+    ap.add_argument("--seed", type=int, default=1)
+    a = ap.parse_args()
+
+    t0 = time.perf_counter()
+    results = asyncio.run(run_clients(a))
+    dt = time.perf_counter() - t0
+    total = {k: sum(r[k] for r in results) for k in results[0]}
+    print(
+        f"{a.clients} clientes, {total['hands']} manos vistas en {dt:.1f}s  "
+        f"turnos={total['turns']} timeouts={total['timeouts']} "
+        f"errores={total['errors']} eventos={total['events']}\n"
+        f"recibido {total['bytes'] / 1024:.0f} KiB, huecos={total['gaps']} "
+        f"desincronizados={total['mismatch']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+from __future__ import annotations
+import json
+import asyncio
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from config import (
+    SERVER_HOST, SERVER_PORT, SERVER_SEATS, ACTION_TIMEOUT_S,
+    STARTING_STACK, EASY, MED, HARD,
+)
+from player import Player
+from game_logic.table import Table
+from game_logic.rules import ActionEvent, legal_actions
+from game_logic.state_delta import DeltaEncoder
+from utils import setup_logging
+
+"""
+table_server.py
+---------------
+Servidor asyncio de mesas sin UI (game_logic.table.Table) con protocolo
+JSON por líneas sobre TCP. Cada mesa es una tarea; los asientos sin
+cliente los juegan bots, cuyas decisiones corren en un ThreadPoolExecutor.
+
+Cliente -> servidor (una línea JSON por mensaje):
+    {"type": "join", "name": "Ana", "table": 3}     # table opcional
+    {"type": "action", "kind": "raise_to", "amount": 120}
+        kind: fold | call (también check) | raise_to | allin
+    {"type": "leave"}
+    {"type": "list"}
+
+Servidor -> cliente:
+    seated    {"table", "seat"}
+    delta     estado público versionado (game_logic.state_delta): keyframe
+              {"seq", "key": true, "state"} o diff {"seq", "d"}; aplicar
+              con DeltaApplier
+    hole      tus cartas {"cards"} al empezar cada mano
+    your_turn acciones legales ("legal") y plazo ("timeout_s")
+    event     acción aplicada {"seat", "kind", "bet", "pot"}
+    timeout   no actuaste a tiempo: se aplicó check o fold
+    hand_end  {"text", "stacks"}
+    error     {"msg"}
+
+Uso:
+    python table_server.py --port 7777 --seats 6 --humans 2
+    python table_client.py --clients 40 --hands 20     # clientes de prueba
+"""
+
+
+class Client:
+    """
+    Conexión de un jugador remoto.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.name: str = "Remoto"
+        self.table: Optional["ServerTable"] = None
+        self.seat: int = -1
+        self.actions: "asyncio.Queue[Optional[dict]]" = asyncio.Queue()
+        self.closed: bool = False
+
+    def send(self, msg: dict) -> None:
+        if self.closed:
+            return
+        line = json.dumps(msg, ensure_ascii=False, separators=(",", ":")) + "\n"
+        self.writer.write(line.encode("utf-8"))
+
+    async def drain(self) -> None:
+        if self.closed:
+            return
+        try:
+            await self.writer.drain()
+        except (ConnectionError, RuntimeError):
+            self.closed = True
+
+
+class ServerTable:
+    """
+    Una mesa del servidor: Table + asientos remotos + bucle de manos.
+    """
+
+    def __init__(
+        self,
+        tid: int,
+        seats: int,
+        difficulty: str,
+        executor: ThreadPoolExecutor,
+        timeout_s: float,
+        hand_pause_s: float,
+    ) -> None:
+        self.tid = tid
+        players = [Player(f"Bot {i + 1}", difficulty=difficulty) for i in range(seats)]
+        for p in players:
+            p.is_human = False
+        self.table = Table(players)
+        self.table.bot_difficulty = difficulty
+        self.table.action_listeners.append(self.on_action)
+        self.clients: Dict[int, Client] = {}
+        self.delta = DeltaEncoder()
+        self.executor = executor
+        self.timeout_s = timeout_s
+        self.hand_pause_s = hand_pause_s
+        self.task: Optional[asyncio.Task] = None
+
+    # --- asientos ---
+    def free_seat(self) -> Optional[int]:
+        for i in range(len(self.table.players)):
+            if i not in self.clients:
+                return i
+        return None
+
+    def sit(self, client: Client, seat: int) -> None:
+        """
+        El cliente reemplaza al bot del asiento, también a mitad de mano:
+        desde su próximo turno decide él.
+        """
+        p = self.table.players[seat]
+        p.name = client.name
+        p.is_human = True
+        self.broadcast_state()  # el cambio de nombre, a los que ya estaban
+        self.clients[seat] = client
+        client.table, client.seat = self, seat
+        # versión actual completa; luego le llegan sólo diffs
+        self.delta.update(self.table)
+        client.send({"type": "delta", "table": self.tid, **self.delta.keyframe()})
+        client.send({"type": "hole", "cards": [repr(c) for c in p.hole]})
+
+    def leave(self, client: Client) -> None:
+        if self.clients.get(client.seat) is not client:
+            return
+        del self.clients[client.seat]
+        p = self.table.players[client.seat]
+        p.name = f"Bot {client.seat + 1}"
+        p.is_human = False
+        client.actions.put_nowait(None)  # despierta un turno en espera
+        client.table, client.seat = None, -1
+
+    # --- mensajes ---
+    def on_action(self, ev: ActionEvent) -> None:
+        self.broadcast(
+            {"type": "event", "seat": ev.seat, "kind": ev.kind, "bet": ev.bet, "pot": ev.pot}
+        )
+
+    def broadcast(self, msg: dict) -> None:
+        for c in self.clients.values():
+            c.send(msg)
+
+    def broadcast_state(self) -> None:
+        msg = self.delta.update(self.table)
+        if msg is not None:
+            self.broadcast({"type": "delta", "table": self.tid, **msg})
+
+    def send_holes(self) -> None:
+        for seat, c in self.clients.items():
+            c.send({"type": "hole", "cards": [repr(x) for x in self.table.players[seat].hole]})
+
+    async def flush(self) -> None:
+        if self.clients:
+            await asyncio.gather(*(c.drain() for c in list(self.clients.values())))
+
+    # --- juego ---
+    async def run(self) -> None:
+        t = self.table
+        loop = asyncio.get_running_loop()
+        while self.clients:
+            for seat in self.clients:
+                # recompra de los remotos (los bots ya la tienen en start_hand)
+                if t.players[seat].stack < t.big_blind:
+                    t.players[seat].stack = STARTING_STACK
+            if t.hand_over():
+                t.continue_after_pause()
+            else:
+                t.start_hand()
+            self.broadcast_state()
+            self.send_holes()
+
+            while not t.hand_over():
+                if t.state == "ROUND_PAUSE":
+                    t.continue_after_pause()
+                    self.broadcast_state()
+                    continue
+                t.state = "BETTING"
+                if not t.settle_turn():
+                    continue
+                seat = t.current_player
+                client = self.clients.get(seat)
+                if client is None:
+                    act, amount = await loop.run_in_executor(
+                        self.executor, t.choose_bot_action, seat
+                    )
+                    t.apply_bot_action(act, amount)
+                else:
+                    await self.remote_turn(seat, client)
+                t.advance_after_action()
+                self.broadcast_state()
+                await self.flush()
+
+            self.broadcast({
+                "type": "hand_end",
+                "hand": t.hand_no,
+                "text": t.last_winner_text,
+                "stacks": [p.stack for p in t.players],
+            })
+            await self.flush()
+            await asyncio.sleep(self.hand_pause_s)
+        self.task = None
+
+    async def remote_turn(self, seat: int, client: Client) -> None:
+        """
+        Espera la acción del cliente hasta timeout_s; las ilegales se
+        rechazan con un error. Sin acción válida a tiempo: check o fold.
+        """
+        t = self.table
+        legal = legal_actions(t, seat)
+        while not client.actions.empty():
+            client.actions.get_nowait()  # acciones fuera de turno
+        client.send({
+            "type": "your_turn",
+            "table": self.tid,
+            "timeout_s": self.timeout_s,
+            "legal": {
+                "to_call": legal.to_call,
+                "can_check": legal.can_check,
+                "can_call": legal.can_call,
+                "can_raise": legal.can_raise,
+                "min_raise_to": legal.min_raise_to,
+                "max_raise_to": legal.max_raise_to,
+                "can_allin": legal.can_allin,
+                "choices": legal.choices(),
+            },
+        })
+        await client.drain()
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout_s
+        while True:
+            try:
+                msg = await asyncio.wait_for(
+                    client.actions.get(), max(0.0, deadline - loop.time())
+                )
+            except asyncio.TimeoutError:
+                msg = None
+            if msg is None:
+                kind = "call" if legal.can_check else "fold"
+                t.apply_action(seat, kind)
+                client.send({"type": "timeout", "applied": kind})
+                logging.info(f"[server] mesa {self.tid}: {client.name} sin acción a tiempo ({kind})")
+                return
+            try:
+                done = t.apply_action(seat, str(msg.get("kind")), int(msg.get("amount") or 0))
+            except (TypeError, ValueError):
+                done = None
+            if done is not None:
+                return
+            client.send({"type": "error", "msg": "acción ilegal", "got": msg})
+
+
+class TableServer:
+    """
+    Reparte clientes en mesas (creándolas según haga falta) y lee sus
+    mensajes.
+    """
+
+    def __init__(
+        self,
+        seats: int = SERVER_SEATS,
+        humans: int = SERVER_SEATS,
+        difficulty: str = MED,
+        timeout_s: float = ACTION_TIMEOUT_S,
+        hand_pause_s: float = 0.0,
+        workers: int = 4,
+    ) -> None:
+        self.seats = seats
+        self.humans = max(1, min(humans, seats))
+        self.difficulty = difficulty
+        self.timeout_s = timeout_s
+        self.hand_pause_s = hand_pause_s
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix="bots")
+        self.tables: List[ServerTable] = []
+
+    def new_table(self) -> ServerTable:
+        st = ServerTable(
+            len(self.tables), self.seats, self.difficulty,
+            self.executor, self.timeout_s, self.hand_pause_s,
+        )
+        self.tables.append(st)
+        return st
+
+    def join(self, client: Client, name: Optional[str], tid: Optional[int]) -> None:
+        if client.table is not None:
+            client.send({"type": "error", "msg": "ya estás sentado"})
+            return
+        client.name = str(name or f"Remoto {id(client) % 10000}")[:24]
+
+        if tid is not None:
+            # JSON admite cualquier cosa en "table"; bool es subclase de int
+            if not isinstance(tid, int) or isinstance(tid, bool):
+                client.send({"type": "error", "msg": f"mesa inválida: {tid!r}"})
+                return
+            if not (0 <= tid < len(self.tables)):
+                client.send({"type": "error", "msg": f"no existe la mesa {tid}"})
+                return
+            st = self.tables[tid]
+            if len(st.clients) >= self.humans:
+                client.send({"type": "error", "msg": f"mesa {tid} llena"})
+                return
+        else:
+            st = next((s for s in self.tables if len(s.clients) < self.humans), None)
+            if st is None:
+                st = self.new_table()
+
+        seat = st.free_seat()
+        st.sit(client, seat)
+        client.send({"type": "seated", "table": st.tid, "seat": seat})
+        logging.info(f"[server] {client.name} se sienta en mesa {st.tid}, asiento {seat}")
+        if st.task is None:
+            st.task = asyncio.create_task(st.run())
+
+    def leave(self, client: Client) -> None:
+        if client.table is not None:
+            logging.info(f"[server] {client.name} deja la mesa {client.table.tid}")
+            client.table.leave(client)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        client = Client(reader, writer)
+        try:
+            async for raw in reader:
+                try:
+                    msg = json.loads(raw)
+                    kind = msg.get("type")
+                except (ValueError, AttributeError):
+                    client.send({"type": "error", "msg": "JSON inválido"})
+                    continue
+                if kind == "join":
+                    self.join(client, msg.get("name"), msg.get("table"))
+                elif kind == "action":
+                    if client.table is None:
+                        client.send({"type": "error", "msg": "no estás sentado"})
+                    else:
+                        client.actions.put_nowait(msg)
+                elif kind == "leave":
+                    self.leave(client)
+                elif kind == "list":
+                    client.send({
+                        "type": "tables",
+                        "tables": [
+                            {"table": s.tid, "clients": len(s.clients), "hand": s.table.hand_no}
+                            for s in self.tables
+                        ],
+                    })
+                else:
+                    client.send({"type": "error", "msg": f"tipo desconocido: {kind}"})
+                await client.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.leave(client)
+            client.closed = True
+            writer.close()
+
+
+async def serve(host: str, port: int, server: TableServer) -> None:
+    srv = await asyncio.start_server(server.handle, host, port)
+    logging.info(f"[server] escuchando en {host}:{port}")
+    async with srv:
+        await srv.serve_forever()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Servidor de mesas (JSON por líneas sobre TCP).")
+    ap.add_argument("--host", default=SERVER_HOST)
+    ap.add_argument("--port", type=int, default=SERVER_PORT)
+    ap.add_argument("--seats", type=int, default=SERVER_SEATS, help="asientos por mesa")
+    ap.add_argument("--humans", type=int, default=SERVER_SEATS, help="clientes por mesa como máximo")
+    ap.add_argument("--difficulty", choices=[EASY, MED, HARD], default=MED)
+    ap.add_argument("--timeout", type=float, default=ACTION_TIMEOUT_S, help="segundos por acción")
+    ap.add_argument("--hand-pause", type=float, default=0.0, help="segundos entre manos")
+    ap.add_argument("--workers", type=int, default=4, help="hilos para los bots")
+    a = ap.parse_args()
+
+    setup_logging("table_server.log")
+    server = TableServer(a.seats, a.humans, a.difficulty, a.timeout, a.hand_pause, a.workers)
+    try:
+        asyncio.run(serve(a.host, a.port, server))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
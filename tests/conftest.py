@@ -0,0 +1,6 @@
+import os
+import sys
+
+# los módulos del juego se importan "planos" desde la raíz del repo
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from combos import (
+    N_FLOP, N_HOLE, N_RIVER, N_TURN, binom,
+    colex_rank, colex_unrank, colex_rank_batch, colex_unrank_batch,
+    hole_index, hole_from_index,
+    pair_index, pair_from_index, pair_index_batch, pair_from_index_batch,
+)
+
+
+def test_sizes():
+    assert [binom(52, k) for k in (2, 3, 4, 5)] == [N_HOLE, N_FLOP, N_TURN, N_RIVER]
+
+
+@pytest.mark.parametrize("k", [2, 3])
+def test_colex_is_a_bijection(k):
+    seen = set()
+    for i in range(binom(52, k)):
+        cards = colex_unrank(i, k)
+        assert list(cards) == sorted(set(cards)) and 0 <= cards[0] and cards[-1] < 52
+        assert colex_rank(cards) == i
+        assert colex_rank(cards[::-1]) == i  # el orden no importa
+        seen.add(cards)
+    assert len(seen) == binom(52, k)
+
+
+@pytest.mark.parametrize("k", [2, 3, 4, 5])
+def test_colex_batch_matches_scalar(k):
+    n = binom(52, k)
+    idx = np.arange(n) if n <= N_TURN else np.random.default_rng(k).integers(0, n, 50_000)
+    combos = colex_unrank_batch(idx, k)
+    assert (np.diff(combos, axis=1) > 0).all()
+    assert (colex_rank_batch(combos) == idx).all()
+    if n <= N_TURN:
+        # todas distintas: biyección sobre el rango completo
+        assert len(np.unique(combos, axis=0)) == n
+    for j in range(200):
+        assert tuple(combos[j].tolist()) == colex_unrank(int(idx[j]), k)
+
+
+def test_hole_index():
+    assert sorted(hole_index(*hole_from_index(i)) for i in range(N_HOLE)) == list(range(N_HOLE))
+    assert hole_index(7, 3) == hole_index(3, 7)
+
+
+@pytest.mark.parametrize("k", [3, 4, 5])
+def test_pair_index_round_trip(k):
+    n = N_HOLE * binom(50, k)
+    idx = np.random.default_rng(k).integers(0, n, 20_000)
+    holes, boards = pair_from_index_batch(idx, k)
+    cards = np.concatenate([holes, boards], axis=1)
+    # hole y board disjuntos, dentro de la baraja
+    assert (np.sort(cards, axis=1)[:, 1:] != np.sort(cards, axis=1)[:, :-1]).all()
+    assert cards.min() >= 0 and cards.max() < 52
+    assert (pair_index_batch(holes, boards) == idx).all()
+    for j in range(200):
+        hole, board = pair_from_index(int(idx[j]), k)
+        assert hole == tuple(holes[j].tolist()) and board == tuple(boards[j].tolist())
+        assert pair_index(hole, board) == idx[j]
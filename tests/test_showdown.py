@@ -0,0 +1,37 @@
+import random
+
+from game_logic.showdown import settle_pots
+
+
+def test_settle_pots_conserves_chips():
+    rng = random.Random(7)
+    for _ in range(2000):
+        n = rng.randint(2, 9)
+        invested = [rng.choice((0, 10, 20, 50, rng.randint(1, 300))) for _ in range(n)]
+        # -1 = retirado; pocos códigos distintos para que haya empates
+        codes = [rng.choice((-1, 1, 2, 3)) for _ in range(n)]
+        live = rng.randrange(n)
+        codes[live] = max(codes[live], 1)
+        invested[live] = max(invested[live], 1)
+
+        payout, pots = settle_pots(invested, codes, rng.randrange(n))
+
+        assert sum(payout) == sum(invested)
+        assert sum(amount for amount, _, _ in pots) == sum(invested)
+        assert all(payout[i] == 0 for i in range(n) if codes[i] < 0)
+
+
+def test_side_pot_only_to_those_who_cover_it():
+    # el asiento 0 (all-in corto) gana el principal; el lateral, el 2
+    payout, pots = settle_pots([50, 100, 100], [9, 1, 5], dealer=0)
+    assert payout == [150, 0, 100]
+    assert [amount for amount, _, _ in pots] == [150, 100]
+
+
+def test_odd_chip_goes_left_of_button():
+    # 15 entre dos ganadores empatados (0 y 2): la ficha suelta al primero
+    # a la izquierda del botón
+    payout, _ = settle_pots([5, 5, 5], [3, 1, 3], dealer=0)
+    assert payout == [7, 0, 8]
+    payout, _ = settle_pots([5, 5, 5], [3, 1, 3], dealer=2)
+    assert payout == [8, 0, 7]
@@ -0,0 +1,76 @@
+import json
+import random
+
+from config import MED
+from player import Player
+from game_logic.table import Table
+from game_logic.state_delta import DeltaApplier, DeltaEncoder, public_state
+
+
+def stream(keyframe_every, hands=5, seed=3):
+    """
+    Mensajes de DeltaEncoder tras cada acción de unas manos de bots, con
+    el estado público que debe reconstruir el cliente en cada uno.
+    """
+    random.seed(seed)
+    t = Table([Player(f"B{i}", difficulty=MED) for i in range(4)])
+    enc = DeltaEncoder(keyframe_every)
+    out = []
+
+    def emit(_ev=None):
+        msg = enc.update(t)
+        if msg is not None:
+            # por la red viajan como JSON
+            out.append((json.loads(json.dumps(msg)), public_state(t)))
+
+    t.action_listeners.append(emit)
+    for _ in range(hands):
+        t.play_hand()
+        emit()
+    return out
+
+
+def test_round_trip():
+    msgs = stream(keyframe_every=50)
+    assert msgs[0][0].get("key")
+    assert any("d" in m for m, _ in msgs)
+    assert [m["seq"] for m, _ in msgs] == list(range(1, len(msgs) + 1))
+
+    client = DeltaApplier()
+    for msg, state in msgs:
+        assert client.apply(msg)
+        assert client.state == state
+    assert client.gaps == 0
+
+
+def test_repeated_message_is_ignored():
+    msgs = stream(keyframe_every=50, hands=1)
+    client = DeltaApplier()
+    for msg, _ in msgs[:3]:
+        client.apply(msg)
+    assert not client.apply(msgs[1][0])
+    assert client.seq == 3 and client.state == msgs[2][1]
+
+
+def test_gap_waits_for_next_keyframe():
+    every = 7
+    msgs = stream(keyframe_every=every)
+    lost = 3
+    client = DeltaApplier()
+    for msg, _ in msgs[:lost]:
+        assert client.apply(msg)
+
+    resynced = False
+    for msg, state in msgs[lost + 1:]:
+        applied = client.apply(msg)
+        if not resynced:
+            # sin la versión perdida no se aplica ningún diff...
+            assert applied == bool(msg.get("key"))
+            resynced = applied
+            if not applied:
+                assert not client.synced
+                continue
+        # ...y desde el keyframe vuelve a seguir el estado
+        assert applied and client.state == state
+    assert resynced
+    assert client.gaps == 1
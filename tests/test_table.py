@@ -0,0 +1,29 @@
+from player import Player
+from game_logic.table import Table
+
+
+def make_table(stacks, dealer=0):
+    players = [Player(f"S{i}") for i in range(len(stacks))]
+    for p, s in zip(players, stacks):
+        p.stack = s
+    t = Table(players)
+    t.rebuys = False
+    t.dealer_index = dealer
+    return t
+
+
+def test_blind_that_takes_whole_stack_is_all_in():
+    t = make_table([1000, 10, 1000])
+    t.start_hand()
+    sb = t.players[1]
+    assert sb.stack == 0 and sb.all_in
+
+    assert t.apply_action(t.current_player, "raise_to", 60) == "raise"
+    t.advance_after_action()
+    assert not t.is_pending(1)
+    while not t.hand_over():
+        t.step()
+
+    # nunca actuó: no puede acabar retirado y opta al bote principal
+    assert not sb.folded
+    assert sum(p.stack for p in t.players) == 2010
@@ -0,0 +1,29 @@
+from config import EASY, MED, HARD, STARTING_STACK, HANDS_PER_LEVEL
+from tournament import Shard, blinds_for_level
+
+
+def test_shard_keeps_chips_without_rebuys():
+    shard = Shard(seed=5)
+    profiles = (EASY, MED, HARD)
+    shard.seat({
+        0: [(i, profiles[i % 3], STARTING_STACK) for i in range(9)],
+        1: [(i, profiles[i % 3], STARTING_STACK) for i in range(9, 15)],
+    })
+    total = 15 * STARTING_STACK
+    alive = set(range(15))
+
+    for level in range(30):
+        assert all(not t.rebuys for t in shard.tables.values())
+        busts, counts = shard.play(*blinds_for_level(level), HANDS_PER_LEVEL)
+        assert shard.chips() == total
+
+        # los eliminados salen de la mesa y nadie se queda sin fichas sentado
+        alive -= {pid for _, _, pid in busts}
+        seated = {int(p.name[1:]) for t in shard.tables.values() for p in t.players}
+        assert seated == alive
+        assert all(p.stack > 0 for t in shard.tables.values() for p in t.players)
+        assert all(0 <= t.dealer_index < len(t.players) for t in shard.tables.values())
+        assert counts == {tid: len(t.players) for tid, t in shard.tables.items()}
+        if all(c < 2 for c in counts.values()):
+            break
+    assert all(c == 1 for c in counts.values())
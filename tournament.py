@@ -0,0 +1,428 @@
+from __future__ import annotations
+import os
+import json
+import math
+import time
+import random
+import argparse
+import logging
+import multiprocessing as mp
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from config import (
+    STARTING_STACK, BLIND_LEVELS, HANDS_PER_LEVEL, TOURNAMENT_SEATS, EASY, MED, HARD,
+)
+from cards import DeckPool
+from player import Player
+from game_logic.table import Table
+from utils import setup_logging
+
+"""
+tournament.py
+-------------
+Simulador de torneos multi-mesa (freezeout) entre bots.
+
+Sobre la mesa headless (game_logic.table.Table), sin recompras: quien
+se queda sin fichas queda eliminado. Las ciegas suben cada
+HANDS_PER_LEVEL manos según BLIND_LEVELS.
+
+Las mesas se reparten en shards, uno por proceso worker. El
+coordinador (este proceso) hace jugar a todas las mesas --sync manos,
+recoge las eliminaciones y después rompe y equilibra mesas: el número
+de mesas baja a ceil(vivos / asientos) rompiendo las más cortas (y, en
+empate, las del shard más cargado) y luego mueve jugadores de la mesa
+más larga a la más corta hasta que difieran como mucho en uno. Los
+jugadores viajan entre shards como (id, perfil, stack).
+
+Puesto de cada eliminado: en una misma sincronización, quien cae en
+una mano anterior queda peor, y en la misma mano el que empezó con
+menos fichas (como en un torneo real).
+
+Se reporta, por perfil de bot, la distribución de puestos: victorias,
+mesa final, top 10%, percentil medio y deciles.
+
+Uso:
+    python tournament.py --players 10000 --runs 3
+    python tournament.py --players 500 --profiles Fácil,Difícil --out dist.json
+"""
+
+DIFFICULTIES = [EASY, MED, HARD]
+
+Entry = Tuple[int, str, int]  # (id, perfil, stack)
+
+
+def blinds_for_level(level: int) -> Tuple[int, int]:
+    """
+    (chica, grande) del nivel; después del último de BLIND_LEVELS se
+    doblan en cada nivel.
+    """
+    if level < len(BLIND_LEVELS):
+        return BLIND_LEVELS[level]
+    sb, bb = BLIND_LEVELS[-1]
+    k = 2 ** (level - len(BLIND_LEVELS) + 1)
+    return sb * k, bb * k
+
+
+def player_id(p: Player) -> int:
+    return int(p.name[1:])
+
+
+def to_player(e: Entry) -> Player:
+    pid, profile, stack = e
+    p = Player(f"J{pid}", difficulty=profile)
+    p.stack = stack
+    return p
+
+
+class Shard:
+    """
+    Mesas de un proceso worker. El coordinador le habla por una Pipe
+    con ("método", args) y recibe lo que devuelve el método.
+    """
+
+    def __init__(self, seed: int) -> None:
+        random.seed(seed)
+        self.pool = DeckPool(seed)  # barajas por bloques, compartidas por las mesas del shard
+        self.tables: Dict[int, Table] = {}
+
+    def seat(self, plan: Dict[int, List[Entry]]) -> None:
+        """
+        Sienta jugadores en mesas (crea las que no existan).
+        """
+        for tid, entries in plan.items():
+            t = self.tables.get(tid)
+            if t is None:
+                t = self.tables[tid] = Table()
+                t.rebuys = False
+                t.deck_pool = self.pool
+            t.players.extend(to_player(e) for e in entries)
+
+    def take(self, plan: Dict[int, int]) -> List[Entry]:
+        """
+        Levanta n jugadores de cada mesa del plan (los que iban a poner la
+        ciega grande, como en un torneo real). Las mesas vacías se cierran.
+        """
+        out: List[Entry] = []
+        for tid, n in plan.items():
+            t = self.tables[tid]
+            for _ in range(n):
+                i = (t.dealer_index + 2) % len(t.players)
+                p = t.players.pop(i)
+                out.append((player_id(p), p.difficulty, p.stack))
+                if i < t.dealer_index:
+                    t.dealer_index -= 1
+                if t.players:
+                    t.dealer_index %= len(t.players)
+            if not t.players:
+                del self.tables[tid]
+        return out
+
+    def play(
+        self, sb: int, bb: int, hands: int
+    ) -> Tuple[List[Tuple[int, int, int]], Dict[int, int]]:
+        """
+        Juega hasta 'hands' manos en cada mesa con dos o más jugadores.
+
+        Returns:
+            Eliminados como (mano, stack al empezar la mano, id) y número
+            de jugadores de cada mesa.
+        """
+        busts: List[Tuple[int, int, int]] = []
+        for t in self.tables.values():
+            t.small_blind, t.big_blind = sb, bb
+            for h in range(hands):
+                if len(t.players) < 2:
+                    break
+                start = [p.stack for p in t.players]
+                t.play_hand()
+                keep = [p.stack > 0 for p in t.players]
+                if all(keep):
+                    t.dealer_index = (t.dealer_index + 1) % len(t.players)
+                    continue
+                busts.extend(
+                    (h, s, player_id(p))
+                    for p, s, k in zip(t.players, start, keep) if not k
+                )
+                self.drop_busted(t, keep)
+        return busts, {tid: len(t.players) for tid, t in self.tables.items()}
+
+    @staticmethod
+    def drop_busted(t: Table, keep: List[bool]) -> None:
+        # el botón pasa al siguiente superviviente tras el dealer
+        n = len(t.players)
+        d = next(
+            (t.dealer_index + k) % n for k in range(1, n + 1) if keep[(t.dealer_index + k) % n]
+        )
+        t.dealer_index = sum(keep[:d])
+        t.players = [p for p, k in zip(t.players, keep) if k]
+
+    def chips(self) -> int:
+        return sum(p.stack for t in self.tables.values() for p in t.players)
+
+
+def shard_main(conn, seed: int) -> None:
+    shard = Shard(seed)
+    while True:
+        cmd, args = conn.recv()
+        if cmd == "stop":
+            break
+        conn.send(getattr(shard, cmd)(*args))
+    conn.close()
+
+
+class Tournament:
+    """
+    Coordinador: reparte mesas entre shards, sube las ciegas, asigna
+    puestos y rompe/equilibra mesas entre sincronizaciones.
+    """
+
+    def __init__(
+        self,
+        n_players: int,
+        profiles: List[str],
+        workers: int,
+        seats: int = TOURNAMENT_SEATS,
+        sync_hands: int = 1,
+        seed: int = 1,
+    ) -> None:
+        self.n_players = n_players
+        self.profile = {i: profiles[i % len(profiles)] for i in range(n_players)}
+        self.seats = seats
+        self.sync_hands = sync_hands
+        self.seed = seed
+        self.workers = max(1, workers)
+
+        self.alive: int = n_players
+        self.hands: int = 0  # manos jugadas por mesa
+        self.place: Dict[int, int] = {}
+        self.counts: Dict[int, int] = {}  # jugadores por mesa
+        self.shard_of: Dict[int, int] = {}
+        self.conns: list = []
+        self.procs: list = []
+
+    # --- shards ---
+    def start(self) -> None:
+        for w in range(self.workers):
+            a, b = mp.Pipe()
+            proc = mp.Process(target=shard_main, args=(b, self.seed * 1_000_003 + w), daemon=True)
+            proc.start()
+            self.conns.append(a)
+            self.procs.append(proc)
+
+        ids = list(range(self.n_players))
+        random.Random(self.seed).shuffle(ids)
+        n_tables = math.ceil(self.n_players / self.seats)
+        plans: List[Dict[int, List[Entry]]] = [{} for _ in range(self.workers)]
+        for tid in range(n_tables):
+            entries = [(i, self.profile[i], STARTING_STACK) for i in ids[tid::n_tables]]
+            self.shard_of[tid] = tid % self.workers
+            self.counts[tid] = len(entries)
+            plans[self.shard_of[tid]][tid] = entries
+        self.call_all("seat", [(p,) for p in plans])
+
+    def call_all(self, cmd: str, args: List[tuple]) -> list:
+        """
+        Manda un comando a cada shard (args[w] para el shard w) y espera
+        todas las respuestas; los shards trabajan en paralelo.
+        """
+        for conn, a in zip(self.conns, args):
+            conn.send((cmd, a))
+        return [conn.recv() for conn in self.conns]
+
+    def stop(self) -> None:
+        for conn in self.conns:
+            conn.send(("stop", ()))
+        for proc in self.procs:
+            proc.join()
+
+    # --- torneo ---
+    def run(self) -> Dict[int, int]:
+        """
+        Juega el torneo entero; devuelve {id: puesto}.
+        """
+        self.start()
+        try:
+            t0 = time.perf_counter()
+            last_level = -1
+            while self.alive > 1:
+                level = self.hands // HANDS_PER_LEVEL
+                sb, bb = blinds_for_level(level)
+                if level != last_level:
+                    last_level = level
+                    logging.info(
+                        f"[torneo] nivel {level + 1} ({sb}/{bb}): {self.alive} vivos, "
+                        f"{len(self.counts)} mesas, {time.perf_counter() - t0:.1f}s"
+                    )
+                results = self.call_all("play", [(sb, bb, self.sync_hands)] * self.workers)
+                busts = []
+                for b, counts in results:
+                    busts.extend(b)
+                    self.counts.update(counts)
+                self.eliminate(busts)
+                self.hands += self.sync_hands
+                if self.alive > 1:
+                    self.balance()
+
+            winner = [pid for pid in range(self.n_players) if pid not in self.place]
+            self.place[winner[0]] = 1
+            chips = sum(self.call_all("chips", [()] * self.workers))
+            if chips != self.n_players * STARTING_STACK:
+                logging.warning(f"[torneo] fichas finales {chips} != {self.n_players * STARTING_STACK}")
+            logging.info(
+                f"[torneo] gana J{winner[0]} ({self.profile[winner[0]]}) tras "
+                f"{self.hands} manos por mesa, {time.perf_counter() - t0:.1f}s"
+            )
+        finally:
+            self.stop()
+        return self.place
+
+    def eliminate(self, busts: List[Tuple[int, int, int]]) -> None:
+        # peor primero: mano anterior y, en la misma mano, menos fichas al empezarla
+        for _, _, pid in sorted(busts):
+            self.place[pid] = self.alive
+            self.alive -= 1
+
+    def plan_moves(self) -> Tuple[Dict[int, int], Dict[int, int], List[int]]:
+        """
+        Qué mesas romper y cuántos jugadores levantar y sentar en cada
+        mesa, calculado sólo con las cuentas.
+
+        Returns:
+            (levantar {mesa: n}, sentar {mesa: n}, mesas rotas)
+        """
+        counts = {tid: c for tid, c in self.counts.items() if c > 0}
+        take: Dict[int, int] = defaultdict(int)
+        give: Dict[int, int] = defaultdict(int)
+        broken: List[int] = []
+
+        per_shard: Dict[int, int] = defaultdict(int)
+        for tid in counts:
+            per_shard[self.shard_of[tid]] += 1
+
+        target = max(1, math.ceil(self.alive / self.seats))
+        loose = 0
+        while len(counts) > target:
+            # la más corta; en empate, la del shard con más mesas
+            tid = min(counts, key=lambda k: (counts[k], -per_shard[self.shard_of[k]], k))
+            n = counts.pop(tid)
+            per_shard[self.shard_of[tid]] -= 1
+            take[tid] += n
+            broken.append(tid)
+            loose += n
+        for _ in range(loose):
+            tid = min(counts, key=lambda k: (counts[k], k))
+            counts[tid] += 1
+            give[tid] += 1
+
+        while True:
+            hi = max(counts, key=lambda k: (counts[k], -k))
+            lo = min(counts, key=lambda k: (counts[k], k))
+            if counts[hi] - counts[lo] <= 1:
+                break
+            counts[hi] -= 1
+            counts[lo] += 1
+            if give[hi]:
+                give[hi] -= 1
+            else:
+                take[hi] += 1
+            give[lo] += 1
+
+        self.counts = counts
+        return (
+            {k: v for k, v in take.items() if v},
+            {k: v for k, v in give.items() if v},
+            broken,
+        )
+
+    def balance(self) -> None:
+        take, give, broken = self.plan_moves()
+        if not take:
+            return
+
+        take_args: List[Dict[int, int]] = [{} for _ in range(self.workers)]
+        for tid, n in take.items():
+            take_args[self.shard_of[tid]][tid] = n
+        pool: List[Entry] = []
+        for entries in self.call_all("take", [(a,) for a in take_args]):
+            pool.extend(entries)
+        for tid in broken:
+            del self.shard_of[tid]
+
+        seat_args: List[Dict[int, List[Entry]]] = [{} for _ in range(self.workers)]
+        k = 0
+        for tid, n in sorted(give.items()):
+            seat_args[self.shard_of[tid]][tid] = pool[k:k + n]
+            k += n
+        self.call_all("seat", [(a,) for a in seat_args])
+
+
+def distribution(
+    places: List[Dict[int, int]], profile: Dict[int, str], n_players: int, seats: int
+) -> Dict[str, Dict[str, object]]:
+    """
+    Distribución de puestos por perfil sobre varios torneos.
+    """
+    by_profile: Dict[str, List[int]] = defaultdict(list)
+    for place in places:
+        for pid, pos in place.items():
+            by_profile[profile[pid]].append(pos)
+
+    out = {}
+    for name, pos in sorted(by_profile.items()):
+        n = len(pos)
+        deciles = [0] * 10
+        for x in pos:
+            deciles[min(9, (x - 1) * 10 // n_players)] += 1
+        out[name] = {
+            "entries": n,
+            "wins": sum(1 for x in pos if x == 1),
+            "final_table": sum(1 for x in pos if x <= seats) / n,
+            "top10": sum(1 for x in pos if x <= max(1, n_players // 10)) / n,
+            "mean_pct": sum((x - 1) / max(1, n_players - 1) for x in pos) / n,
+            "deciles": [d / n for d in deciles],
+        }
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Simulador de torneos multi-mesa entre bots.")
+    ap.add_argument("--players", type=int, default=10_000)
+    ap.add_argument("--profiles", default=",".join(DIFFICULTIES), help="perfiles separados por comas")
+    ap.add_argument("--runs", type=int, default=1, help="torneos a simular")
+    ap.add_argument("--seats", type=int, default=TOURNAMENT_SEATS)
+    ap.add_argument("--sync", type=int, default=1, help="manos entre equilibrados")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--out", help="JSON con la distribución")
+    a = ap.parse_args()
+
+    profiles = a.profiles.split(",")
+    for p in profiles:
+        if p not in DIFFICULTIES:
+            ap.error(f"perfil desconocido: {p}")
+
+    setup_logging("tournament.log")
+    places = []
+    t0 = time.perf_counter()
+    for r in range(a.runs):
+        t = Tournament(a.players, profiles, a.workers, a.seats, a.sync, a.seed + r)
+        places.append(t.run())
+    dt = time.perf_counter() - t0
+
+    dist = distribution(places, t.profile, a.players, a.seats)
+    print(f"{a.runs} torneo(s) de {a.players} jugadores en {dt:.1f}s")
+    print(f"{'perfil':<10} {'entradas':>9} {'victorias':>9} {'mesa final':>10} {'top 10%':>8} {'percentil':>9}  deciles")
+    for name, d in dist.items():
+        dec = " ".join(f"{x * 100:4.1f}" for x in d["deciles"])
+        print(
+            f"{name:<10} {d['entries']:>9} {d['wins']:>9} {d['final_table'] * 100:>9.2f}% "
+            f"{d['top10'] * 100:>7.1f}% {d['mean_pct'] * 100:>8.1f}%  {dec}"
+        )
+    if a.out:
+        with open(a.out, "w", encoding="utf-8") as f:
+            json.dump(dist, f, ensure_ascii=False, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+import os
+import json
+import math
+import random
+import argparse
+import itertools
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from config import STARTING_STACK, BIG_BLIND, EASY, MED, HARD
+from player import Player
+from ai import BotParams, BOT_PARAMS
+from game_logic.table import Table
+from utils import setup_logging
+
+"""
+tuning.py
+---------
+Harness paralelo para ajustar los parámetros de ai.bot_decision().
+
+Cada configuración (un BotParams) juega contra bots fijos de referencia
+en una mesa headless (game_logic.table.Table). Para reducir varianza:
+
+- todas las configuraciones juegan las mismas manos (misma semilla);
+- cada reparto se juega "duplicado": la configuración pasa por todos
+  los asientos con las mismas cartas y se promedia.
+
+Se reporta bb/100 con intervalo de confianza del 95% y se descarta una
+configuración en cuanto su IC queda entero por debajo del de la mejor.
+
+Uso:
+    python tuning.py                        # compara Fácil / Media / Difícil
+    python tuning.py --grid grid.json       # rejilla de parámetros
+
+grid.json es un objeto con "base" (dificultad de partida) y listas de
+valores por parámetro; se prueba el producto cartesiano:
+    {"base": "Media", "fold_t_base": [0.90, 0.94], "raise_factor": [1.0, 1.4]}
+"""
+
+DIFFICULTIES = [EASY, MED, HARD]
+
+
+def load_grid(path: str) -> Dict[str, BotParams]:
+    """
+    Expande grid.json a {nombre: BotParams}.
+    """
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    base = BOT_PARAMS[spec.pop("base", MED)]
+    names = [k for k in BotParams._fields if k in spec]
+    values = [spec[k] if isinstance(spec[k], list) else [spec[k]] for k in names]
+    out: Dict[str, BotParams] = {}
+    for combo in itertools.product(*values):
+        params = base._replace(**dict(zip(names, combo)))
+        label = ",".join(f"{k}={v}" for k, v in zip(names, combo)) or "base"
+        out[label] = params
+    return out
+
+
+def play_deals(
+    params: BotParams, baseline: BotParams, opponents: int, seed: int, first: int, count: int
+) -> List[float]:
+    """
+    Juega los repartos [first, first + count) en duplicado.
+
+    Returns:
+        Resultado medio en big blinds por mano de cada reparto.
+    """
+    seats = opponents + 1
+    out = []
+    for d in range(first, first + count):
+        total = 0
+        for rot in range(seats):
+            random.seed(seed * 1_000_003 + d)
+            players = []
+            for i in range(seats):
+                p = Player(f"S{i}", difficulty=MED)
+                p.params = params if i == rot else baseline
+                players.append(p)
+            t = Table(players)
+            t.play_hand()
+            total += players[rot].stack - STARTING_STACK
+        out.append(total / seats / BIG_BLIND)
+    return out
+
+
+def _play_task(args: Tuple[BotParams, BotParams, int, int, int, int]) -> List[float]:
+    return play_deals(*args)
+
+
+def summary(results: List[float]) -> Tuple[float, float, float]:
+    """
+    (bb/100, límite inferior, límite superior) del IC 95% normal; NaN
+    si no hay resultados.
+    """
+    n = len(results)
+    if n == 0:
+        return math.nan, math.nan, math.nan
+    mean = sum(results) / n
+    var = sum((x - mean) ** 2 for x in results) / max(1, n - 1)
+    half = 1.96 * math.sqrt(var / n)
+    return 100 * mean, 100 * (mean - half), 100 * (mean + half)
+
+
+def run(
+    configs: Dict[str, BotParams],
+    baseline: BotParams,
+    opponents: int,
+    block: int,
+    max_deals: int,
+    min_deals: int,
+    workers: int,
+    seed: int,
+) -> Dict[str, Dict[str, object]]:
+    """
+    Juega bloques de repartos para cada configuración viva hasta
+    max_deals, descartando las que ya son claramente peores. Siempre se
+    juegan al menos min_deals, aunque quede (o haya) una sola.
+    """
+    results: Dict[str, List[float]] = {name: [] for name in configs}
+    alive = set(configs)
+
+    with ProcessPoolExecutor(workers) as pool:
+        first = 0
+        while first < max_deals and (len(alive) > 1 or first < min_deals):
+            count = min(block, max_deals - first)
+            futs = {
+                name: pool.submit(
+                    _play_task, (configs[name], baseline, opponents, seed, first, count)
+                )
+                for name in sorted(alive)
+            }
+            for name, fut in futs.items():
+                results[name].extend(fut.result())
+            first += count
+
+            stats = {name: summary(results[name]) for name in alive}
+            if first >= min_deals:
+                best_lo = max(lo for _, lo, _ in stats.values())
+                for name, (_, _, hi) in stats.items():
+                    if hi < best_lo:
+                        alive.discard(name)
+                        logging.info(f"[tuning] descartada {name} tras {first} repartos")
+            logging.info(f"[tuning] {first}/{max_deals} repartos, {len(alive)} vivas")
+
+    report = {}
+    for name, res in results.items():
+        bb100, lo, hi = summary(res)
+        report[name] = {
+            "deals": len(res),
+            "hands": len(res) * (opponents + 1),
+            "bb100": bb100,
+            "ci95": (lo, hi),
+            "alive": name in alive,
+        }
+    return report
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Ajuste de parámetros de bot_decision.")
+    ap.add_argument("--grid", help="JSON con la rejilla de parámetros")
+    ap.add_argument("--baseline", choices=DIFFICULTIES, default=MED)
+    ap.add_argument("--opponents", type=int, default=3)
+    ap.add_argument("--block", type=int, default=200, help="repartos por bloque")
+    ap.add_argument("--max-deals", type=int, default=5000)
+    ap.add_argument("--min-deals", type=int, default=600, help="antes de descartar")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--seed", type=int, default=1)
+    a = ap.parse_args()
+
+    setup_logging("tuning.log")
+    configs = load_grid(a.grid) if a.grid else {d: BOT_PARAMS[d] for d in DIFFICULTIES}
+
+    report = run(
+        configs, BOT_PARAMS[a.baseline], a.opponents, a.block,
+        a.max_deals, a.min_deals, a.workers, a.seed,
+    )
+    print(f"{'configuración':<48} {'manos':>7} {'bb/100':>9} {'IC 95%':>20}")
+    for name, r in sorted(report.items(), key=lambda kv: -kv[1]["bb100"]):
+        lo, hi = r["ci95"]
+        flag = "" if r["alive"] else "  (descartada)"
+        print(f"{name:<48} {r['hands']:>7} {r['bb100']:>9.1f} [{lo:>8.1f}, {hi:>8.1f}]{flag}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,76 @@
 from __future__ import annotations
 import pygame
-from typing import Callable
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
 
 """
 ui.py
 -----
-Elementos UI reutilizables, como el botón clickeable.
+Elementos UI reutilizables, como el botón clickeable, y la caché de
+textos renderizados.
 """
 
 
+class TextCache:
+    """
+    Caché LRU acotada de superficies de texto, por
+    (fuente, texto, color, antialias).
+
+    Las superficies devueltas son compartidas: sólo se deben blitear.
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self.maxsize = maxsize
+        self._items: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: Tuple[int, int, int],
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surf = self._items.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._items.move_to_end(key)
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._items[key] = surf
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+        return surf
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+TEXT_CACHE = TextCache()
+
+
+def render_text(
+    font: pygame.font.Font,
+    text: str,
+    antialias: bool,
+    color: Tuple[int, int, int],
+) -> pygame.Surface:
+    """
+    Igual que font.render(text, antialias, color) pero pasando por TEXT_CACHE.
+    """
+    return TEXT_CACHE.render(font, text, color, antialias)
+
+
 class Button:
     """
     Botón rectangular clickeable.
@@ -26,13 +88,23 @@ class Button:
         self.on_click = on_click
         self.small = small
 
-    def draw(self, surf: pygame.Surface, font: pygame.font.Font, midfont: pygame.font.Font) -> None:
-        hover = self.rect.collidepoint(*pygame.mouse.get_pos())
+    def draw(
+        self,
+        surf: pygame.Surface,
+        font: pygame.font.Font,
+        midfont: pygame.font.Font,
+        mouse: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        """
+        'mouse': posición del ratón en coordenadas de 'surf' (por defecto
+        la de la ventana).
+        """
+        hover = self.rect.collidepoint(*(mouse or pygame.mouse.get_pos()))
         base = (56, 86, 110) if hover else (40, 66, 88)
         pygame.draw.rect(surf, base, self.rect, border_radius=12)
         pygame.draw.rect(surf, (12, 12, 12), self.rect, 2, border_radius=12)
         f = midfont if not self.small else font
-        txt = f.render(self.label, True, (240, 240, 240))
+        txt = render_text(f, self.label, True, (240, 240, 240))
         surf.blit(txt, txt.get_rect(center=self.rect.center))
 
     def handle(self, event: pygame.event.Event) -> None: